@@ -147,10 +147,16 @@ async fn run(cli: Cli) -> Result<()> {
     tracing::info!("using embedding dim = {dim}");
 
     // Read source counts up front so verification has a target number.
+    // The three tables are independent, so count them concurrently.
+    let (archival_counts, message_counts, note_counts) = tokio::try_join!(
+        count_rows(&cli.lancedb_dir, ARCHIVAL_TABLE),
+        count_rows(&cli.lancedb_dir, MESSAGES_TABLE),
+        count_rows(&cli.lancedb_dir, NOTES_TABLE),
+    )?;
     let source_counts = ExpectedCounts {
-        archival: count_rows(&cli.lancedb_dir, ARCHIVAL_TABLE).await?,
-        messages: count_rows(&cli.lancedb_dir, MESSAGES_TABLE).await?,
-        notes: count_rows(&cli.lancedb_dir, NOTES_TABLE).await?,
+        archival: archival_counts,
+        messages: message_counts,
+        notes: note_counts,
     };
     log_source_counts(&source_counts);
 
@@ -163,9 +169,13 @@ async fn run(cli: Cli) -> Result<()> {
     }
     tracing::info!("writing destination to {}", work_path.display());
 
-    let archival_rows = read_archival(&cli.lancedb_dir).await?;
-    let message_rows = read_messages(&cli.lancedb_dir).await?;
-    let note_rows = read_notes(&cli.lancedb_dir).await?;
+    // Full-table scans dominate the read phase; overlapping them makes it
+    // cost roughly the slowest table instead of the sum of all three.
+    let (archival_rows, message_rows, note_rows) = tokio::try_join!(
+        read_archival(&cli.lancedb_dir),
+        read_messages(&cli.lancedb_dir),
+        read_notes(&cli.lancedb_dir),
+    )?;
 
     enforce_note_path_uniqueness(&note_rows)?;
 
@@ -1,7 +1,7 @@
 //! Read rows from the legacy LanceDB tables (`archival_memory`,
 //! `message_history`, `notes`) into plain owned Rust structs the writer
 //! can consume. Each table is read in a single pass; bootstrap `_init_`
-//! rows are filtered out here so callers never see them.
+//! rows are excluded by the scan predicate so callers never see them.
 
 use std::path::Path;
 use std::sync::Arc;
@@ -107,9 +107,6 @@ pub async fn read_archival(lancedb_dir: &Path) -> Result<Vec<ArchivalRow>> {
         let vectors = vector_column(&batch)?;
         for row in 0..batch.num_rows() {
             let id = ids.value(row);
-            if id == INIT_ID {
-                continue;
-            }
             out.push(ArchivalRow {
                 id: id.to_string(),
                 text: texts.value(row).to_string(),
@@ -137,9 +134,6 @@ pub async fn read_messages(lancedb_dir: &Path) -> Result<Vec<MessageRow>> {
         let vectors = vector_column(&batch)?;
         for row in 0..batch.num_rows() {
             let id = ids.value(row);
-            if id == INIT_ID {
-                continue;
-            }
             out.push(MessageRow {
                 id: id.to_string(),
                 role: roles.value(row).to_string(),
@@ -169,9 +163,6 @@ pub async fn read_notes(lancedb_dir: &Path) -> Result<Vec<NoteRow>> {
         let vectors = vector_column(&batch)?;
         for row in 0..batch.num_rows() {
             let id = ids.value(row);
-            if id == INIT_ID {
-                continue;
-            }
             let updated_at = {
                 let raw = updated.value(row);
                 if raw.is_empty() {
@@ -210,8 +201,11 @@ async fn read_table(lancedb_dir: &Path, table: &str) -> Result<Option<Vec<Record
         .await
         .with_context(|| format!("opening table {table}"))?;
     let count = table_ref.count_rows(None).await? as usize;
+    // The sentinel rows are dropped by the scanner itself, so the per-row
+    // readers below carry no filter branch.
     let stream = table_ref
         .query()
+        .only_if(format!("id != '{INIT_ID}'"))
         .limit(count.max(1))
         .execute()
         .await
@@ -256,30 +250,23 @@ fn extract_vector(list: &FixedSizeListArray, row: usize) -> Result<Vec<f32>> {
     Ok((0..floats.len()).map(|i| floats.value(i)).collect())
 }
 
-/// Inspect the first non-init row of any table that has data and return
-/// the observed embedding dim. Returns `None` if every table is empty.
+/// Inspect the first row of any table that has data and return the
+/// observed embedding dim. Returns `None` if every table is empty.
 pub async fn detect_embedding_dim(lancedb_dir: &Path) -> Result<Option<usize>> {
     for table in [ARCHIVAL_TABLE, MESSAGES_TABLE, NOTES_TABLE] {
         let Some(batches) = read_table(lancedb_dir, table).await? else {
             continue;
         };
-        for batch in &batches {
-            let ids = string_column(batch, "id")?;
-            let vectors = vector_column(batch)?;
-            for row in 0..batch.num_rows() {
-                if ids.value(row) == INIT_ID {
-                    continue;
-                }
-                let cell = vectors.value(row);
-                let floats = cell
-                    .as_any()
-                    .downcast_ref::<Float32Array>()
-                    .ok_or_else(|| anyhow!("vector cell is not Float32Array"))?;
-                if floats.is_empty() {
-                    bail!("empty vector cell in table {table}");
-                }
-                return Ok(Some(floats.len()));
+        if let Some(batch) = batches.iter().find(|batch| batch.num_rows() > 0) {
+            let cell = vector_column(batch)?.value(0);
+            let floats = cell
+                .as_any()
+                .downcast_ref::<Float32Array>()
+                .ok_or_else(|| anyhow!("vector cell is not Float32Array"))?;
+            if floats.is_empty() {
+                bail!("empty vector cell in table {table}");
             }
+            return Ok(Some(floats.len()));
         }
     }
     Ok(None)
@@ -335,7 +335,7 @@ pub struct ActorSpawnRequest<'a> {
     pub name: &'a str,
     pub goals: &'a str,
     pub group: Option<&'a str>,
-    pub tools: &'a str,
+    pub tools: &'a [String],
     pub model: &'a str,
     pub max_turns: usize,
 }
@@ -376,6 +376,9 @@ impl ActorInfo {
 pub struct ActorRunSpec {
     pub actor_id: String,
     pub name: String,
+    /// Header plus tool directory; identical across this actor's turns.
+    pub stable_prompt: String,
+    /// Goals, inbox and the other blocks rebuilt every turn.
     pub system_prompt: String,
     pub turn_number: usize,
     pub max_turns: usize,
@@ -401,6 +404,11 @@ pub struct Actor {
     turn_count: usize,
     task_state_note: String,
     task_state_updated_at: Option<DateTime<Utc>>,
+    /// Latest progress note from the turn in flight (last tool step and the
+    /// model's latest text). Lets a parent see what a long-running child is
+    /// doing before it finishes; not persisted, cleared at each turn start.
+    #[serde(default, skip)]
+    progress: String,
 }
 
 impl Actor {
@@ -421,6 +429,7 @@ impl Actor {
             turn_count: 0,
             task_state_note: String::new(),
             task_state_updated_at: None,
+            progress: String::new(),
         }
     }
 
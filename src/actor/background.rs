@@ -12,6 +12,7 @@ use crate::actor::{
     ActorConfig, ActorError, ActorNamedEvent, ActorRegistry, ActorRuntime, ActorSupervisor,
     MessageIntent, ModelTier,
 };
+use crate::llm::response_format::first_json_object;
 use crate::scheduler::curator::CuratorRunStats;
 
 pub const DMN_ACTOR_NAME: &str = "dmn";
@@ -222,11 +223,13 @@ async fn review_one(
             recent_context.to_string()
         },
     );
+    // The per-candidate signal goes last: every candidate in a batch then
+    // shares the instructions + recent context as a prompt-cache prefix.
     let prompt = prompts
         .render(
             "notification_review",
             &variables,
-            "Review the SIGNAL. Reply JSON only: {\"send\":bool,\"text\":string}.\n\nSIGNAL:\n{signal}\n\nRECENT CONTEXT:\n{context}",
+            "Review the SIGNAL. Reply JSON only: {\"send\":bool,\"text\":string}.\n\nRECENT CONTEXT:\n{context}\n\nSIGNAL:\n{signal}",
         )
         .text;
     let messages = vec![crate::llm::client::LlmMessage::user(prompt)];
@@ -241,13 +244,8 @@ async fn review_one(
 
 fn parse_review(raw: &str) -> ReviewOutcome {
     let trimmed = raw.trim();
-    let json_str = match (trimmed.find('{'), trimmed.rfind('}')) {
-        (Some(start), Some(end)) if end >= start => &trimmed[start..=end],
-        _ => return ReviewOutcome::Drop(format!("non-JSON review response: {trimmed}")),
-    };
-    let value: Value = match serde_json::from_str(json_str) {
-        Ok(value) => value,
-        Err(error) => return ReviewOutcome::Drop(format!("review JSON parse error: {error}")),
+    let Some(value) = first_json_object(trimmed) else {
+        return ReviewOutcome::Drop(format!("non-JSON review response: {trimmed}"));
     };
     let send = value.get("send").and_then(Value::as_bool).unwrap_or(false);
     if !send {
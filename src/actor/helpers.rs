@@ -2,8 +2,12 @@ use uuid::Uuid;
 
 use super::{Actor, ActorInfo, ActorState, MessageIntent, ModelTier, TaskState};
 
+/// First eight hex digits of a v4 UUID. Encoded into a stack buffer so
+/// each id costs a single small allocation; actor and message ids are minted
+/// on every spawn and every send.
 pub(super) fn short_id() -> String {
-    Uuid::new_v4().to_string()[..8].to_string()
+    let mut buffer = Uuid::encode_buffer();
+    Uuid::new_v4().simple().encode_lower(&mut buffer)[..8].to_string()
 }
 
 pub(super) fn parse_task_state(value: &str) -> Option<TaskState> {
@@ -79,10 +83,10 @@ pub(super) fn parse_model_tier(value: &str) -> Option<ModelTier> {
     }
 }
 
-pub(super) fn split_tool_list(value: &str) -> Vec<String> {
-    value
-        .split(',')
-        .map(str::trim)
+pub(super) fn clean_tool_list(tools: &[String]) -> Vec<String> {
+    tools
+        .iter()
+        .map(|tool| tool.trim())
         .filter(|tool| !tool.is_empty())
         .map(str::to_string)
         .collect()
@@ -103,19 +107,34 @@ pub(super) fn normalize_actor_name(value: &str) -> String {
     out.trim_matches('-').to_string()
 }
 
-pub(super) fn relationship_label(actor: &Actor, info: &ActorInfo) -> &'static str {
-    if info.spawned_by == actor.id {
+/// Case- and whitespace-insensitive form of a goal statement, used to spot a
+/// spawn that would repeat work an active actor is already doing.
+pub(super) fn normalize_goals(value: &str) -> String {
+    value
+        .split_whitespace()
+        .collect::<Vec<_>>()
+        .join(" ")
+        .to_lowercase()
+}
+
+/// How `info` relates to the actor `actor_id`, spawned by `spawned_by`.
+pub(super) fn relationship_label(
+    actor_id: &str,
+    spawned_by: &str,
+    info: &ActorInfo,
+) -> &'static str {
+    if info.spawned_by == actor_id {
         " [child]"
-    } else if info.id == actor.spawned_by {
+    } else if info.id == spawned_by {
         " [parent]"
-    } else if !actor.spawned_by.is_empty() && info.spawned_by == actor.spawned_by {
+    } else if !spawned_by.is_empty() && info.spawned_by == spawned_by {
         " [sibling]"
     } else {
         ""
     }
 }
 
-pub(super) fn format_active_children(children: &[Actor]) -> String {
+pub(super) fn format_active_children(children: &[&Actor]) -> String {
     if children.is_empty() {
         return String::new();
     }
@@ -20,6 +20,21 @@ use rusqlite::{Connection, params};
 use super::helpers::{intent_model_name, parse_model_tier, parse_task_state};
 use super::{Actor, ActorConfig, ActorError, ActorResult, ActorState, TaskState};
 
+const UPSERT_ACTOR_SQL: &str = "INSERT OR REPLACE INTO actors (
+        id, name, group_name, goals, spawned_by, is_principal, state,
+        task_state, task_state_note, turn_count, max_turns, max_messages,
+        model, tools, persistent, outcome, result, last_response,
+        created_at, terminated_at, updated_at
+     ) VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13, ?14, ?15, ?16, ?17, ?18, ?19, ?20, ?21)";
+
+/// Every actor worth rehydrating: `'terminated'` is
+/// `actor_state_str(ActorState::Terminated)`.
+const LOAD_UNFINISHED_SQL: &str = "SELECT id, name, group_name, goals, spawned_by, task_state,
+        task_state_note, turn_count, max_turns, max_messages,
+        model, tools, persistent, last_response, created_at
+     FROM actors
+     WHERE state != 'terminated' AND is_principal = 0";
+
 #[derive(Clone, Debug)]
 pub struct ActorStore {
     db_path: PathBuf,
@@ -51,42 +66,49 @@ impl ActorStore {
     /// failures must be handled (logged) by the caller — persistence is
     /// best-effort and never blocks agent work.
     pub fn persist(&self, actor: &Actor) -> ActorResult<()> {
-        let conn = self.conn()?;
-        let tools_json =
-            serde_json::to_string(&actor.config.tools).unwrap_or_else(|_| "[]".to_string());
-        conn.execute(
-            "INSERT OR REPLACE INTO actors (
-                id, name, group_name, goals, spawned_by, is_principal, state,
-                task_state, task_state_note, turn_count, max_turns, max_messages,
-                model, tools, persistent, outcome, result, last_response,
-                created_at, terminated_at, updated_at
-             ) VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13, ?14, ?15, ?16, ?17, ?18, ?19, ?20, ?21)",
-            params![
-                actor.id,
-                actor.config.name,
-                actor.config.group,
-                actor.config.goals,
-                actor.spawned_by,
-                actor.is_principal as i64,
-                actor_state_str(actor.state),
-                task_state_str(actor.task_state),
-                actor.task_state_note,
-                actor.turn_count as i64,
-                actor.config.max_turns as i64,
-                actor.config.max_messages as i64,
-                actor.config.model.map(intent_model_name),
-                tools_json,
-                actor.config.persistent as i64,
-                actor.outcome.map(|outcome| outcome.as_str()),
-                actor.result(),
-                last_self_response_text(actor),
-                actor.created_at.to_rfc3339(),
-                actor.terminated_at.map(|at| at.to_rfc3339()),
-                Utc::now().to_rfc3339(),
-            ],
-        )
-        .map_err(sql_error)?;
-        Ok(())
+        self.persist_many([actor])
+    }
+
+    /// Upsert several snapshots in one transaction, so a burst of writes
+    /// (restoring every unfinished actor at startup) commits once instead of
+    /// once per actor.
+    pub fn persist_many<'a>(&self, actors: impl IntoIterator<Item = &'a Actor>) -> ActorResult<()> {
+        let mut conn = self.conn()?;
+        let tx = conn.transaction().map_err(sql_error)?;
+        {
+            let mut statement = tx.prepare_cached(UPSERT_ACTOR_SQL).map_err(sql_error)?;
+            let updated_at = Utc::now().to_rfc3339();
+            for actor in actors {
+                let tools_json =
+                    serde_json::to_string(&actor.config.tools).unwrap_or_else(|_| "[]".to_string());
+                statement
+                    .execute(params![
+                        actor.id,
+                        actor.config.name,
+                        actor.config.group,
+                        actor.config.goals,
+                        actor.spawned_by,
+                        actor.is_principal as i64,
+                        actor_state_str(actor.state),
+                        task_state_str(actor.task_state),
+                        actor.task_state_note,
+                        actor.turn_count as i64,
+                        actor.config.max_turns as i64,
+                        actor.config.max_messages as i64,
+                        actor.config.model.map(intent_model_name),
+                        tools_json,
+                        actor.config.persistent as i64,
+                        actor.outcome.map(|outcome| outcome.as_str()),
+                        actor.result(),
+                        last_self_response_text(actor),
+                        actor.created_at.to_rfc3339(),
+                        actor.terminated_at.map(|at| at.to_rfc3339()),
+                        updated_at,
+                    ])
+                    .map_err(sql_error)?;
+            }
+        }
+        tx.commit().map_err(sql_error)
     }
 
     /// Load every non-terminated, non-principal actor as a rehydrated
@@ -96,15 +118,7 @@ impl ActorStore {
     /// re-parenting on top.
     pub fn load_unfinished(&self) -> ActorResult<Vec<RestoredActor>> {
         let conn = self.conn()?;
-        let mut statement = conn
-            .prepare(
-                "SELECT id, name, group_name, goals, spawned_by, task_state,
-                        task_state_note, turn_count, max_turns, max_messages,
-                        model, tools, persistent, last_response, created_at
-                 FROM actors
-                 WHERE state != 'terminated' AND is_principal = 0",
-            )
-            .map_err(sql_error)?;
+        let mut statement = conn.prepare(LOAD_UNFINISHED_SQL).map_err(sql_error)?;
         let rows = statement
             .query_map([], |row| {
                 let model: Option<String> = row.get("model")?;
@@ -137,6 +151,7 @@ impl ActorStore {
                     turn_count: row.get::<_, i64>("turn_count")?.max(0) as usize,
                     task_state_note: row.get("task_state_note")?,
                     task_state_updated_at: None,
+                    progress: String::new(),
                 };
                 Ok(RestoredActor {
                     actor,
@@ -185,7 +200,9 @@ impl ActorStore {
     }
 
     fn conn(&self) -> ActorResult<Connection> {
-        Connection::open(&self.db_path).map_err(sql_error)
+        let conn = Connection::open(&self.db_path).map_err(sql_error)?;
+        crate::sqlite_ext::configure(&conn).map_err(sql_error)?;
+        Ok(conn)
     }
 }
 
@@ -219,13 +236,13 @@ fn task_state_str(state: TaskState) -> &'static str {
 
 /// The actor's last end-of-turn self-message — the checkpoint worth carrying
 /// across a restart.
-fn last_self_response_text(actor: &Actor) -> Option<String> {
+fn last_self_response_text(actor: &Actor) -> Option<&str> {
     actor
         .messages
         .iter()
         .rev()
         .find(|message| message.sender == actor.id && message.recipient == actor.id)
-        .map(|message| message.content.clone())
+        .map(|message| message.content.as_str())
 }
 
 #[cfg(test)]
@@ -286,4 +303,39 @@ mod tests {
             .persist(registry.get(&worker).unwrap())
             .expect("re-persist is an upsert, not a duplicate insert");
     }
+
+    #[test]
+    fn persist_many_writes_every_actor_in_one_batch() {
+        let tmp = tempdir().unwrap();
+        let store = ActorStore::open(tmp.path().join("actors.db")).unwrap();
+
+        let mut registry = ActorRegistry::new();
+        let principal = registry.spawn(
+            ActorConfig::new("cortex", "Serve the user").in_group("main"),
+            None,
+            true,
+        );
+        let workers = ["alpha", "beta", "gamma"].map(|name| {
+            registry.spawn(
+                ActorConfig::new(name, "Parallel job").in_group("main"),
+                Some(&principal),
+                false,
+            )
+        });
+
+        store
+            .persist_many(workers.iter().map(|id| registry.get(id).unwrap()))
+            .unwrap();
+
+        let mut restored = store
+            .load_unfinished()
+            .unwrap()
+            .into_iter()
+            .map(|entry| entry.actor.id)
+            .collect::<Vec<_>>();
+        restored.sort();
+        let mut expected = workers.to_vec();
+        expected.sort();
+        assert_eq!(restored, expected);
+    }
 }
@@ -1,13 +1,24 @@
 use std::cmp::Reverse;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::sync::Arc;
 
 use chrono::{Duration as ChronoDuration, Utc};
 use serde_json::{Value, json};
 
 use super::helpers::*;
 use super::*;
+use crate::llm::PromptBuilder;
 use crate::tools::registry::{ToolContextShape, requestable_tools_directory_for_shape};
 
+fn unindex(index: &mut HashMap<String, Vec<String>>, key: &str, actor_id: &str) {
+    if let Some(ids) = index.get_mut(key) {
+        ids.retain(|id| id != actor_id);
+        if ids.is_empty() {
+            index.remove(key);
+        }
+    }
+}
+
 fn requestable_directory_for_actor(actor: &Actor) -> String {
     requestable_tools_directory_for_shape(ToolContextShape {
         has_actor: true,
@@ -16,9 +27,36 @@ fn requestable_directory_for_actor(actor: &Actor) -> String {
     })
 }
 
+/// One `discover_actors` row with everything that does not depend on who is
+/// asking already formatted; the caller's `(you)` marker and relationship
+/// label are spliced in between `head` and `tail` at render time.
+#[derive(Debug)]
+struct DiscoverRow {
+    info: ActorInfo,
+    head: String,
+    tail: String,
+}
+
 #[derive(Debug)]
 pub struct ActorRegistry {
     pub(super) actors: HashMap<String, Actor>,
+    /// Ids of every actor not yet terminated. Terminated actors linger in
+    /// `actors` until `cleanup_terminated`, so lookups that only care about
+    /// live work walk this index instead of the whole map.
+    active: HashSet<String>,
+    /// Actor ids by `config.name` and by `spawned_by`, in spawn order. Both
+    /// fields are fixed once an actor is in the registry, so these are only
+    /// touched by `insert_actor` / `remove_actor`.
+    by_name: HashMap<String, Vec<String>>,
+    children: HashMap<String, Vec<String>>,
+    /// Bumped on every mutable access to an actor (see `actor_mut`) and on
+    /// insert/remove. Lets `status_snapshot` reuse its last listing while
+    /// nothing has changed, which is the common case between status polls.
+    status_version: u64,
+    status_cache: Option<(u64, Arc<Vec<ActorInfo>>)>,
+    /// Formatted `discover_actors` rows per `(group, include_terminated)`,
+    /// tagged with the `status_version` they were built at.
+    discover_cache: HashMap<(String, bool), (u64, Arc<[DiscoverRow]>)>,
     principal_id: Option<String>,
     pub events: ActorEventBus,
     /// Optional SQLite write-through. When set, every actor mutation is
@@ -36,6 +74,12 @@ impl ActorRegistry {
     pub fn new() -> Self {
         Self {
             actors: HashMap::new(),
+            active: HashSet::new(),
+            by_name: HashMap::new(),
+            children: HashMap::new(),
+            status_version: 0,
+            status_cache: None,
+            discover_cache: HashMap::new(),
             principal_id: None,
             events: ActorEventBus::new(1000),
             store: None,
@@ -61,6 +105,20 @@ impl ActorRegistry {
         }
     }
 
+    /// Write-through for several actors at once, committed as one batch.
+    fn persist_actors(&self, actor_ids: &[String]) {
+        let Some(store) = &self.store else {
+            return;
+        };
+        if actor_ids.is_empty() {
+            return;
+        }
+        let actors = actor_ids.iter().filter_map(|id| self.actors.get(id));
+        if let Err(error) = store.persist_many(actors) {
+            tracing::warn!(count = actor_ids.len(), error = %error, "actor persistence failed");
+        }
+    }
+
     pub fn spawn(
         &mut self,
         config: ActorConfig,
@@ -76,18 +134,46 @@ impl ActorRegistry {
         }
         self.emit_event(
             "actor_spawned",
-            &actor,
+            &actor.id,
+            &actor.config.group,
             json!({
                 "name": actor.config.name,
                 "spawned_by": actor.spawned_by,
                 "is_principal": is_principal,
             }),
         );
-        self.actors.insert(actor_id.clone(), actor);
+        self.insert_actor(actor);
         self.persist_actor(&actor_id);
         actor_id
     }
 
+    fn insert_actor(&mut self, actor: Actor) {
+        let actor_id = actor.id.clone();
+        if actor.state != ActorState::Terminated {
+            self.active.insert(actor_id.clone());
+        }
+        self.by_name
+            .entry(actor.config.name.clone())
+            .or_default()
+            .push(actor_id.clone());
+        self.children
+            .entry(actor.spawned_by.clone())
+            .or_default()
+            .push(actor_id.clone());
+        self.actors.insert(actor_id, actor);
+        self.status_version += 1;
+    }
+
+    fn remove_actor(&mut self, actor_id: &str) {
+        let Some(actor) = self.actors.remove(actor_id) else {
+            return;
+        };
+        self.active.remove(actor_id);
+        unindex(&mut self.by_name, &actor.config.name, actor_id);
+        unindex(&mut self.children, &actor.spawned_by, actor_id);
+        self.status_version += 1;
+    }
+
     /// Rehydrate unfinished subagents persisted by a previous process run.
     /// Call once at startup, after spawning the fresh principal. Each
     /// restored actor keeps its id, goals, task state, turn count, and last
@@ -109,9 +195,9 @@ impl ActorRegistry {
         let restored_ids = restored
             .iter()
             .map(|entry| entry.actor.id.clone())
-            .collect::<std::collections::HashSet<_>>();
+            .collect::<HashSet<_>>();
 
-        let mut count = 0;
+        let mut restored_now = Vec::new();
         for entry in restored {
             let mut actor = entry.actor;
             if self.actors.contains_key(&actor.id) {
@@ -155,18 +241,19 @@ impl ActorRegistry {
 
             self.emit_event(
                 "actor_restored",
-                &actor,
+                &actor.id,
+                &actor.config.group,
                 json!({
                     "name": actor.config.name,
                     "task_state": state_name(actor.task_state),
                     "turns_used": actor.turn_count,
                 }),
             );
-            let actor_id = actor.id.clone();
-            self.actors.insert(actor_id.clone(), actor);
-            self.persist_actor(&actor_id);
-            count += 1;
+            restored_now.push(actor.id.clone());
+            self.insert_actor(actor);
         }
+        self.persist_actors(&restored_now);
+        let count = restored_now.len();
         if count > 0 {
             tracing::info!(count, "restored unfinished subagents from previous run");
         }
@@ -178,6 +265,13 @@ impl ActorRegistry {
     }
 
     pub fn get_mut(&mut self, actor_id: &str) -> Option<&mut Actor> {
+        self.actor_mut(actor_id)
+    }
+
+    /// Single chokepoint for mutable actor access. Conservatively treats any
+    /// mutable borrow as a change to the status listing.
+    fn actor_mut(&mut self, actor_id: &str) -> Option<&mut Actor> {
+        self.status_version += 1;
         self.actors.get_mut(actor_id)
     }
 
@@ -187,17 +281,35 @@ impl ActorRegistry {
             .and_then(|actor_id| self.actors.get(actor_id))
     }
 
+    /// Every actor that has not terminated, in no particular order.
+    pub fn active_actors(&self) -> impl Iterator<Item = &Actor> {
+        self.active
+            .iter()
+            .filter_map(|actor_id| self.actors.get(actor_id))
+    }
+
     pub fn active_count(&self) -> usize {
-        self.actors
-            .values()
-            .filter(|actor| actor.state != ActorState::Terminated)
-            .count()
+        self.active.len()
     }
 
     pub fn all_actors(&self) -> Vec<ActorInfo> {
         self.actors.values().map(Actor::info).collect()
     }
 
+    /// Shared listing of every actor for status endpoints. Rebuilt only when
+    /// an actor was spawned, mutated or removed since the last call;
+    /// otherwise the cached listing is handed out again without cloning.
+    pub fn status_snapshot(&mut self) -> Arc<Vec<ActorInfo>> {
+        if let Some((version, listing)) = &self.status_cache
+            && *version == self.status_version
+        {
+            return listing.clone();
+        }
+        let listing = Arc::new(self.all_actors());
+        self.status_cache = Some((self.status_version, listing.clone()));
+        listing
+    }
+
     pub fn discover(&self, group: &str) -> Vec<ActorInfo> {
         self.actors
             .values()
@@ -207,9 +319,8 @@ impl ActorRegistry {
     }
 
     pub fn discover_active(&self, group: &str) -> Vec<ActorInfo> {
-        self.actors
-            .values()
-            .filter(|actor| actor.config.group == group && actor.state != ActorState::Terminated)
+        self.active_actors()
+            .filter(|actor| actor.config.group == group)
             .map(Actor::info)
             .collect()
     }
@@ -235,17 +346,35 @@ impl ActorRegistry {
     }
 
     pub fn find_by_name(&self, name: &str, group: Option<&str>) -> Option<&Actor> {
-        self.actors.values().find(|actor| {
-            actor.config.name == name
-                && actor.state != ActorState::Terminated
-                && group.is_none_or(|group| actor.config.group == group)
+        self.by_name
+            .get(name)?
+            .iter()
+            .filter(|actor_id| self.active.contains(*actor_id))
+            .filter_map(|actor_id| self.actors.get(actor_id))
+            .find(|actor| group.is_none_or(|group| actor.config.group == group))
+    }
+
+    /// Active subagent in `group` whose goals match `goals` up to case and
+    /// whitespace. Catches a parent re-delegating the same task under a new
+    /// name, which would otherwise pay for every model call twice.
+    pub fn find_active_by_goals(&self, goals: &str, group: &str) -> Option<&Actor> {
+        let wanted = normalize_goals(goals);
+        if wanted.is_empty() {
+            return None;
+        }
+        self.active_actors().find(|actor| {
+            !actor.is_principal
+                && actor.config.group == group
+                && normalize_goals(&actor.config.goals) == wanted
         })
     }
 
     pub fn get_children(&self, parent_id: &str) -> Vec<&Actor> {
-        self.actors
-            .values()
-            .filter(|actor| actor.spawned_by == parent_id)
+        self.children
+            .get(parent_id)
+            .into_iter()
+            .flatten()
+            .filter_map(|actor_id| self.actors.get(actor_id))
             .collect()
     }
 
@@ -272,10 +401,14 @@ impl ActorRegistry {
         mut metadata: serde_json::Map<String, Value>,
         intent: Option<MessageIntent>,
     ) -> ActorResult<ActorMessage> {
-        let sender = self
+        // Only the sender's group is needed for the event; cloning the whole
+        // sender would copy its message history on every send.
+        let sender_group = self
             .actors
             .get(sender_id)
             .ok_or_else(|| ActorError::NotFound(sender_id.to_string()))?
+            .config
+            .group
             .clone();
         if !self.actors.contains_key(recipient_id) {
             return Err(ActorError::NotFound(recipient_id.to_string()));
@@ -317,17 +450,18 @@ impl ActorRegistry {
             created_at: Utc::now(),
         };
 
-        if let Some(recipient) = self.actors.get_mut(recipient_id) {
+        if let Some(recipient) = self.actor_mut(recipient_id) {
             recipient.messages.push(message.clone());
             recipient.inbox.push_back(message.clone());
         }
-        if let Some(sender) = self.actors.get_mut(sender_id) {
+        if let Some(sender) = self.actor_mut(sender_id) {
             sender.messages.push(message.clone());
         }
 
         self.emit_event(
             "actor_message",
-            &sender,
+            sender_id,
+            &sender_group,
             json!({
                 "recipient": recipient_id,
                 "message_id": message.id,
@@ -339,7 +473,8 @@ impl ActorRegistry {
         if resolved_intent.channel() == "user_notify" {
             self.emit_event(
                 "user_notify",
-                &sender,
+                sender_id,
+                &sender_group,
                 json!({
                     "recipient": recipient_id,
                     "message_id": message.id,
@@ -355,6 +490,8 @@ impl ActorRegistry {
     }
 
     pub fn pop_inbox(&mut self, actor_id: &str) -> Option<ActorMessage> {
+        // The inbox is not part of any listing, so this skips `actor_mut`
+        // and leaves the status caches warm.
         self.actors
             .get_mut(actor_id)
             .and_then(|actor| actor.inbox.pop_front())
@@ -382,8 +519,7 @@ impl ActorRegistry {
 
         let note = note.into();
         let updated = self
-            .actors
-            .get_mut(actor_id)
+            .actor_mut(actor_id)
             .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
         let previous = updated.task_state;
         updated.task_state = new_state;
@@ -393,7 +529,8 @@ impl ActorRegistry {
 
         self.emit_event(
             "task_state_changed",
-            &snapshot,
+            &snapshot.id,
+            &snapshot.config.group,
             json!({
                 "from": state_name(previous),
                 "to": state_name(new_state),
@@ -431,8 +568,7 @@ impl ActorRegistry {
         };
         {
             let actor = self
-                .actors
-                .get_mut(actor_id)
+                .actor_mut(actor_id)
                 .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
             actor.result = Some(result_text.clone());
             actor.outcome = Some(outcome);
@@ -440,6 +576,7 @@ impl ActorRegistry {
             actor.state = ActorState::Terminated;
             actor.terminated_at = Some(Utc::now());
         }
+        self.active.remove(actor_id);
 
         self.notify_parent_on_termination(actor_id)?;
         let actor = self
@@ -449,7 +586,8 @@ impl ActorRegistry {
             .clone();
         self.emit_event(
             "actor_terminated",
-            &actor,
+            &actor.id,
+            &actor.config.group,
             json!({
                 "name": actor.config.name,
                 "result": actor.result.clone().unwrap_or_default(),
@@ -487,8 +625,7 @@ impl ActorRegistry {
         };
         {
             let actor = self
-                .actors
-                .get_mut(actor_id)
+                .actor_mut(actor_id)
                 .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
             actor.result = Some(result_text.clone());
             actor.task_state = TaskState::Running;
@@ -501,7 +638,8 @@ impl ActorRegistry {
             .clone();
         self.emit_event(
             "actor_cycle_finished",
-            &actor,
+            &actor.id,
+            &actor.config.group,
             json!({
                 "name": actor.config.name,
                 "result": result_text,
@@ -556,7 +694,7 @@ impl ActorRegistry {
             .collect::<Vec<_>>();
         let removed = stale.len();
         for actor_id in stale {
-            self.actors.remove(&actor_id);
+            self.remove_actor(&actor_id);
             if self.principal_id.as_deref() == Some(&actor_id) {
                 self.principal_id = None;
             }
@@ -586,23 +724,24 @@ impl ActorRegistry {
             return Ok(None);
         }
 
-        let mut system_prompt = self.build_system_prompt(actor_id)?;
-        let directory = self.build_requestable_directory(actor_id)?;
-        if !directory.is_empty() {
-            system_prompt.push_str("\n\n");
-            system_prompt.push_str(&directory);
-        }
+        let stable_prompt = self.build_stable_prompt(actor_id)?;
+        let system_prompt = {
+            let mut builder = PromptBuilder::new();
+            self.push_volatile_blocks(&actor, &mut builder);
+            builder.render()
+        };
         let updated = self
-            .actors
-            .get_mut(actor_id)
+            .actor_mut(actor_id)
             .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
         let has_pending_messages = updated.has_pending_messages();
         updated.inbox.clear();
+        updated.progress.clear();
         updated.turn_count += 1;
         updated.state = ActorState::Running;
         let spec = ActorRunSpec {
             actor_id: updated.id.clone(),
             name: updated.config.name.clone(),
+            stable_prompt,
             system_prompt,
             turn_number: updated.turn_count,
             max_turns: updated.config.max_turns.max(1),
@@ -620,8 +759,7 @@ impl ActorRegistry {
         response: impl Into<String>,
     ) -> ActorResult<()> {
         let actor = self
-            .actors
-            .get_mut(actor_id)
+            .actor_mut(actor_id)
             .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
         if actor.state == ActorState::Terminated {
             return Ok(());
@@ -652,12 +790,9 @@ impl ActorRegistry {
     pub fn open_work_lines(&self) -> Vec<String> {
         let now = Utc::now();
         let mut unfinished = self
-            .actors
-            .values()
+            .active_actors()
             .filter(|actor| {
-                !actor.is_principal
-                    && actor.state != ActorState::Terminated
-                    && actor.config.name != crate::actor::background::DMN_ACTOR_NAME
+                !actor.is_principal && actor.config.name != crate::actor::background::DMN_ACTOR_NAME
             })
             .collect::<Vec<_>>();
         unfinished.sort_by_key(|actor| actor.created_at);
@@ -709,15 +844,34 @@ impl ActorRegistry {
     }
 
     pub fn build_system_prompt(&self, actor_id: &str) -> ActorResult<String> {
-        use crate::llm::PromptBuilder;
-
         let actor = self
             .actors
             .get(actor_id)
             .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
 
         let mut builder = PromptBuilder::new();
-        let header = if actor.is_principal {
+        builder.raw(self.actor_header(actor));
+        self.push_volatile_blocks(actor, &mut builder);
+        Ok(builder.render())
+    }
+
+    /// The part of an actor's turn prompt that stays byte-identical across
+    /// its turns: the runtime-role header followed by the
+    /// `<available_on_request>` directory. Actor turns send it as its own
+    /// leading system message so it can carry the prompt-cache breakpoint.
+    pub fn build_stable_prompt(&self, actor_id: &str) -> ActorResult<String> {
+        let actor = self
+            .actors
+            .get(actor_id)
+            .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
+        let mut builder = PromptBuilder::new();
+        builder.raw(self.actor_header(actor));
+        builder.raw(self.build_requestable_directory(actor_id)?);
+        Ok(builder.render())
+    }
+
+    fn actor_header(&self, actor: &Actor) -> String {
+        if actor.is_principal {
             "Your runtime role: cortex (the conscious executive layer). Handle quick tasks directly and spawn subagents for longer work. Use request_tool to enable extended tools listed in <available_on_request>.".to_string()
         } else {
             let parent_name = self
@@ -729,8 +883,12 @@ impl ActorRegistry {
                 "Your runtime role: subagent '{}'. Spawned by '{}' (id={}); you cannot talk to the user directly.",
                 actor.config.name, parent_name, actor.spawned_by
             )
-        };
-        builder.raw(header);
+        }
+    }
+
+    /// Goals, previous turn, visible actors, inbox and rules — everything in
+    /// the actor prompt that can change between turns.
+    fn push_volatile_blocks(&self, actor: &Actor, builder: &mut PromptBuilder) {
         // Subagents carry a task-specific goal; the principal's mission is
         // already in the identity_block, so we skip the redundant <goals>.
         if !actor.is_principal {
@@ -845,8 +1003,6 @@ impl ActorRegistry {
                 "Report results to your parent before terminating. Use update_task_state for meaningful progress.",
             );
         }
-
-        Ok(builder.render())
     }
 
     /// The `<available_on_request>` directory, emitted as a sibling of the
@@ -875,16 +1031,14 @@ impl ActorRegistry {
         channel: &str,
         kind: &str,
     ) -> String {
-        let Some(target) = self.actors.get(target_id).cloned() else {
+        let Some(target) = self.actors.get(target_id) else {
             return format!(
                 "Error: actor {target_id} not found. Use discover_actors() to find available actors."
             );
         };
+        let target_name = target.config.name.clone();
         if target.state == ActorState::Terminated {
-            return format!(
-                "Error: actor {target_id} ({}) is terminated.",
-                target.config.name
-            );
+            return format!("Error: actor {target_id} ({target_name}) is terminated.");
         }
         if !self.can_message(actor_id, target_id) {
             return format!(
@@ -900,33 +1054,33 @@ impl ActorRegistry {
         }
         match self.send_to(actor_id, target_id, content, reply_to, metadata, None) {
             Ok(message) => format!(
-                "Message sent (id={}) to {} ({target_id})",
-                message.id, target.config.name
+                "Message sent (id={}) to {target_name} ({target_id})",
+                message.id
             ),
             Err(error) => format!("Error: {error}"),
         }
     }
 
     pub fn discover_for_actor(
-        &self,
+        &mut self,
         actor_id: &str,
         group: Option<&str>,
         include_terminated: bool,
     ) -> ActorResult<String> {
+        // Only these three fields are read below; copying them rather than
+        // the whole actor (history, inbox) frees `self` for the row cache.
         let actor = self
             .actors
             .get(actor_id)
             .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
+        let (own_id, spawned_by) = (actor.id.clone(), actor.spawned_by.clone());
+        let own_group = actor.config.group.clone();
         let search_group = group
             .map(str::trim)
             .filter(|group| !group.is_empty())
-            .unwrap_or(&actor.config.group);
-        let actors = if include_terminated {
-            self.discover(search_group)
-        } else {
-            self.discover_active(search_group)
-        };
-        if actors.is_empty() {
+            .unwrap_or(&own_group);
+        let rows = self.discover_rows(search_group, include_terminated);
+        if rows.is_empty() {
             let scope = if include_terminated {
                 " (including terminated)"
             } else {
@@ -940,38 +1094,82 @@ impl ActorRegistry {
         } else {
             " (active only)"
         };
-        let mut lines = vec![format!("Actors in group '{search_group}'{scope}:")];
-        for info in actors {
-            let marker = if info.id == actor.id { " (you)" } else { "" };
-            let relationship = relationship_label(actor, &info);
-            let outcome_label = info
-                .outcome
-                .filter(|_| info.state == ActorState::Terminated)
-                .map(|outcome| format!(" [outcome: {}]", outcome.as_str()))
-                .unwrap_or_default();
-            let result_info = if info.state == ActorState::Terminated {
-                self.actors
-                    .get(&info.id)
-                    .and_then(|actor| actor.result())
-                    .map(|result| format!(" result: {}", truncate_chars(result, 400)))
-                    .unwrap_or_default()
-            } else {
-                String::new()
-            };
-            lines.push(format!(
-                "  {} (id={}, state={}, task={}){}{}{}: {}{}",
-                info.name,
-                info.id,
-                actor_state_name(info.state),
-                state_name(info.task_state),
-                outcome_label,
-                marker,
-                relationship,
-                info.goals,
-                result_info
-            ));
+        // Rendered straight into one buffer sized up front; with many actors
+        // a Vec of per-row Strings plus a join doubled the allocations.
+        const ROW_EXTRA: usize = "\n (you) [sibling]".len();
+        let capacity = rows
+            .iter()
+            .map(|row| row.head.len() + row.tail.len() + ROW_EXTRA)
+            .sum::<usize>()
+            + search_group.len()
+            + 48;
+        let mut output = String::with_capacity(capacity);
+        output.push_str("Actors in group '");
+        output.push_str(search_group);
+        output.push('\'');
+        output.push_str(scope);
+        output.push(':');
+        for row in rows.iter() {
+            output.push('\n');
+            output.push_str(&row.head);
+            if row.info.id == own_id {
+                output.push_str(" (you)");
+            }
+            output.push_str(relationship_label(&own_id, &spawned_by, &row.info));
+            output.push_str(&row.tail);
         }
-        Ok(lines.join("\n"))
+        Ok(output)
+    }
+
+    /// Caller-independent discovery rows for `group`, rebuilt only when an
+    /// actor changed since they were last formatted. Models tend to call
+    /// `discover_actors` repeatedly while nothing moves.
+    fn discover_rows(&mut self, group: &str, include_terminated: bool) -> Arc<[DiscoverRow]> {
+        let key = (group.to_string(), include_terminated);
+        if let Some((version, rows)) = self.discover_cache.get(&key)
+            && *version == self.status_version
+        {
+            return rows.clone();
+        }
+        let infos = if include_terminated {
+            self.discover(group)
+        } else {
+            self.discover_active(group)
+        };
+        let rows: Arc<[DiscoverRow]> = infos
+            .into_iter()
+            .map(|info| {
+                let outcome_label = info
+                    .outcome
+                    .filter(|_| info.state == ActorState::Terminated)
+                    .map(|outcome| format!(" [outcome: {}]", outcome.as_str()))
+                    .unwrap_or_default();
+                let result_info = if info.state == ActorState::Terminated {
+                    self.actors
+                        .get(&info.id)
+                        .and_then(|actor| actor.result())
+                        .map(|result| format!(" result: {}", truncate_chars(result, 400)))
+                        .unwrap_or_default()
+                } else {
+                    String::new()
+                };
+                let head = format!(
+                    "  {} (id={}, state={}, task={}){}",
+                    info.name,
+                    info.id,
+                    actor_state_name(info.state),
+                    state_name(info.task_state),
+                    outcome_label,
+                );
+                let tail = format!(": {}{}", info.goals, result_info);
+                DiscoverRow { info, head, tail }
+            })
+            .collect();
+        self.discover_cache
+            .retain(|_, (version, _)| *version == self.status_version);
+        self.discover_cache
+            .insert(key, (self.status_version, rows.clone()));
+        rows
     }
 
     pub fn spawn_child_for_actor(
@@ -979,11 +1177,14 @@ impl ActorRegistry {
         actor_id: &str,
         request: ActorSpawnRequest<'_>,
     ) -> ActorResult<SpawnReport> {
+        // Borrow the caller rather than cloning it: a clone would copy its
+        // whole message history and inbox on every spawn.
         let actor = self
             .actors
             .get(actor_id)
-            .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?
-            .clone();
+            .ok_or_else(|| ActorError::NotFound(actor_id.to_string()))?;
+        let parent_id = actor.id.clone();
+        let grandparent_id = actor.spawned_by.clone();
         let target_group = request
             .group
             .map(str::trim)
@@ -1003,10 +1204,9 @@ impl ActorRegistry {
         }
 
         let active_children = self
-            .get_children(&actor.id)
+            .get_children(&parent_id)
             .into_iter()
             .filter(|child| child.state != ActorState::Terminated)
-            .cloned()
             .collect::<Vec<_>>();
         if let Some(existing) = self.find_by_name(&name, Some(&target_group))
             && existing.state != ActorState::Terminated
@@ -1023,6 +1223,18 @@ impl ActorRegistry {
                 ),
             });
         }
+        if let Some(existing) = self.find_active_by_goals(request.goals, &target_group) {
+            return Ok(SpawnReport::Rejected {
+                message: format!(
+                    "DUPLICATE BLOCKED: Actor '{}' (id={}, state={}) is already working on these goals.\nUse send_message({}, ...) to coordinate with it, or wait for its result.{}",
+                    existing.config.name,
+                    existing.id,
+                    actor_state_name(existing.state),
+                    existing.id,
+                    format_active_children(&active_children)
+                ),
+            });
+        }
         if active_children.len() >= 5 {
             return Ok(SpawnReport::Rejected {
                 message: format!(
@@ -1032,10 +1244,10 @@ impl ActorRegistry {
                 ),
             });
         }
-        if !actor.spawned_by.is_empty()
+        if !grandparent_id.is_empty()
             && self
                 .actors
-                .get(&actor.spawned_by)
+                .get(&grandparent_id)
                 .is_some_and(|parent| !parent.spawned_by.is_empty() && !parent.is_principal)
         {
             return Ok(SpawnReport::Rejected {
@@ -1046,28 +1258,27 @@ impl ActorRegistry {
         }
 
         let model_tier = parse_model_tier(request.model).unwrap_or(ModelTier::Aux);
-        let tool_list = split_tool_list(request.tools);
+        let tool_list = clean_tool_list(request.tools);
+        let tools_text = if tool_list.is_empty() {
+            String::new()
+        } else {
+            format!(" + {}", tool_list.join(", "))
+        };
         let mut config =
             ActorConfig::new(name.clone(), request.goals.trim()).in_group(target_group.clone());
-        config.tools = tool_list.clone();
+        config.tools = tool_list;
         config.model = Some(model_tier);
         config.max_turns = if request.max_turns == 0 {
             20
         } else {
             request.max_turns
         };
-        let child_id = self.spawn(config, Some(&actor.id), false);
+        let child_id = self.spawn(config, Some(&parent_id), false);
         let active_children = self
-            .get_children(&actor.id)
+            .get_children(&parent_id)
             .into_iter()
             .filter(|child| child.state != ActorState::Terminated)
-            .cloned()
             .collect::<Vec<_>>();
-        let tools_text = if tool_list.is_empty() {
-            String::new()
-        } else {
-            format!(" + {}", tool_list.join(", "))
-        };
         Ok(SpawnReport::Spawned {
             actor_id: child_id.clone(),
             message: format!(
@@ -1091,21 +1302,40 @@ impl ActorRegistry {
         let Some(actor) = self.actors.get(actor_id) else {
             return format!("Actor {actor_id} not found.");
         };
+        let progress = if actor.state == ActorState::Running && !actor.progress.is_empty() {
+            format!("\nIn progress: {}", actor.progress)
+        } else {
+            String::new()
+        };
         let result = actor
             .result()
             .map(|result| format!("\nResult: {result}"))
             .unwrap_or_default();
         format!(
-            "{} (id={}, state={}, task={}): {}{}",
+            "{} (id={}, state={}, task={}): {}{}{}",
             actor.config.name,
             actor.id,
             actor_state_name(actor.state),
             state_name(actor.task_state),
             actor.config.goals,
+            progress,
             result
         )
     }
 
+    /// Record an in-turn progress note for a running subagent. Surfaced by
+    /// `ping_actor` so a parent polling a long child sees partial work
+    /// instead of nothing until the turn ends.
+    pub fn record_progress(&mut self, actor_id: &str, note: &str) {
+        // Reported after every tool call; like `pop_inbox` it bypasses
+        // `actor_mut` so it does not invalidate the status caches.
+        if let Some(actor) = self.actors.get_mut(actor_id)
+            && actor.state == ActorState::Running
+        {
+            actor.progress = truncate_chars(note, 300);
+        }
+    }
+
     pub fn terminate_tool(
         &mut self,
         actor_id: &str,
@@ -1186,13 +1416,14 @@ impl ActorRegistry {
             metadata,
             created_at: Utc::now(),
         };
-        if let Some(parent) = self.actors.get_mut(&actor.spawned_by) {
+        if let Some(parent) = self.actor_mut(&actor.spawned_by) {
             parent.messages.push(message.clone());
             parent.inbox.push_back(message.clone());
         }
         self.emit_event(
             "actor_message",
-            &actor,
+            &actor.id,
+            &actor.config.group,
             json!({
                 "recipient": actor.spawned_by,
                 "message_id": message.id,
@@ -1204,9 +1435,9 @@ impl ActorRegistry {
         Ok(())
     }
 
-    fn emit_event(&mut self, event_type: &str, actor: &Actor, payload: Value) {
-        let mut event = ActorEvent::new(event_type, &actor.id);
-        event.group = actor.config.group.clone();
+    fn emit_event(&mut self, event_type: &str, actor_id: &str, group: &str, payload: Value) {
+        let mut event = ActorEvent::new(event_type, actor_id);
+        event.group = group.to_string();
         event.payload = payload.as_object().cloned().unwrap_or_default();
         self.events.emit(event);
     }
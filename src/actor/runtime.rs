@@ -1,5 +1,6 @@
 use std::collections::HashMap;
-use std::sync::OnceLock;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, OnceLock};
 use std::time::Duration as StdDuration;
 
 use kameo::actor::{ActorRef, Spawn};
@@ -14,7 +15,7 @@ const ACTOR_CONTINUATION_DELAY: StdDuration = StdDuration::from_secs(2);
 #[derive(kameo::Actor)]
 pub struct ActorSupervisor {
     pub(crate) registry: ActorRegistry,
-    workers: HashMap<String, ActorRef<ResidentActor>>,
+    workers: HashMap<String, ResidentWorker>,
     executor: Option<ActorTurnExecutor>,
 }
 
@@ -30,8 +31,7 @@ impl ActorSupervisor {
     pub(crate) fn sync_resident_actors(&mut self, supervisor_ref: ActorRef<ActorSupervisor>) {
         let active_ids = self
             .registry
-            .actors
-            .values()
+            .active_actors()
             .filter(|actor| {
                 !actor.is_principal
                     && matches!(actor.state, ActorState::Running | ActorState::Waiting)
@@ -39,27 +39,62 @@ impl ActorSupervisor {
             .map(|actor| actor.id.clone())
             .collect::<std::collections::HashSet<_>>();
         self.workers
-            .retain(|actor_id, worker| active_ids.contains(actor_id) && worker.is_alive());
+            .retain(|actor_id, worker| active_ids.contains(actor_id) && worker.actor.is_alive());
         for actor_id in active_ids {
-            self.workers.entry(actor_id.clone()).or_insert_with(|| {
-                ResidentActor::spawn(ResidentActor {
-                    actor_id: actor_id.clone(),
-                    supervisor: supervisor_ref.clone(),
-                })
-            });
+            self.ensure_worker(&actor_id, &supervisor_ref);
         }
     }
 
+    fn ensure_worker(&mut self, actor_id: &str, supervisor_ref: &ActorRef<ActorSupervisor>) {
+        self.workers.entry(actor_id.to_string()).or_insert_with(|| {
+            let wake_queued = Arc::new(AtomicBool::new(false));
+            let actor = ResidentActor::spawn(ResidentActor {
+                actor_id: actor_id.to_string(),
+                supervisor: supervisor_ref.clone(),
+                wake_queued: wake_queued.clone(),
+            });
+            ResidentWorker { actor, wake_queued }
+        });
+    }
+
+    /// Post-spawn hook: start a resident worker for the freshly spawned
+    /// child and wake only it. Spawning doesn't change anything the other
+    /// actors are waiting on, so a full resync plus a wake of every worker
+    /// would just queue redundant turns behind each of them.
+    fn start_spawned_actor(
+        &mut self,
+        report: &SpawnReport,
+        supervisor_ref: &ActorRef<ActorSupervisor>,
+    ) {
+        let Some(actor_id) = report.actor_id() else {
+            return;
+        };
+        self.ensure_worker(actor_id, supervisor_ref);
+        self.wake_actor(actor_id, "actor_spawned");
+    }
+
+    /// Queue a turn for the actor. A wake that arrives while an earlier one
+    /// is still queued is folded into it: the queued turn has not started
+    /// yet, so it will see everything in the inbox anyway, and a burst of
+    /// messages costs one turn instead of one per message.
     pub(crate) fn wake_actor(&self, actor_id: &str, reason: impl Into<String>) -> bool {
         let Some(worker) = self.workers.get(actor_id) else {
             return false;
         };
-        worker
+        if worker.wake_queued.swap(true, Ordering::AcqRel) {
+            return true;
+        }
+        let sent = worker
+            .actor
             .tell(WakeActor {
                 reason: reason.into(),
             })
             .try_send()
-            .is_ok()
+            .is_ok();
+        if !sent {
+            worker.wake_queued.store(false, Ordering::Release);
+        }
+        sent
     }
 
     pub(crate) fn wake_active_actors(&self, reason: impl Into<String>) -> usize {
@@ -122,6 +157,18 @@ impl ActorRuntime {
             .map_err(actor_runtime_error)
     }
 
+    /// Fire-and-forget progress report from inside an actor turn. Dropped if
+    /// the supervisor mailbox is unavailable; progress is advisory.
+    pub fn record_progress(&self, actor_id: &str, note: impl Into<String>) {
+        let _ = self
+            .supervisor
+            .tell(RecordActorProgress {
+                actor_id: actor_id.to_string(),
+                note: note.into(),
+            })
+            .try_send();
+    }
+
     pub async fn is_subagent(&self, actor_id: &str) -> bool {
         self.supervisor
             .ask(IsSubagent {
@@ -234,7 +281,7 @@ impl ActorRuntime {
             .map_err(actor_runtime_error)
     }
 
-    pub async fn list_actors(&self) -> ActorResult<Vec<ActorInfo>> {
+    pub async fn list_actors(&self) -> ActorResult<Arc<Vec<ActorInfo>>> {
         self.supervisor
             .ask(ListAllActors)
             .await
@@ -272,6 +319,14 @@ pub struct ActorNamedEvent {
 struct ResidentActor {
     actor_id: String,
     supervisor: ActorRef<ActorSupervisor>,
+    wake_queued: Arc<AtomicBool>,
+}
+
+/// The supervisor's handle on a resident worker, plus the flag shared with
+/// it that marks a wake as queued but not yet started.
+struct ResidentWorker {
+    actor: ActorRef<ResidentActor>,
+    wake_queued: Arc<AtomicBool>,
 }
 
 #[derive(Clone, Debug)]
@@ -287,6 +342,9 @@ impl Message<WakeActor> for ResidentActor {
         message: WakeActor,
         ctx: &mut Context<Self, Self::Reply>,
     ) -> Self::Reply {
+        // Cleared before the turn starts: messages arriving from here on
+        // may miss this turn, so they must be able to queue the next one.
+        self.wake_queued.store(false, Ordering::Release);
         let Some(executor) = self.supervisor.ask(GetTurnExecutor).await.ok().flatten() else {
             return;
         };
@@ -478,6 +536,25 @@ impl Message<IsSubagent> for ActorSupervisor {
     }
 }
 
+#[derive(Debug)]
+struct RecordActorProgress {
+    actor_id: String,
+    note: String,
+}
+
+impl Message<RecordActorProgress> for ActorSupervisor {
+    type Reply = ();
+
+    async fn handle(
+        &mut self,
+        message: RecordActorProgress,
+        _ctx: &mut Context<Self, Self::Reply>,
+    ) -> Self::Reply {
+        self.registry
+            .record_progress(&message.actor_id, &message.note);
+    }
+}
+
 #[derive(Debug)]
 struct ActiveActorCount;
 
@@ -589,7 +666,7 @@ pub enum ActorToolCommand {
         name: String,
         goals: String,
         group: Option<String>,
-        tools: String,
+        tools: Vec<String>,
         model: String,
         max_turns: usize,
     },
@@ -676,24 +753,23 @@ impl Message<ActorToolCommand> for ActorSupervisor {
                 model,
                 max_turns,
             } => {
-                let outcome = self
-                    .registry
-                    .spawn_child_for_actor(
-                        &actor_id,
-                        ActorSpawnRequest {
-                            name: &name,
-                            goals: &goals,
-                            group: group.as_deref(),
-                            tools: &tools,
-                            model: &model,
-                            max_turns,
-                        },
-                    )
-                    .map(|report| report.message().to_string())
-                    .unwrap_or_else(|error| format!("Error: {error}"));
-                self.sync_resident_actors(ctx.actor_ref().clone());
-                self.wake_active_actors("actor_spawned");
-                outcome
+                match self.registry.spawn_child_for_actor(
+                    &actor_id,
+                    ActorSpawnRequest {
+                        name: &name,
+                        goals: &goals,
+                        group: group.as_deref(),
+                        tools: &tools,
+                        model: &model,
+                        max_turns,
+                    },
+                ) {
+                    Ok(report) => {
+                        self.start_spawned_actor(&report, ctx.actor_ref());
+                        report.message().to_string()
+                    }
+                    Err(error) => format!("Error: {error}"),
+                }
             }
             ActorToolCommand::PingActor {
                 actor_id: _,
@@ -764,7 +840,7 @@ pub struct SpawnSubagent {
     pub name: String,
     pub goals: String,
     pub group: Option<String>,
-    pub tools: String,
+    pub tools: Vec<String>,
     pub model: String,
     pub max_turns: usize,
 }
@@ -788,8 +864,7 @@ impl Message<SpawnSubagent> for ActorSupervisor {
                 max_turns: message.max_turns,
             },
         )?;
-        self.sync_resident_actors(ctx.actor_ref().clone());
-        self.wake_active_actors("actor_spawned");
+        self.start_spawned_actor(&report, ctx.actor_ref());
         Ok(report)
     }
 }
@@ -937,13 +1012,13 @@ impl Message<OpenWorkLines> for ActorSupervisor {
 struct ListAllActors;
 
 impl Message<ListAllActors> for ActorSupervisor {
-    type Reply = ActorResult<Vec<ActorInfo>>;
+    type Reply = ActorResult<Arc<Vec<ActorInfo>>>;
 
     async fn handle(
         &mut self,
         _message: ListAllActors,
         _ctx: &mut Context<Self, Self::Reply>,
     ) -> Self::Reply {
-        Ok(self.registry.all_actors())
+        Ok(self.registry.status_snapshot())
     }
 }
@@ -43,6 +43,17 @@ fn unknown_user_notify_kind_defaults_to_info() {
     );
 }
 
+#[test]
+fn short_ids_are_eight_lowercase_hex_digits() {
+    let id = short_id();
+    assert_eq!(id.len(), 8);
+    assert!(
+        id.chars()
+            .all(|c| c.is_ascii_hexdigit() && !c.is_ascii_uppercase())
+    );
+    assert_ne!(id, short_id());
+}
+
 #[test]
 fn event_bus_keeps_only_recent_events() {
     let mut bus = ActorEventBus::new(2);
@@ -348,6 +359,8 @@ fn registry_spawns_discovers_and_cleans_terminated_actors() {
     assert_eq!(registry.active_count(), 1);
     assert_eq!(registry.discover("main").len(), 2);
     assert_eq!(registry.discover_active("main").len(), 1);
+    assert!(registry.find_by_name("researcher", Some("main")).is_none());
+    assert!(registry.active_actors().all(|actor| actor.id == principal));
     assert_eq!(
         registry.discover_recently_finished("main", 1)[0]
             .result()
@@ -357,8 +370,49 @@ fn registry_spawns_discovers_and_cleans_terminated_actors() {
 
     registry.get_mut(&worker).unwrap().terminated_at =
         Some(Utc::now() - ChronoDuration::seconds(ActorRegistry::STALE_SECONDS + 1));
+    assert_eq!(registry.get_children(&principal).len(), 1);
     assert_eq!(registry.cleanup_terminated(false), 1);
     assert!(registry.get(&worker).is_none());
+    assert!(registry.get_children(&principal).is_empty());
+}
+
+#[test]
+fn status_snapshot_is_reused_until_an_actor_changes() {
+    let (mut registry, _principal, worker) = registry_with_principal_and_worker();
+
+    let first = registry.status_snapshot();
+    assert_eq!(first.len(), 2);
+    assert!(Arc::ptr_eq(&first, &registry.status_snapshot()));
+
+    registry
+        .terminate(&worker, Outcome::Success, "done")
+        .unwrap();
+    let after = registry.status_snapshot();
+    assert!(!Arc::ptr_eq(&first, &after));
+    let worker_info = after.iter().find(|info| info.id == worker).unwrap();
+    assert_eq!(worker_info.result.as_deref(), Some("done"));
+}
+
+#[test]
+fn discover_rows_are_cached_per_caller_and_refreshed_on_spawn() {
+    let (mut registry, principal, worker) = registry_with_principal_and_worker();
+
+    let from_principal = registry
+        .discover_for_actor(&principal, None, false)
+        .unwrap();
+    let from_worker = registry.discover_for_actor(&worker, None, false).unwrap();
+    assert!(from_principal.contains("researcher (id=") && from_principal.contains("[child]"));
+    assert!(from_worker.contains("[parent]"));
+    assert!(from_worker.contains("(you)"));
+
+    registry.spawn(
+        ActorConfig::new("writer", "Draft the summary").in_group("main"),
+        Some(&principal),
+        false,
+    );
+    let refreshed = registry.discover_for_actor(&worker, None, false).unwrap();
+    assert!(refreshed.contains("writer"));
+    assert!(refreshed.contains("[sibling]"));
 }
 
 #[test]
@@ -537,7 +591,7 @@ fn actor_tool_methods_spawn_discover_send_and_ping() {
                 name: "Code Helper",
                 goals: "Write the implementation",
                 group: None,
-                tools: "read_file,write_file",
+                tools: &["read_file".to_string(), "write_file".to_string()],
                 model: "main",
                 max_turns: 10,
             },
@@ -555,7 +609,7 @@ fn actor_tool_methods_spawn_discover_send_and_ping() {
                 name: "researcher",
                 goals: "same task",
                 group: None,
-                tools: "",
+                tools: &[],
                 model: "aux",
                 max_turns: 20,
             },
@@ -565,6 +619,32 @@ fn actor_tool_methods_spawn_discover_send_and_ping() {
     assert!(duplicate.message().contains("DUPLICATE BLOCKED"));
     assert!(duplicate.message().contains(&worker));
 
+    let same_goals = registry
+        .spawn_child_for_actor(
+            &principal,
+            ActorSpawnRequest {
+                name: "second-researcher",
+                goals: "  research the topic and   report findings ",
+                group: None,
+                tools: &[],
+                model: "aux",
+                max_turns: 20,
+            },
+        )
+        .unwrap();
+    assert!(matches!(same_goals, SpawnReport::Rejected { .. }));
+    assert!(
+        same_goals
+            .message()
+            .contains("already working on these goals")
+    );
+    assert!(same_goals.message().contains(&worker));
+    assert!(
+        registry
+            .find_by_name("second-researcher", Some("main"))
+            .is_none()
+    );
+
     let sent = registry.send_message_tool(&principal, &worker, "Hello", None, "", "");
     assert!(sent.contains("Message sent"));
     assert_eq!(registry.pop_inbox(&worker).unwrap().content, "Hello");
@@ -572,6 +652,11 @@ fn actor_tool_methods_spawn_discover_send_and_ping() {
     let ping = registry.ping_actor(&worker);
     assert!(ping.contains("researcher"));
     assert!(ping.contains("running"));
+    assert!(!ping.contains("In progress"));
+
+    registry.record_progress(&worker, "step 2: web_search ok — found three sources");
+    let ping = registry.ping_actor(&worker);
+    assert!(ping.contains("In progress: step 2: web_search ok"));
 }
 
 #[test]
@@ -608,6 +693,28 @@ fn actor_tool_methods_kill_terminate_restart_and_finished_listing() {
     );
 }
 
+#[test]
+fn actor_turn_spec_splits_stable_header_from_volatile_blocks() {
+    let (mut registry, _principal, worker) = registry_with_principal_and_worker();
+
+    let first = registry.prepare_actor_turn(&worker).unwrap().unwrap();
+    assert!(
+        first
+            .stable_prompt
+            .starts_with("Your runtime role: subagent")
+    );
+    assert!(!first.stable_prompt.contains("<goals>"));
+    assert!(first.system_prompt.contains("<goals>"));
+    assert!(!first.system_prompt.contains("Your runtime role"));
+
+    registry
+        .record_actor_turn_response(&worker, "NEXT: compare results")
+        .unwrap();
+    let second = registry.prepare_actor_turn(&worker).unwrap().unwrap();
+    assert_eq!(second.stable_prompt, first.stable_prompt);
+    assert!(second.system_prompt.contains("<your_previous_turn>"));
+}
+
 #[test]
 fn actor_turn_specs_increment_and_enforce_max_turns() {
     let (mut registry, _principal, worker) = registry_with_principal_and_worker();
@@ -1,6 +1,6 @@
 use std::collections::HashSet;
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::{Arc, Mutex, RwLock};
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
 
 use anyhow::anyhow;
 use chrono::Local;
@@ -32,7 +32,7 @@ use crate::llm::{
 use crate::memory::message_metadata::MessageMetadata;
 use crate::memory::messages::{MessageHistoryError, MessageRole, StoredMessage};
 use crate::memory::recall::{Hippocampus, HippocampusConfig, HippocampusError};
-use crate::memory::{MemoryStore, MemoryStoreError};
+use crate::memory::{MemoryStore, MemoryStoreError, PromptMemory, SemanticIndexConfig};
 use crate::scheduler::curator::{CuratorError, CuratorRunStats, MemoryCurator};
 use crate::tools::registry::{
     ActorToolContext, SharedActorRegistry, ToolRuntime, requestable_tools_directory_for,
@@ -259,6 +259,15 @@ impl Agent {
         self.memory.as_ref()
     }
 
+    /// Start loading the embedding model in the background. Only the
+    /// long-running services call this: a one-shot CLI command may never
+    /// embed anything, and shouldn't pay for a load it then throws away.
+    pub fn warm_embedder(&self) {
+        if SemanticIndexConfig::from_env().enabled {
+            self.memory.archival.embedder().warm_in_background();
+        }
+    }
+
     /// Subscribe to conversation messages emitted by non-requesting transports
     /// (e.g. Telegram). The HTTP `/events` stream relays these to web clients.
     pub fn subscribe_conversation_events(&self) -> broadcast::Receiver<ConversationEvent> {
@@ -344,16 +353,47 @@ impl Agent {
             ..req.clone()
         };
         let req = &req;
-        let mut turn = prepare_turn(
-            &self.settings,
-            self.memory.as_ref(),
-            &self.prompts,
-            &req.message,
-            req.attachments.clone(),
-            req.metadata.as_ref(),
-            &req.options,
-        )?;
-        let actor_context = self.actor_context_for_prompt_async().await?;
+        // Local assembly (recall embeds the query and searches SQLite) is
+        // blocking work: run it on the blocking pool so a slow recall for one
+        // chat doesn't stall the runtime threads serving other chats, and
+        // overlap it with the two actor-registry round-trips it doesn't
+        // depend on.
+        let local = {
+            let settings = self.settings.clone();
+            let memory = self.memory.clone();
+            let prompts = self.prompts.clone();
+            let message = req.message.clone();
+            let attachments = req.attachments.clone();
+            let metadata = req.metadata.clone();
+            let options = req.options.clone();
+            tokio::task::spawn_blocking(move || {
+                prepare_turn(
+                    &settings,
+                    &memory,
+                    &prompts,
+                    &message,
+                    attachments,
+                    metadata.as_ref(),
+                    &options,
+                )
+            })
+        };
+        let (local, actor_context, directory) = tokio::join!(
+            local,
+            self.actor_context_for_prompt_async(),
+            self.requestable_tools_directory_async(req)
+        );
+        let mut turn = match local {
+            Ok(turn) => turn?,
+            Err(error) if error.is_panic() => std::panic::resume_unwind(error.into_panic()),
+            Err(error) => {
+                return Err(AgentError::Llm(anyhow!(
+                    "turn preparation was cancelled: {error}"
+                )));
+            }
+        };
+        let actor_context = actor_context?;
+        let directory = directory?;
         // Actor context and the requestable directory are per-turn volatile —
         // they belong on the volatile system message so they don't invalidate
         // the stable cache prefix.
@@ -364,7 +404,6 @@ impl Agent {
             system.content.push_str(&context);
             system.content.push_str("\n</actor_context>");
         }
-        let directory = self.requestable_tools_directory_async(req).await?;
         if !directory.is_empty()
             && let Some(system) = volatile_system_message_mut(&mut turn.messages)
         {
@@ -685,6 +724,7 @@ impl Agent {
                 router: self.router.clone(),
                 shell: self.shell.clone(),
                 last_prompt_tokens: self.last_prompt_tokens.clone(),
+                llm_gate: None,
             },
             messages,
             runtime,
@@ -799,15 +839,13 @@ fn build_system_prompt(
     prompts: &PromptStore,
     recall: Option<&str>,
 ) -> AgentResult<SystemParts> {
-    let identity = memory
-        .blocks
-        .get("identity")
-        .map_err(MemoryStoreError::Blocks)?
-        .map(|block| block.value)
-        .unwrap_or_default();
+    let PromptMemory {
+        identity,
+        conversation_summary: summary,
+        stable: memory_stable,
+        volatile: memory_volatile,
+    } = memory.prompt_memory()?;
     let instructions = prompts.load("agent_instructions", "You are Lethe.").text;
-    let (memory_stable, memory_volatile) = memory.get_context_split()?;
-    let summary = memory.conversation_summary()?;
     let clock_block = format_clock_block();
 
     let mut stable_builder = PromptBuilder::new();
@@ -1214,7 +1252,9 @@ fn message_chars(message: &LlmMessage) -> usize {
         + message
             .attachments
             .iter()
-            .map(|att| att.base64_content.chars().count())
+            // Base64 is ASCII: byte length is the char count, without a
+            // scan over a multi-megabyte payload.
+            .map(|att| att.base64_content.len())
             .sum::<usize>()
         + message
             .tool_responses
@@ -1309,8 +1349,10 @@ fn replace_base64_images_with_stubs(content: &str) -> String {
 
     // Fallback: regex-strip any `data:image/...;base64,...` blobs.
     // This handles cases where content is not a clean JSON array.
-    let re = regex::Regex::new(r"data:image/[^;]+;base64,[A-Za-z0-9+/=]+")
-        .unwrap_or_else(|_| unreachable!());
+    static DATA_IMAGE: OnceLock<regex::Regex> = OnceLock::new();
+    let re = DATA_IMAGE.get_or_init(|| {
+        regex::Regex::new(r"data:image/[^;]+;base64,[A-Za-z0-9+/=]+").expect("valid regex")
+    });
     let stripped = re.replace_all(content, "[image archived]");
     if stripped != content {
         return stripped.into_owned();
@@ -2223,6 +2265,7 @@ mod tests {
         let spec = ActorRunSpec {
             actor_id: "a1".to_string(),
             name: "worker".to_string(),
+            stable_prompt: "header".to_string(),
             system_prompt: "system".to_string(),
             turn_number: 1,
             max_turns: 3,
@@ -14,15 +14,18 @@ use anyhow::anyhow;
 use genai::chat::{ChatMessage, ContentPart, MessageContent, ToolCall, ToolResponse};
 use regex::Regex;
 use serde_json::{Map, Value, json};
+use tokio::sync::{OwnedSemaphorePermit, Semaphore};
 use uuid::Uuid;
 
 use crate::actor::{ActorError, ActorRunSpec, ActorRuntime, ActorTurnExecutor, ModelTier};
 use crate::config::Settings;
-use crate::llm::{LlmAttachment, LlmMessage, LlmRouter, build_chat_request};
-use crate::memory::MemoryStore;
-use crate::memory::MessageRole;
-use crate::tools::registry::{ActorToolContext, BoxToolFuture, ToolRegistry, ToolRuntime};
+use crate::llm::{LlmAttachment, LlmMessage, LlmRouter, build_chat_request, dialect_for_model};
+use crate::memory::{MemoryStore, MessageRole};
+use crate::tools::registry::{
+    ActorToolContext, BoxToolFuture, ToolRegistry, ToolRuntime, find_def,
+};
 use crate::tools::shell::ShellTools;
+use crate::tools::spec::ToolCategory;
 
 use super::{AgentError, AgentResult};
 
@@ -40,50 +43,34 @@ const MAX_REPEATED_TOOL_CALLS: usize = 4;
 const MAX_NO_PROGRESS_TURNS: usize = 4;
 const MAX_EMPTY_RESPONSES: usize = 2;
 
-/// Tools that don't count as "work" against [`total_tool_calls`] — memory
-/// reads/writes, telegram side effects, actor lifecycle. Matches Python's
-/// `FREE_TOOL_NAMES`.
-const FREE_TOOL_NAMES: &[&str] = &[
-    // Memory
-    "memory_read",
-    "memory_update",
-    "memory_append",
-    "archival_search",
-    "archival_insert",
-    "conversation_search",
-    "note_search",
-    "note_get",
-    // Telegram
-    "telegram_send_message",
-    "telegram_send_file",
-    "telegram_react",
-    // Actor lifecycle
-    "send_message",
-    "user_notify",
-    "terminate",
-    "ping_actor",
-    "wait_for_response",
-    "discover_actors",
-    "discover_recently_finished",
-    "spawn_actor",
-    "spawn_chain",
-    "kill_actor",
-    "update_task_state",
-    "get_task_state",
-    "restart_self",
-];
+/// Whether a tool call doesn't count as "work" against [`total_tool_calls`]:
+/// memory reads/writes are listed here (constant-pattern match, no slice
+/// scan); actor-lifecycle and transport tools are derived from their catalog
+/// category so new tools in those categories can't drift out of sync.
+fn is_free_tool(name: &str) -> bool {
+    matches!(
+        name,
+        "memory_read"
+            | "memory_update"
+            | "memory_append"
+            | "archival_search"
+            | "archival_insert"
+            | "conversation_search"
+            | "note_search"
+            | "note_get"
+    ) || find_def(name).is_some_and(|def| {
+        matches!(
+            def.category,
+            ToolCategory::Actor | ToolCategory::ActorSubagent | ToolCategory::Transport
+        )
+    })
+}
 
 /// Tools whose results we skip recording in the per-turn tool log
 /// (search results are recursive bloat). Matches Python's
 /// `SEARCH_RESULT_SKIP_TOOL_NAMES`.
-const SKIP_TOOL_LOG_TOOLS: &[&str] = &["conversation_search", "archival_search"];
-
-fn is_free_tool(name: &str) -> bool {
-    FREE_TOOL_NAMES.contains(&name)
-}
-
 fn skip_tool_log(name: &str) -> bool {
-    SKIP_TOOL_LOG_TOOLS.contains(&name)
+    matches!(name, "conversation_search" | "archival_search")
 }
 
 fn is_error_result(result: &str) -> bool {
@@ -170,10 +157,10 @@ struct ToolLogEntry {
 }
 
 fn truncate_chars(value: &str, limit: usize) -> String {
-    if value.chars().count() <= limit {
-        return value.to_string();
+    match value.char_indices().nth(limit) {
+        Some((end, _)) => value[..end].to_string(),
+        None => value.to_string(),
     }
-    value.chars().take(limit).collect()
 }
 
 fn gemma_tool_call_regex() -> &'static Regex {
@@ -325,6 +312,21 @@ pub(super) struct TurnExecutionContext {
     /// the next turn's compaction budget reflects real usage instead of a
     /// crude char estimate. Zero means "no measurement yet".
     pub last_prompt_tokens: Arc<AtomicU64>,
+    /// Shared request pool for subagent model calls. Every actor turn holds a
+    /// permit only while its model call is in flight, so N parallel subagents
+    /// queue here instead of stampeding the provider. `None` on the
+    /// user-facing chat path, which must never wait behind background work.
+    pub llm_gate: Option<Arc<Semaphore>>,
+}
+
+/// Wait for a slot in the shared subagent request pool, when the turn runs
+/// under one. Callers drop the permit as soon as the model call returns so
+/// tool execution never holds a slot another actor could use.
+async fn acquire_llm_slot(gate: Option<&Arc<Semaphore>>) -> Option<OwnedSemaphorePermit> {
+    match gate {
+        Some(gate) => gate.clone().acquire_owned().await.ok(),
+        None => None,
+    }
 }
 
 /// Build the actor turn executor that the [`ActorRuntime`] supervisor calls
@@ -336,12 +338,16 @@ pub(super) fn actor_turn_executor(
     shell: ShellTools,
     last_prompt_tokens: Arc<AtomicU64>,
 ) -> ActorTurnExecutor {
+    let llm_gate = Arc::new(Semaphore::new(
+        settings.background.actor_llm_concurrency.max(1),
+    ));
     let context = TurnExecutionContext {
         settings,
         memory,
         router,
         shell,
         last_prompt_tokens,
+        llm_gate: Some(llm_gate),
     };
     Arc::new(move |spec: ActorRunSpec, runtime: ActorRuntime| {
         let context = context.clone();
@@ -355,15 +361,21 @@ pub(super) fn actor_turn_executor(
                 requested_tools: spec.requested_tools.clone(),
                 ..ToolRuntime::default()
             };
-            let messages = vec![
-                LlmMessage::system(spec.system_prompt.clone()),
-                LlmMessage::user(actor_turn_instruction(&spec)),
-            ];
+            let use_aux = spec.model == ModelTier::Aux;
+            let model_id = context
+                .router
+                .read()
+                .map_err(|error| ActorError::Runtime(format!("router lock poisoned: {error}")))?
+                .config()
+                .model_for(use_aux)
+                .to_string();
+            let mut messages = actor_system_messages(&spec, &model_id);
+            messages.push(LlmMessage::user(actor_turn_instruction(&spec)));
             complete_turn_with_tools_config_shared(
                 context,
                 messages,
                 tool_runtime,
-                spec.model == ModelTier::Aux,
+                use_aux,
                 false,
             )
             .await
@@ -383,6 +395,29 @@ pub(super) fn actor_turn_executor(
     })
 }
 
+/// System messages for an actor turn. The stable header + tool directory go
+/// first and carry the prompt-cache breakpoint (when the model's dialect
+/// supports one), so successive turns of the same actor reuse the provider's
+/// prefill for that prefix. The short-TTL marker fits actor turns, which run
+/// back to back. The volatile blocks (goals, inbox, previous turn) follow in a
+/// second, unmarked message.
+fn actor_system_messages(spec: &ActorRunSpec, model_id: &str) -> Vec<LlmMessage> {
+    let mut messages = Vec::with_capacity(3);
+    if !spec.stable_prompt.is_empty() {
+        let stable = LlmMessage::system(spec.stable_prompt.as_str());
+        messages.push(
+            match dialect_for_model(model_id).cache_marker_for_volatile() {
+                Some(hint) => stable.with_cache_control(hint),
+                None => stable,
+            },
+        );
+    }
+    if !spec.system_prompt.is_empty() {
+        messages.push(LlmMessage::system(spec.system_prompt.as_str()));
+    }
+    messages
+}
+
 /// Run the LLM/tool loop end to end. Iterates up to [`MAX_TOOL_ITERATIONS`]
 /// times: each iteration asks the model for the next move, executes any
 /// returned tool calls, and feeds the results (plus any inline `_image_view`
@@ -400,6 +435,13 @@ pub(super) async fn complete_turn_with_tools_config_shared(
         .map(|name| name.trim().to_string())
         .filter(|name| !name.is_empty())
         .collect::<HashSet<_>>();
+    // Subagent turns report each tool step back to the actor registry so a
+    // parent pinging a long-running child sees partial progress.
+    let progress_sink = runtime
+        .actor
+        .as_ref()
+        .filter(|actor| actor.is_subagent)
+        .map(|actor| (actor.runtime.clone(), actor.actor_id.clone()));
     let registry = ToolRegistry::with_runtime(
         context.memory.as_ref(),
         context.settings.paths.workspace_dir.clone(),
@@ -424,9 +466,16 @@ pub(super) async fn complete_turn_with_tools_config_shared(
     // base model again. With no tool model configured this stays false and the
     // whole turn runs on the base model, exactly as before.
     let mut entered_tool_chain = false;
+    // Size of `active_tools` the request's schema list was built for. The set
+    // only grows (via `request_tool`), so a size change is the one signal to
+    // rebuild; otherwise every iteration re-cloned every schema.
+    let mut tools_built_for: Option<usize> = None;
 
     for iteration in 0..MAX_TOOL_ITERATIONS {
-        request.tools = Some(registry.tools_for_active(&active_tools));
+        if tools_built_for != Some(active_tools.len()) {
+            request.tools = Some(registry.tools_for_active(&active_tools));
+            tools_built_for = Some(active_tools.len());
+        }
         tracing::debug!(
             iteration,
             messages = request.messages.len(),
@@ -447,6 +496,7 @@ pub(super) async fn complete_turn_with_tools_config_shared(
             router.config().model_for(use_aux).to_string()
         };
         let observer_for_stream = registry.turn_observer().cloned();
+        let slot = acquire_llm_slot(context.llm_gate.as_ref()).await;
         let response = match observer_for_stream {
             Some(observer) => {
                 let observer_reasoning = observer.clone();
@@ -467,6 +517,7 @@ pub(super) async fn complete_turn_with_tools_config_shared(
                     .await?
             }
         };
+        drop(slot);
         if let Some(prompt_tokens) = response.usage.prompt_tokens {
             context
                 .last_prompt_tokens
@@ -555,6 +606,10 @@ pub(super) async fn complete_turn_with_tools_config_shared(
         if !text.trim().is_empty() {
             last_text = text.clone();
         }
+        // The tool-call message and each tool result are persisted as they
+        // happen, not batched to the end of the round: a /cancel aborts this
+        // task mid-round, and calls that already ran (shell, file writes,
+        // sends) must stay in history.
         if record_tool_messages {
             context.memory.messages.add(
                 MessageRole::Assistant,
@@ -642,6 +697,15 @@ pub(super) async fn complete_turn_with_tools_config_shared(
                     tool_started_at.elapsed().as_millis(),
                 );
             }
+            if let Some((actor_runtime, actor_id)) = progress_sink.as_ref() {
+                let status = if is_error { "failed" } else { "ok" };
+                let mut note = format!("step {iteration}: {tool_name} {status}");
+                if !last_text.trim().is_empty() {
+                    note.push_str(" — ");
+                    note.push_str(&truncate_chars(last_text.trim(), 200));
+                }
+                actor_runtime.record_progress(actor_id, note);
+            }
             if is_error {
                 total_tool_errors += 1;
                 tool_error_pressure += if is_transient_error(&result) { 1 } else { 2 };
@@ -748,6 +812,7 @@ pub(super) async fn complete_turn_with_tools_config_shared(
     // for this turn, and a non-streaming call here meant minutes of dead air
     // followed by a reply the streaming UI had no deltas for.
     let observer_for_stream = registry.turn_observer().cloned();
+    let slot = acquire_llm_slot(context.llm_gate.as_ref()).await;
     let response = match observer_for_stream {
         Some(observer) => {
             let observer_reasoning = observer.clone();
@@ -768,6 +833,7 @@ pub(super) async fn complete_turn_with_tools_config_shared(
                 .await?
         }
     };
+    drop(slot);
     if let Some(prompt_tokens) = response.usage.prompt_tokens {
         context
             .last_prompt_tokens
@@ -937,8 +1003,12 @@ pub(super) fn extract_image_views(result: String) -> (String, Vec<ImageView>) {
     let Some(image) = object.remove("_image_view") else {
         return (result, vec![]);
     };
+    let Value::Object(mut image) = image else {
+        return (json_without_image_view(value, result), vec![]);
+    };
 
-    let Some(data) = image.get("data").and_then(Value::as_str) else {
+    // Moved out rather than copied: the payload is the whole base64 image.
+    let Some(Value::String(data)) = image.remove("data") else {
         return (json_without_image_view(value, result), vec![]);
     };
     let Some(mime_type) = image.get("mime_type").and_then(Value::as_str) else {
@@ -961,7 +1031,7 @@ pub(super) fn extract_image_views(result: String) -> (String, Vec<ImageView>) {
         });
     let attachment = LlmAttachment {
         content_type: mime_type.to_string(),
-        base64_content: data.to_string(),
+        base64_content: data,
         name,
     };
     (
@@ -988,6 +1058,7 @@ pub(super) fn image_view_message(image: ImageView) -> ChatMessage {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::llm::CacheHint;
 
     #[test]
     fn recover_text_tool_calls_parses_gemma_style() {
@@ -1074,12 +1145,38 @@ mod tests {
         );
     }
 
+    #[test]
+    fn actor_system_messages_mark_only_the_stable_prefix() {
+        let spec = ActorRunSpec {
+            actor_id: "a1".to_string(),
+            name: "worker".to_string(),
+            stable_prompt: "header".to_string(),
+            system_prompt: "goals".to_string(),
+            turn_number: 1,
+            max_turns: 3,
+            model: ModelTier::Aux,
+            has_pending_messages: false,
+            requested_tools: vec![],
+        };
+
+        let claude = actor_system_messages(&spec, "claude-opus-4-7");
+        assert_eq!(claude.len(), 2);
+        assert_eq!(claude[0].cache_control, Some(CacheHint::Ephemeral));
+        assert_eq!(claude[1].cache_control, None);
+
+        let other = actor_system_messages(&spec, "gpt-5");
+        assert!(other.iter().all(|message| message.cache_control.is_none()));
+    }
+
     #[test]
     fn free_tool_carve_out_recognizes_memory_and_telegram() {
         assert!(is_free_tool("archival_search"));
         assert!(is_free_tool("note_search"));
         assert!(is_free_tool("telegram_send_message"));
         assert!(is_free_tool("terminate"));
+        assert!(is_free_tool("restart_self"));
+        assert!(is_free_tool("spawn_chain"));
+        assert!(is_free_tool("telegram_react"));
         assert!(!is_free_tool("bash"));
         assert!(!is_free_tool("read_file"));
         assert!(!is_free_tool("edit_file"));
@@ -65,35 +65,23 @@ pub fn restore(archive: String, yes: bool) -> Result<()> {
 }
 
 fn run_backup(settings: &Settings, staging: &Path, output: &Path) -> Result<()> {
+    // The three components copy into disjoint staging subtrees, so stage
+    // them on parallel threads; a large workspace copy no longer holds up
+    // the db and .env copies behind it.
+    let (workspace, data, env) = std::thread::scope(|scope| {
+        let workspace = scope.spawn(|| stage_workspace(settings, staging));
+        let data = scope.spawn(|| stage_data(settings, staging));
+        let env = scope.spawn(|| stage_env(settings, staging));
+        (join_stage(workspace), join_stage(data), join_stage(env))
+    });
     let mut components: Vec<&str> = Vec::new();
-
-    if dir_exists(&settings.paths.workspace_dir) {
-        copy_dir(&settings.paths.workspace_dir, &staging.join("workspace"))?;
+    if workspace? {
         components.push("workspace");
     }
-
-    let data_dst = staging.join("data");
-    let mut wrote_data = false;
-    if dir_exists(&settings.paths.memory_dir) {
-        fs::create_dir_all(&data_dst)?;
-        copy_dir(&settings.paths.memory_dir, &data_dst.join("memory"))?;
-        wrote_data = true;
-    }
-    if settings.paths.db_path.exists() {
-        fs::create_dir_all(&data_dst)?;
-        fs::copy(&settings.paths.db_path, data_dst.join("lethe.db"))?;
-        wrote_data = true;
-    }
-    if wrote_data {
+    if data? {
         components.push("data");
     }
-
-    let env_src = settings.paths.lethe_home.join("config").join(".env");
-    if env_src.exists() {
-        let dst_dir = staging.join("config");
-        fs::create_dir_all(&dst_dir)?;
-        fs::copy(&env_src, dst_dir.join(".env"))
-            .with_context(|| format!("copying {} into staging", env_src.display()))?;
+    if env? {
         components.push("env");
     }
 
@@ -123,6 +111,48 @@ fn run_backup(settings: &Settings, staging: &Path, output: &Path) -> Result<()>
     tar_create(output, staging)
 }
 
+fn join_stage(handle: std::thread::ScopedJoinHandle<'_, Result<bool>>) -> Result<bool> {
+    handle
+        .join()
+        .unwrap_or_else(|_| Err(anyhow::anyhow!("backup staging thread panicked")))
+}
+
+fn stage_workspace(settings: &Settings, staging: &Path) -> Result<bool> {
+    if !dir_exists(&settings.paths.workspace_dir) {
+        return Ok(false);
+    }
+    copy_dir(&settings.paths.workspace_dir, &staging.join("workspace"))?;
+    Ok(true)
+}
+
+fn stage_data(settings: &Settings, staging: &Path) -> Result<bool> {
+    let data_dst = staging.join("data");
+    let mut wrote_data = false;
+    if dir_exists(&settings.paths.memory_dir) {
+        fs::create_dir_all(&data_dst)?;
+        copy_dir(&settings.paths.memory_dir, &data_dst.join("memory"))?;
+        wrote_data = true;
+    }
+    if settings.paths.db_path.exists() {
+        fs::create_dir_all(&data_dst)?;
+        fs::copy(&settings.paths.db_path, data_dst.join("lethe.db"))?;
+        wrote_data = true;
+    }
+    Ok(wrote_data)
+}
+
+fn stage_env(settings: &Settings, staging: &Path) -> Result<bool> {
+    let env_src = settings.paths.lethe_home.join("config").join(".env");
+    if !env_src.exists() {
+        return Ok(false);
+    }
+    let dst_dir = staging.join("config");
+    fs::create_dir_all(&dst_dir)?;
+    fs::copy(&env_src, dst_dir.join(".env"))
+        .with_context(|| format!("copying {} into staging", env_src.display()))?;
+    Ok(true)
+}
+
 fn run_restore(settings: &Settings, archive: &Path, staging: &Path, yes: bool) -> Result<()> {
     tar_extract(archive, staging)?;
 
@@ -37,6 +37,9 @@ use crate::{
     NoteCommand, ShCommand, TodoCommand, WebCommand,
 };
 
+/// Upper bound on waiting for aborted background tasks to unwind at exit.
+const SHUTDOWN_TIMEOUT: std::time::Duration = std::time::Duration::from_secs(10);
+
 pub(crate) async fn api_command(port: Option<u16>) -> Result<()> {
     let settings = Settings::from_env();
     if let Err(message) = settings.llm.ensure_ready() {
@@ -54,7 +57,7 @@ pub(crate) async fn api_command(port: Option<u16>) -> Result<()> {
     // double-firing, no divergent rate-limiter state, no transport-level
     // brain logic. See scheduler/brainstem.rs.
     let brainstem = lethe::scheduler::brainstem::BrainstemHandle::new();
-    let brainstem_task = tokio::spawn(lethe::scheduler::brainstem::run(
+    let mut brainstem_task = tokio::spawn(lethe::scheduler::brainstem::run(
         agent.clone(),
         settings.clone(),
         AgentOptions::default(),
@@ -65,26 +68,76 @@ pub(crate) async fn api_command(port: Option<u16>) -> Result<()> {
     // match config — including config written at runtime by a control plane (see
     // transport_supervisor) — so a bot can be connected without restarting. Falls
     // back to the static `TELEGRAM_*` settings when no runtime config is present.
-    let transport_task = tokio::spawn(crate::cli::transport_supervisor::run(
+    let mut transport_task = tokio::spawn(crate::cli::transport_supervisor::run(
         agent.clone(),
         settings.clone(),
         brainstem.clone(),
     ));
 
-    let api_result = if settings.api.enabled {
-        lethe::interfaces::api::serve_with_agent(settings, port, Some(agent), brainstem).await
-    } else {
-        // API transport disabled — no HTTP/SSE (and no TUI). Keep the
-        // background brainstem and any chat transports running until Ctrl-C.
-        tracing::info!("http api disabled (API_ENABLED=false); running background + chat only");
-        let _ = tokio::signal::ctrl_c().await;
-        Ok(())
+    let serve = async {
+        if settings.api.enabled {
+            lethe::interfaces::api::serve_with_agent(settings, port, Some(agent), brainstem).await
+        } else {
+            // API transport disabled — no HTTP/SSE (and no TUI). Keep the
+            // background brainstem and any chat transports running until Ctrl-C.
+            tracing::info!("http api disabled (API_ENABLED=false); running background + chat only");
+            lethe::interfaces::api::shutdown_signal().await;
+            Ok(())
+        }
+    };
+
+    // Both background tasks are meant to run for the life of the process. If
+    // one ends early (agent error, panic) the service would otherwise keep
+    // serving with heartbeats or chat silently dead, so treat it as fatal and
+    // let the service manager restart us.
+    let api_result = tokio::select! {
+        result = serve => result,
+        outcome = &mut brainstem_task => {
+            let reason = match outcome {
+                Ok(Ok(())) => "exited".to_string(),
+                Ok(Err(error)) => format!("failed: {error:#}"),
+                Err(error) => format!("panicked: {error}"),
+            };
+            tracing::error!(%reason, "brainstem stopped; shutting down");
+            Err(anyhow!("brainstem {reason}"))
+        }
+        outcome = &mut transport_task => {
+            let reason = match outcome {
+                Ok(()) => "exited".to_string(),
+                Err(error) => format!("panicked: {error}"),
+            };
+            tracing::error!(%reason, "transport supervisor stopped; shutting down");
+            Err(anyhow!("transport supervisor {reason}"))
+        }
     };
 
+    // Signal every background task first, then wait for all of them
+    // together: shutdown takes as long as the slowest task, not the sum. A
+    // task whose exit ended the select above has already been consumed and
+    // must not be awaited again.
     transport_task.abort();
-    let _ = transport_task.await;
     brainstem_task.abort();
-    let _ = brainstem_task.await;
+    let drained = tokio::time::timeout(SHUTDOWN_TIMEOUT, async {
+        tokio::join!(
+            async {
+                if !transport_task.is_finished() {
+                    let _ = transport_task.await;
+                }
+            },
+            async {
+                if !brainstem_task.is_finished() {
+                    let _ = brainstem_task.await;
+                }
+            },
+        );
+    })
+    .await;
+    if drained.is_err() {
+        tracing::warn!(
+            timeout_secs = SHUTDOWN_TIMEOUT.as_secs(),
+            "background tasks still draining at shutdown; exiting anyway"
+        );
+    }
     api_result
 }
 
@@ -313,7 +366,7 @@ pub(crate) fn web_command(command: WebCommand) -> Result<()> {
             include_text,
             category,
         } => tools.web_search(&query, num_results, include_text, &category),
-        WebCommand::Fetch { url, max_chars } => tools.fetch_webpage(&url, max_chars),
+        WebCommand::Fetch { url, max_chars } => tools.fetch_webpage(&url, max_chars, true),
     };
     println!("{output}");
     Ok(())
@@ -334,8 +387,7 @@ pub(crate) fn transcribe_command(file_path: &str, mime_type: Option<&str>) -> Re
 
 pub(crate) fn todo_command(command: TodoCommand) -> Result<()> {
     let settings = Settings::from_env();
-    let memory = MemoryStore::from_settings(&settings)?;
-    let manager = &memory.todos;
+    let manager = MemoryStore::open_todos(&settings)?;
     let output = match command {
         TodoCommand::Create {
             title,
@@ -543,14 +595,13 @@ fn heartbeat_config(settings: &Settings, minimal: bool) -> HeartbeatConfig {
 }
 
 pub(crate) fn open_work_text(settings: &Settings) -> Result<String> {
-    let memory = MemoryStore::from_settings(settings)?;
-    Ok(memory.todos.open_work_digest(20)?)
+    let todos = MemoryStore::open_todos(settings)?;
+    Ok(todos.open_work_digest(20)?)
 }
 
 pub(crate) fn active_reminders_text(settings: &Settings) -> Result<String> {
-    let memory = MemoryStore::from_settings(settings)?;
-    let reminders = memory
-        .todos
+    let todos = MemoryStore::open_todos(settings)?;
+    let reminders = todos
         .due_reminders()?
         .into_iter()
         .map(|todo| ActiveReminder {
@@ -146,6 +146,7 @@ pub async fn telegram_command(command: TelegramCommand) -> Result<()> {
                 );
             }
             let agent = Arc::new(Agent::from_settings(settings.clone())?);
+            agent.warm_embedder();
             let options = AgentOptions {
                 use_hippocampus: !no_recall,
                 ..Default::default()
@@ -210,11 +211,11 @@ pub async fn run_telegram_with_agent(
     );
 
     let mut brainstem_rx = brainstem.subscribe();
-    loop {
+    let result = loop {
         tokio::select! {
-            _ = tokio::signal::ctrl_c() => {
+            _ = lethe::interfaces::api::shutdown_signal() => {
                 println!("telegram_runner_stopped: interrupt");
-                break;
+                break Ok(());
             }
             emission = brainstem_rx.recv() => {
                 match emission {
@@ -232,7 +233,7 @@ pub async fn run_telegram_with_agent(
                         }
                     }
                     Err(tokio::sync::broadcast::error::RecvError::Lagged(_)) => continue,
-                    Err(tokio::sync::broadcast::error::RecvError::Closed) => break,
+                    Err(tokio::sync::broadcast::error::RecvError::Closed) => break Ok(()),
                 }
             }
             result = process_telegram_once(
@@ -251,7 +252,7 @@ pub async fn run_telegram_with_agent(
                     Ok(value) => value,
                     Err(error) => {
                         tracing::error!(error = %error, "telegram polling failed");
-                        return Err(error);
+                        break Err(error);
                     }
                 };
                 offset = next_offset;
@@ -264,12 +265,14 @@ pub async fn run_telegram_with_agent(
                 }
             }
         }
-    }
+    };
+    // Stop the monitor on every exit path — a polling failure used to return
+    // early and leave it running against a dead transport.
     if let Some(task) = actor_update_monitor {
         task.abort();
         let _ = task.await;
     }
-    Ok(())
+    result
 }
 
 pub fn parse_telegram_runtime_command(text: &str) -> Option<TelegramRuntimeCommand> {
@@ -1409,6 +1412,10 @@ async fn send_guarded_telegram_final_response(
     Ok(())
 }
 
+/// Sends the chunks in order with a human-paced gap between bubbles. The
+/// sends stay serial (Telegram shows messages in arrival order), but the
+/// "typing" indicator goes out while the gap is already running, so the
+/// pause is the pacing delay alone rather than delay plus a round-trip.
 async fn send_telegram_messages_with_delays(
     client: &TelegramClient,
     chat_id: i64,
@@ -1419,8 +1426,10 @@ async fn send_telegram_messages_with_delays(
         client.send_message(chat_id, &chunk).await?;
         if index + 1 < total {
             let delay = telegram_inter_message_delay(&chunk);
-            let _ = client.send_chat_action(chat_id, "typing").await;
-            tokio::time::sleep(delay).await;
+            let _ = tokio::join!(
+                client.send_chat_action(chat_id, "typing"),
+                tokio::time::sleep(delay)
+            );
         }
     }
     Ok(())
@@ -163,6 +163,10 @@ pub struct BackgroundConfig {
     pub debounce_seconds: f64,
     pub proactive_max_per_day: u32,
     pub proactive_cooldown_minutes: u32,
+    /// Max subagent model calls in flight at once. Subagent turns share one
+    /// request pool so a burst of delegated work queues locally instead of
+    /// piling into provider rate limits.
+    pub actor_llm_concurrency: usize,
 }
 
 #[derive(Clone, Debug, PartialEq, Serialize, Deserialize)]
@@ -255,6 +259,7 @@ impl Settings {
                 debounce_seconds: env_f64("DEBOUNCE_SECONDS", 5.0),
                 proactive_max_per_day: env_u32("PROACTIVE_MAX_PER_DAY", 4),
                 proactive_cooldown_minutes: env_u32("PROACTIVE_COOLDOWN_MINUTES", 60),
+                actor_llm_concurrency: env_usize("ACTOR_LLM_CONCURRENCY", 4),
             },
             paths,
         }
@@ -395,6 +400,7 @@ pub fn test_settings(root: &std::path::Path) -> Settings {
             debounce_seconds: 5.0,
             proactive_max_per_day: 4,
             proactive_cooldown_minutes: 60,
+            actor_llm_concurrency: 4,
         },
     }
 }
@@ -10,6 +10,7 @@ use thiserror::Error;
 use uuid::Uuid;
 
 use crate::config::Settings;
+use crate::tools::web::shared_client;
 
 pub const OPENAI_TRANSCRIPTIONS_URL: &str = "https://api.openai.com/v1/audio/transcriptions";
 pub const OPENROUTER_TRANSCRIPTIONS_URL: &str = "https://openrouter.ai/api/v1/audio/transcriptions";
@@ -233,7 +234,7 @@ fn transcribe_openrouter(
     if let Some(language) = language {
         payload["language"] = json!(language);
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(url)
         .bearer_auth(api_key)
         .json(&payload)
@@ -278,7 +279,7 @@ fn transcribe_openai(
     if let Some(language) = language {
         form = form.text("language", language.to_string());
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(OPENAI_TRANSCRIPTIONS_URL)
         .bearer_auth(api_key)
         .multipart(form)
@@ -443,6 +443,7 @@ pub async fn serve_with_agent(
         Some(agent) => ApiState::with_shared_agent(settings.clone(), agent),
         None => ApiState::from_settings(settings.clone())?,
     };
+    state.agent.warm_embedder();
     if let Err(error) = state.install_actor_broadcaster().await {
         tracing::warn!(error = %error, "actor broadcaster not installed");
     }
@@ -475,7 +476,26 @@ pub async fn serve_with_agent(
     Ok(result?)
 }
 
-async fn shutdown_signal() {
+/// Resolves on Ctrl-C anywhere, or SIGTERM on Unix — what service managers
+/// (systemd, launchd, docker stop) send, so those also shut down gracefully
+/// instead of killing the process mid-turn.
+pub async fn shutdown_signal() {
+    #[cfg(unix)]
+    {
+        use tokio::signal::unix::{SignalKind, signal};
+        match signal(SignalKind::terminate()) {
+            Ok(mut terminate) => {
+                tokio::select! {
+                    _ = tokio::signal::ctrl_c() => {}
+                    _ = terminate.recv() => {}
+                }
+                return;
+            }
+            Err(error) => {
+                tracing::warn!(error = %error, "SIGTERM handler unavailable; Ctrl-C only");
+            }
+        }
+    }
     let _ = tokio::signal::ctrl_c().await;
 }
 
@@ -815,6 +835,11 @@ async fn events(State(state): State<ApiState>, headers: HeaderMap) -> Response {
         .into_response()
 }
 
+#[derive(Serialize)]
+struct ActorsResponse<'a> {
+    actors: &'a [crate::actor::ActorInfo],
+}
+
 async fn list_actors(State(state): State<ApiState>, headers: HeaderMap) -> Response {
     if let Some(response) = require_auth(&state, &headers) {
         return response;
@@ -823,7 +848,9 @@ async fn list_actors(State(state): State<ApiState>, headers: HeaderMap) -> Respo
         return Json(json!({"actors": []})).into_response();
     };
     match runtime.list_actors().await {
-        Ok(actors) => Json(json!({"actors": actors})).into_response(),
+        // Serialize the shared snapshot directly rather than through an
+        // intermediate `Value` tree; the TUI polls this endpoint.
+        Ok(actors) => Json(ActorsResponse { actors: &actors }).into_response(),
         Err(error) => json_error(StatusCode::INTERNAL_SERVER_ERROR, &error.to_string()),
     }
 }
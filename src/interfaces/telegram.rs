@@ -1,6 +1,6 @@
 use std::collections::{HashMap, HashSet, VecDeque};
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, Mutex, OnceLock};
+use std::sync::{Arc, Mutex, OnceLock, PoisonError, RwLock};
 use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use serde::{Deserialize, Serialize};
@@ -10,6 +10,7 @@ use thiserror::Error;
 use crate::memory::message_metadata::{
     MessageKind, MessageVisibility, annotate_map, annotate_value,
 };
+use crate::tools::web::shared_client;
 
 mod formatting;
 use formatting::{
@@ -95,7 +96,8 @@ pub struct TelegramClient {
     token: String,
     // Interior-mutable so the allowlist can be set at runtime — specifically the
     // "lock to the first user who messages" flow used by the hosted runtime.
-    allowed_user_ids: Arc<Mutex<Vec<i64>>>,
+    // Checked on every update, written at most once, hence a read-mostly set.
+    allowed_user_ids: Arc<RwLock<HashSet<i64>>>,
     lock_on_first: bool,
     on_lock: Option<FirstUserLockCallback>,
     http: reqwest::Client,
@@ -105,6 +107,14 @@ pub struct TelegramClient {
 const TELEGRAM_ALLOWED_UPDATES: &str = "[\"message\",\"message_reaction\",\"callback_query\"]";
 const PENDING_REPLY_KEYBOARD_TTL: Duration = Duration::from_secs(30 * 60);
 
+/// One async connection pool for every `TelegramClient`. The typing observer
+/// builds a client per tool call, and each used to open its own pool and TLS
+/// session to api.telegram.org; `reqwest::Client` clones share the pool.
+fn shared_http_client() -> reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(reqwest::Client::new).clone()
+}
+
 impl TelegramClient {
     pub fn new(token: impl Into<String>, allowed_user_ids: Vec<i64>) -> TelegramResult<Self> {
         let token = token.into();
@@ -113,10 +123,10 @@ impl TelegramClient {
         }
         Ok(Self {
             token,
-            allowed_user_ids: Arc::new(Mutex::new(allowed_user_ids)),
+            allowed_user_ids: Arc::new(RwLock::new(allowed_user_ids.into_iter().collect())),
             lock_on_first: false,
             on_lock: None,
-            http: reqwest::Client::new(),
+            http: shared_http_client(),
             sent_messages: Arc::new(Mutex::new(SentMessageLog::default())),
         })
     }
@@ -132,22 +142,33 @@ impl TelegramClient {
     }
 
     pub fn user_allowed(&self, user_id: i64) -> bool {
-        let mut allowed = match self.allowed_user_ids.lock() {
-            Ok(guard) => guard,
-            Err(poisoned) => poisoned.into_inner(),
-        };
-        if allowed.is_empty() {
-            if self.lock_on_first {
-                allowed.push(user_id);
-                drop(allowed);
-                if let Some(cb) = &self.on_lock {
-                    cb(user_id);
-                }
+        {
+            let allowed = self
+                .allowed_user_ids
+                .read()
+                .unwrap_or_else(PoisonError::into_inner);
+            if !allowed.is_empty() {
+                return allowed.contains(&user_id);
+            }
+            if !self.lock_on_first {
                 return true;
             }
-            return true;
         }
-        allowed.contains(&user_id)
+        // Re-check under the write lock: two first messages may race here and
+        // only one of them gets to bind.
+        let mut allowed = self
+            .allowed_user_ids
+            .write()
+            .unwrap_or_else(PoisonError::into_inner);
+        if !allowed.is_empty() {
+            return allowed.contains(&user_id);
+        }
+        allowed.insert(user_id);
+        drop(allowed);
+        if let Some(cb) = &self.on_lock {
+            cb(user_id);
+        }
+        true
     }
 
     /// A shared handle to this client's outgoing-message log, so other send
@@ -387,7 +408,9 @@ impl TelegramClient {
             .error_for_status()?
             .bytes()
             .await?;
-        Ok(bytes.to_vec())
+        // The body is uniquely owned here, so this takes over its buffer
+        // instead of copying a whole photo or voice note a second time.
+        Ok(Vec::from(bytes))
     }
 
     fn method_url(&self, method: &str) -> String {
@@ -1809,7 +1832,7 @@ impl TelegramToolContext {
             if let Some(reply_markup) = &reply_markup {
                 payload["reply_markup"] = json!(reply_markup);
             }
-            return serde_json::to_string_pretty(&payload).unwrap();
+            return payload.to_string();
         }
         match send_message_blocking(
             &self.token,
@@ -1828,12 +1851,12 @@ impl TelegramToolContext {
                         reply_markup,
                     );
                 }
-                serde_json::to_string_pretty(&json!({
+                json!({
                     "success": true,
                     "message_id": message_id,
                     "chat_id": self.chat_id,
-                }))
-                .unwrap()
+                })
+                .to_string()
             }
             Err(error) => error_payload(&error.to_string()),
         }
@@ -1845,7 +1868,7 @@ impl TelegramToolContext {
             Err(error) => return error_payload(&error),
         };
         if self.dry_run {
-            return serde_json::to_string_pretty(&json!({
+            return json!({
                 "success": true,
                 "type": plan.send_type.as_str(),
                 "filename": plan.filename,
@@ -1853,8 +1876,8 @@ impl TelegramToolContext {
                 "message_id": 0,
                 "method": plan.send_type.method(),
                 "source": if plan.is_url { "url" } else { "local" },
-            }))
-            .unwrap();
+            })
+            .to_string();
         }
         let result = if plan.is_url {
             send_file_url_blocking(&self.token, self.chat_id, &plan, caption)
@@ -1864,14 +1887,14 @@ impl TelegramToolContext {
         match result {
             Ok(message_id) => {
                 self.remember_sent_message(message_id, caption);
-                serde_json::to_string_pretty(&json!({
+                json!({
                     "success": true,
                     "type": plan.send_type.as_str(),
                     "filename": plan.filename,
                     "chat_id": self.chat_id,
                     "message_id": message_id,
-                }))
-                .unwrap()
+                })
+                .to_string()
             }
             Err(error) => error_payload(&error.to_string()),
         }
@@ -1894,13 +1917,13 @@ impl TelegramToolContext {
             match guard.lock() {
                 Ok(mut guard) => {
                     guard.queue_pending_reaction(self.chat_id, target_message_id, emoji);
-                    return serde_json::to_string_pretty(&json!({
+                    return json!({
                         "success": true,
                         "queued": true,
                         "emoji": emoji,
                         "message_id": target_message_id,
-                    }))
-                    .unwrap();
+                    })
+                    .to_string();
                 }
                 Err(error) => {
                     return error_payload(&format!("Telegram turn guard poisoned: {error}"));
@@ -1911,12 +1934,12 @@ impl TelegramToolContext {
         let success =
             set_message_reaction_blocking(&self.token, self.chat_id, target_message_id, emoji)
                 .unwrap_or(false);
-        serde_json::to_string_pretty(&json!({
+        json!({
             "success": success,
             "emoji": emoji,
             "message_id": target_message_id,
-        }))
-        .unwrap()
+        })
+        .to_string()
     }
 }
 
@@ -1940,7 +1963,7 @@ pub fn send_message_blocking(
         reply_markup.validate().map_err(TelegramError::Api)?;
         payload["reply_markup"] = json!(reply_markup);
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(format!("https://api.telegram.org/bot{token}/sendMessage"))
         .json(&payload)
         .send()?
@@ -1959,7 +1982,37 @@ pub enum TelegramFileSendType {
     Document,
 }
 
+/// Extension → send method, one entry per extension (so `ogg` is a voice
+/// note and nothing else). Anything unlisted goes as a document.
+const EXTENSION_SEND_TYPES: &[(&str, TelegramFileSendType)] = &[
+    ("jpg", TelegramFileSendType::Photo),
+    ("jpeg", TelegramFileSendType::Photo),
+    ("png", TelegramFileSendType::Photo),
+    ("webp", TelegramFileSendType::Photo),
+    ("bmp", TelegramFileSendType::Photo),
+    ("gif", TelegramFileSendType::Animation),
+    ("mp4", TelegramFileSendType::Video),
+    ("avi", TelegramFileSendType::Video),
+    ("mov", TelegramFileSendType::Video),
+    ("mkv", TelegramFileSendType::Video),
+    ("webm", TelegramFileSendType::Video),
+    ("ogg", TelegramFileSendType::Voice),
+    ("mp3", TelegramFileSendType::Audio),
+    ("wav", TelegramFileSendType::Audio),
+    ("flac", TelegramFileSendType::Audio),
+    ("m4a", TelegramFileSendType::Audio),
+];
+
 impl TelegramFileSendType {
+    /// Case-insensitive lookup that compares in place instead of allocating
+    /// a lowercased copy of the extension.
+    fn for_extension(ext: &str) -> Self {
+        EXTENSION_SEND_TYPES
+            .iter()
+            .find(|(candidate, _)| candidate.eq_ignore_ascii_case(ext))
+            .map_or(Self::Document, |&(_, send_type)| send_type)
+    }
+
     pub fn as_str(self) -> &'static str {
         match self {
             Self::Photo => "photo",
@@ -2017,22 +2070,15 @@ impl TelegramFilePlan {
                 .to_string();
             (filename, Some(path))
         };
-        let ext = Path::new(&filename)
-            .extension()
-            .and_then(|value| value.to_str())
-            .unwrap_or_default()
-            .to_ascii_lowercase();
         let send_type = if as_document {
             TelegramFileSendType::Document
         } else {
-            match ext.as_str() {
-                "jpg" | "jpeg" | "png" | "webp" | "bmp" => TelegramFileSendType::Photo,
-                "gif" => TelegramFileSendType::Animation,
-                "mp4" | "avi" | "mov" | "mkv" | "webm" => TelegramFileSendType::Video,
-                "ogg" => TelegramFileSendType::Voice,
-                "mp3" | "wav" | "flac" | "m4a" => TelegramFileSendType::Audio,
-                _ => TelegramFileSendType::Document,
-            }
+            Path::new(&filename)
+                .extension()
+                .and_then(|value| value.to_str())
+                .map_or(TelegramFileSendType::Document, |ext| {
+                    TelegramFileSendType::for_extension(ext)
+                })
         };
         Ok(Self {
             original: source.to_string(),
@@ -2057,7 +2103,7 @@ fn send_file_url_blocking(
     if !caption.trim().is_empty() {
         payload["caption"] = json!(caption.trim());
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(format!(
             "https://api.telegram.org/bot{token}/{}",
             plan.send_type.method()
@@ -2069,6 +2115,9 @@ fn send_file_url_blocking(
     response.into_result().map(|message| message.message_id)
 }
 
+/// The Bot API's multipart upload limit.
+const TELEGRAM_UPLOAD_MAX_BYTES: u64 = 50 * 1_000_000;
+
 fn send_file_path_blocking(
     token: &str,
     chat_id: i64,
@@ -2078,6 +2127,16 @@ fn send_file_path_blocking(
     let Some(path) = &plan.path else {
         return Err(TelegramError::Api("missing local file path".to_string()));
     };
+    // `Part::file` already streams the body from disk; what is left to save is
+    // the upload itself when the Bot API is bound to reject it.
+    let size = std::fs::metadata(path)?.len();
+    if size > TELEGRAM_UPLOAD_MAX_BYTES {
+        return Err(TelegramError::Api(format!(
+            "file is {}MB; the Bot API accepts uploads up to {}MB",
+            size / 1_000_000,
+            TELEGRAM_UPLOAD_MAX_BYTES / 1_000_000
+        )));
+    }
     let mut form = reqwest::blocking::multipart::Form::new()
         .text("chat_id", chat_id.to_string())
         .part(
@@ -2087,7 +2146,7 @@ fn send_file_path_blocking(
     if !caption.trim().is_empty() {
         form = form.text("caption", caption.trim().to_string());
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(format!(
             "https://api.telegram.org/bot{token}/{}",
             plan.send_type.method()
@@ -2109,7 +2168,7 @@ pub fn set_message_reaction_blocking(
     if emoji.is_empty() {
         return Ok(false);
     }
-    let response = reqwest::blocking::Client::new()
+    let response = shared_client()
         .post(format!(
             "https://api.telegram.org/bot{token}/setMessageReaction"
         ))
@@ -2834,6 +2893,11 @@ mod tests {
                 false,
                 TelegramFileSendType::Audio,
             ),
+            (
+                "https://example.com/PHOTO.JPG",
+                false,
+                TelegramFileSendType::Photo,
+            ),
             (
                 "https://example.com/report.pdf",
                 false,
@@ -2853,6 +2917,20 @@ mod tests {
         }
     }
 
+    #[test]
+    fn oversized_local_upload_is_rejected_before_sending() {
+        let tmp = tempfile::tempdir().unwrap();
+        let file = tmp.path().join("big.mp4");
+        std::fs::File::create(&file)
+            .unwrap()
+            .set_len(TELEGRAM_UPLOAD_MAX_BYTES + 1)
+            .unwrap();
+        let plan = TelegramFilePlan::from_source(file.to_str().unwrap(), false).unwrap();
+
+        let error = send_file_path_blocking("token", 1, &plan, "").unwrap_err();
+        assert!(matches!(error, TelegramError::Api(message) if message.contains("50MB")));
+    }
+
     #[test]
     fn telegram_tool_context_dry_runs_message_and_file() {
         let tmp = tempfile::tempdir().unwrap();
@@ -209,11 +209,11 @@ pub(super) fn expand_tilde(path: &str) -> PathBuf {
 }
 
 pub(super) fn error_payload(message: &str) -> String {
-    serde_json::to_string_pretty(&json!({
+    json!({
         "success": false,
         "error": message,
-    }))
-    .unwrap()
+    })
+    .to_string()
 }
 
 /// Chunk a long message into Telegram-sized (4096-char) pieces while
@@ -237,16 +237,16 @@ pub fn split_telegram_messages(text: &str) -> Vec<String> {
                 if !current.is_empty() {
                     chunks.push(std::mem::take(&mut current));
                 }
-                let mut part = String::new();
-                for ch in line.chars() {
-                    if part.len() + ch.len_utf8() > LIMIT {
-                        chunks.push(part);
-                        part = String::new();
+                // Cut the oversized line into the longest slices that end on
+                // a char boundary, rather than copying it a char at a time.
+                let mut rest = line;
+                while !rest.is_empty() {
+                    let mut end = rest.len().min(LIMIT);
+                    while !rest.is_char_boundary(end) {
+                        end -= 1;
                     }
-                    part.push(ch);
-                }
-                if !part.is_empty() {
-                    chunks.push(part);
+                    chunks.push(rest[..end].to_string());
+                    rest = &rest[end..];
                 }
             } else {
                 if !current.is_empty() {
@@ -273,25 +273,31 @@ pub fn split_telegram_messages(text: &str) -> Vec<String> {
 /// the message. Lines containing `---` inline (e.g. inside a markdown
 /// table separator like `|---|---|`) are also preserved as-is — only
 /// pure `---`/`-----` lines act as bubble dividers.
-fn telegram_message_segments(text: &str) -> Vec<String> {
+///
+/// The lines between two dividers are contiguous in `text`, so each segment
+/// is a trimmed slice of it; nothing is copied until chunks are built.
+fn telegram_message_segments(text: &str) -> Vec<&str> {
     let mut segments = Vec::new();
-    let mut current = Vec::new();
+    let mut segment_start = 0;
+    let mut offset = 0;
     let mut in_code_block = false;
-    for line in text.lines() {
+    for raw in text.split_inclusive('\n') {
+        let line_start = offset;
+        offset += raw.len();
+        let line = raw.strip_suffix('\n').unwrap_or(raw);
+        let line = line.strip_suffix('\r').unwrap_or(line);
         if line.trim_start().starts_with("```") {
             in_code_block = !in_code_block;
-            current.push(line);
             continue;
         }
         if !in_code_block && is_divider_line(line) {
-            push_segment(&mut segments, &mut current);
-            continue;
+            push_segment(&mut segments, &text[segment_start..line_start]);
+            segment_start = offset;
         }
-        current.push(line);
     }
-    push_segment(&mut segments, &mut current);
+    push_segment(&mut segments, &text[segment_start..]);
     if segments.is_empty() && !text.trim().is_empty() {
-        segments.push(text.trim().to_string());
+        segments.push(text.trim());
     }
     segments
 }
@@ -301,12 +307,11 @@ fn is_divider_line(line: &str) -> bool {
     trimmed.len() >= 3 && trimmed.chars().all(|c| c == '-')
 }
 
-fn push_segment(out: &mut Vec<String>, buffer: &mut Vec<&str>) {
-    let joined = buffer.join("\n").trim().to_string();
-    if !joined.is_empty() {
-        out.push(joined);
+fn push_segment<'a>(out: &mut Vec<&'a str>, segment: &'a str) {
+    let segment = segment.trim();
+    if !segment.is_empty() {
+        out.push(segment);
     }
-    buffer.clear();
 }
 
 #[cfg(test)]
@@ -12,7 +12,6 @@
 //! redirect URI is on console.anthropic.com — same model as the
 //! Python predecessor and the upstream Claude Code CLI.
 
-use std::fs;
 use std::io::{self, BufRead, Write};
 use std::path::Path;
 use std::time::{Duration, SystemTime, UNIX_EPOCH};
@@ -25,11 +24,16 @@ use sha2::{Digest, Sha256};
 
 use crate::llm::client::{
     ANTHROPIC_OAUTH_CLIENT_ID, ANTHROPIC_OAUTH_TOKEN_URL, anthropic_oauth_token_file,
+    oauth_http_client,
 };
+use crate::llm::oauth_env::write_private_file_atomically;
 
 const AUTHORIZE_URL: &str = "https://claude.ai/oauth/authorize";
 const REDIRECT_URI: &str = "https://console.anthropic.com/oauth/code/callback";
 const SCOPES: &str = "org:create_api_key user:profile user:inference user:sessions:claude_code";
+/// Per-request cap for the login exchange; the shared OAuth client's own
+/// timeout is sized for long completions.
+const LOGIN_REQUEST_TIMEOUT: Duration = Duration::from_secs(60);
 
 pub async fn run_device_login() -> Result<()> {
     println!();
@@ -52,10 +56,10 @@ pub async fn run_device_login() -> Result<()> {
     }
 
     println!("Exchanging code for tokens...");
-    let http = reqwest::Client::builder()
-        .timeout(Duration::from_secs(60))
-        .build()
-        .context("building HTTP client for Anthropic OAuth")?;
+    // The pooled client the OAuth transport refreshes tokens with, so the
+    // connection to the token endpoint is shared rather than handshaken anew.
+    let http = oauth_http_client()
+        .ok_or_else(|| anyhow!("building HTTP client for Anthropic OAuth failed"))?;
     let token_data = exchange_authorization_code(&http, code, &verifier)
         .await
         .context("token exchange")?;
@@ -95,16 +99,21 @@ pub async fn run_device_login() -> Result<()> {
 
 fn generate_pkce() -> (String, String) {
     // RFC 7636: code_verifier is 43-128 chars of unreserved URL-safe
-    // characters. We use 32 random bytes → base64url → ~43 chars.
+    // characters. We use 32 random bytes → base64url → exactly 43 chars.
     let mut bytes = [0u8; 32];
     rand::rng().fill(&mut bytes);
     let verifier = base64::engine::general_purpose::URL_SAFE_NO_PAD.encode(bytes);
-    let mut hasher = Sha256::new();
-    hasher.update(verifier.as_bytes());
-    let challenge = base64::engine::general_purpose::URL_SAFE_NO_PAD.encode(hasher.finalize());
+    let challenge = pkce_challenge(&verifier);
     (verifier, challenge)
 }
 
+/// S256 challenge: unpadded base64url of the verifier's SHA-256. The digest
+/// is hashed from the verifier's bytes in one shot and encoded straight to
+/// its 43 chars — no padding is ever produced, so there is nothing to strip.
+fn pkce_challenge(verifier: &str) -> String {
+    base64::engine::general_purpose::URL_SAFE_NO_PAD.encode(Sha256::digest(verifier.as_bytes()))
+}
+
 fn build_authorize_url(verifier: &str, challenge: &str) -> String {
     // Matches the Python predecessor's params (oauth_login_anthropic.py).
     // `state` is the verifier itself so the user can paste either `code`
@@ -132,13 +141,7 @@ async fn exchange_authorization_code(
     code: &str,
     verifier: &str,
 ) -> Result<Value> {
-    // The Anthropic console redirect appends `#<state>` to the code on
-    // some browsers; the Python predecessor split on `#` and forwarded
-    // both halves. Mirror that.
-    let (auth_code, state) = match code.split_once('#') {
-        Some((c, s)) => (c.trim(), Some(s.trim())),
-        None => (code, None),
-    };
+    let (auth_code, state) = split_pasted_code(code);
 
     let mut body = serde_json::Map::new();
     body.insert("code".into(), Value::String(auth_code.to_string()));
@@ -160,6 +163,7 @@ async fn exchange_authorization_code(
 
     let response = http
         .post(ANTHROPIC_OAUTH_TOKEN_URL)
+        .timeout(LOGIN_REQUEST_TIMEOUT)
         .json(&Value::Object(body))
         .send()
         .await?;
@@ -176,19 +180,39 @@ async fn exchange_authorization_code(
         .with_context(|| format!("invalid token response JSON: {}", truncate_err(&text)))
 }
 
-fn write_token_file(path: &Path, payload: &Value) -> Result<()> {
-    let Some(parent) = path.parent() else {
-        bail!("token path has no parent: {}", path.display());
-    };
-    fs::create_dir_all(parent)?;
-    let text = serde_json::to_string_pretty(payload)?;
-    fs::write(path, text)?;
-    #[cfg(unix)]
-    {
-        use std::os::unix::fs::PermissionsExt;
-        fs::set_permissions(path, fs::Permissions::from_mode(0o600))?;
+/// Split what the user pasted into the authorization code and its state.
+///
+/// The Anthropic console redirect appends `#<state>` to the code on some
+/// browsers; the Python predecessor split on `#` and forwarded both halves.
+/// Users also paste the whole callback URL out of the address bar, so when a
+/// query string is present `code`/`state` are picked straight out of it by
+/// slicing — no full parse or percent-decode of the line (both values are
+/// URL-safe tokens).
+fn split_pasted_code(input: &str) -> (&str, Option<&str>) {
+    let input = input.trim();
+    if let Some((_, query)) = input.split_once('?') {
+        let query = query.split('#').next().unwrap_or_default();
+        let mut code = None;
+        let mut state = None;
+        for pair in query.split('&') {
+            match pair.split_once('=') {
+                Some(("code", value)) => code = Some(value),
+                Some(("state", value)) => state = Some(value),
+                _ => {}
+            }
+        }
+        if let Some(code) = code {
+            return (code, state);
+        }
+    }
+    match input.split_once('#') {
+        Some((c, s)) => (c.trim(), Some(s.trim())),
+        None => (input, None),
     }
-    Ok(())
+}
+
+fn write_token_file(path: &Path, payload: &Value) -> Result<()> {
+    write_private_file_atomically(path, &serde_json::to_vec_pretty(payload)?)
 }
 
 fn url_encode(value: &str) -> String {
@@ -272,6 +296,16 @@ mod tests {
         assert_eq!(challenge, expected);
     }
 
+    #[test]
+    fn pkce_challenge_is_unpadded_base64url_sha256() {
+        assert_eq!(
+            pkce_challenge("dBjftJeZ4CVP-mJ92K9XQqSHsJMa4WgXcs0YHUMMQ9k"),
+            "kN8H-Cw5k7i8Pc_Kj6tT_RGLaYCuiMKizjJrOX_Q_ug"
+        );
+        let (verifier, challenge) = generate_pkce();
+        assert_eq!((verifier.len(), challenge.len()), (43, 43));
+    }
+
     #[test]
     fn authorize_url_contains_required_params() {
         let url = build_authorize_url("verifier-xyz", "challenge-abc");
@@ -285,6 +319,24 @@ mod tests {
         assert!(url.contains("scope=org%3Acreate_api_key"));
     }
 
+    #[test]
+    fn pasted_code_accepts_bare_hashed_and_callback_url_forms() {
+        assert_eq!(split_pasted_code(" abc "), ("abc", None));
+        assert_eq!(split_pasted_code("abc#xyz"), ("abc", Some("xyz")));
+        assert_eq!(
+            split_pasted_code(
+                "https://console.anthropic.com/oauth/code/callback?code=abc&state=xyz"
+            ),
+            ("abc", Some("xyz"))
+        );
+        assert_eq!(
+            split_pasted_code(
+                "https://console.anthropic.com/oauth/code/callback?state=xyz&code=abc#frag"
+            ),
+            ("abc", Some("xyz"))
+        );
+    }
+
     #[test]
     fn url_encode_handles_reserved_and_unreserved_chars() {
         assert_eq!(url_encode("abc-XYZ_0.9~"), "abc-XYZ_0.9~");
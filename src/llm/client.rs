@@ -1,8 +1,8 @@
 use std::env;
 use std::fs;
 use std::path::{Path, PathBuf};
-use std::sync::Arc;
-use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, OnceLock, PoisonError};
 use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use anyhow::{Context, Result, anyhow, bail};
@@ -42,6 +42,12 @@ const ANTHROPIC_MESSAGES_URL: &str = "https://api.anthropic.com/v1/messages";
 pub(crate) const ANTHROPIC_OAUTH_CLIENT_ID: &str = "9d1c250a-e61b-44d9-88ed-5944d1962f5e";
 const CLAUDE_CODE_VERSION: &str = "2.1.117";
 const CLAUDE_CODE_SALT: &str = "59cf53e54c78";
+/// OAuth access tokens closer than this to expiry (seconds) are refreshed
+/// inline before the request is sent.
+pub(crate) const OAUTH_EXPIRY_MARGIN_SECS: f64 = 60.0;
+/// OAuth access tokens closer than this to expiry (seconds) are refreshed in
+/// the background while the current token is still used.
+pub(crate) const OAUTH_PROACTIVE_REFRESH_SECS: f64 = 360.0;
 static LLM_DEBUG_SEQUENCE: AtomicU64 = AtomicU64::new(0);
 
 #[derive(Clone, Copy, Debug, Eq, PartialEq, Serialize, Deserialize)]
@@ -612,6 +618,8 @@ struct AnthropicOAuthClient {
     tokens: Arc<Mutex<AnthropicOAuthTokens>>,
     request_gate: Arc<Semaphore>,
     rate_limit_until: Arc<Mutex<Option<Instant>>>,
+    background_refresh: Arc<AtomicBool>,
+    refresh_lock: Arc<Mutex<()>>,
 }
 
 #[derive(Clone, Debug, Default, Serialize, Deserialize)]
@@ -639,10 +647,49 @@ enum AnthropicOAuthError {
     Other(#[from] anyhow::Error),
 }
 
+/// Identifies the credentials an OAuth client was loaded from: the token file,
+/// its modification time and length, and the `*_AUTH_TOKEN` override, if any.
+/// The file stamp makes a `lethe login` after a revocation, or a refresh-token
+/// rotation written by another process, reload the client on the next router
+/// rebuild instead of serving the cached tokens forever.
+pub(crate) type OAuthSourceKey = (PathBuf, Option<(SystemTime, u64)>, Option<String>);
+
+pub(crate) fn oauth_source_key(token_file: PathBuf, env_token_var: &str) -> OAuthSourceKey {
+    let stamp = fs::metadata(&token_file)
+        .ok()
+        .and_then(|metadata| Some((metadata.modified().ok()?, metadata.len())));
+    (token_file, stamp, env::var(env_token_var).ok())
+}
+
 impl AnthropicOAuthClient {
+    /// Returns the process-wide client for the current credentials. The router
+    /// is rebuilt on model switches and in several CLI paths; handing back the
+    /// same client keeps the token state, concurrency gate and rate-limit
+    /// backoff instead of re-reading the token file and starting over. Only a
+    /// successful load is cached, and the key carries the token file's stamp,
+    /// so a login made after startup (or tokens rotated by another process)
+    /// is picked up.
     fn from_env() -> Option<Self> {
-        let token_file = anthropic_oauth_token_file();
-        let tokens = if let Ok(access_token) = env::var("ANTHROPIC_AUTH_TOKEN") {
+        static SHARED: OnceLock<std::sync::Mutex<Option<(OAuthSourceKey, AnthropicOAuthClient)>>> =
+            OnceLock::new();
+        let key = oauth_source_key(anthropic_oauth_token_file(), "ANTHROPIC_AUTH_TOKEN");
+        let mut shared = SHARED
+            .get_or_init(Default::default)
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if let Some((cached_key, client)) = shared.as_ref()
+            && *cached_key == key
+        {
+            return Some(client.clone());
+        }
+        let client = Self::load(&key)?;
+        *shared = Some((key, client.clone()));
+        Some(client)
+    }
+
+    fn load((token_file, _, env_token): &OAuthSourceKey) -> Option<Self> {
+        let token_file = token_file.clone();
+        let tokens = if let Some(access_token) = env_token {
             let access_token = access_token.trim().to_string();
             if access_token.is_empty() {
                 None
@@ -658,14 +705,13 @@ impl AnthropicOAuthClient {
         }?;
 
         Some(Self {
-            http: reqwest::Client::builder()
-                .timeout(Duration::from_secs(600))
-                .build()
-                .ok()?,
+            http: oauth_http_client()?,
             token_file,
             tokens: Arc::new(Mutex::new(tokens)),
             request_gate: Arc::new(Semaphore::new(oauth_max_concurrency())),
             rate_limit_until: Arc::new(Mutex::new(None)),
+            background_refresh: Arc::new(AtomicBool::new(false)),
+            refresh_lock: Arc::new(Mutex::new(())),
         })
     }
 
@@ -955,10 +1001,44 @@ impl AnthropicOAuthClient {
         Ok(state.into_response())
     }
 
+    /// Makes sure the access token is usable for the next request. Inside the
+    /// proactive window the still-valid token is used as-is and the refresh
+    /// runs on a background task, so the reply that crossed the boundary does
+    /// not wait on the token endpoint; only an (almost) expired token is
+    /// refreshed inline.
     async fn ensure_access(&self) -> Result<(), AnthropicOAuthError> {
+        let expired = {
+            let tokens = self.tokens.lock().await;
+            if tokens.env_access_token || !tokens.expires_within(OAUTH_PROACTIVE_REFRESH_SECS) {
+                return Ok(());
+            }
+            tokens.needs_refresh()
+        };
+        if expired {
+            return self.refresh(OAUTH_EXPIRY_MARGIN_SECS).await;
+        }
+        if !self.background_refresh.swap(true, Ordering::AcqRel) {
+            let client = self.clone();
+            tokio::spawn(async move {
+                if let Err(error) = client.refresh(OAUTH_PROACTIVE_REFRESH_SECS).await {
+                    tracing::warn!("background OAuth token refresh failed: {error}");
+                }
+                client.background_refresh.store(false, Ordering::Release);
+            });
+        }
+        Ok(())
+    }
+
+    /// Refreshes the token if it still expires within `within_secs` once the
+    /// refresh lock is held. Concurrent callers queue on the lock and then
+    /// find the token already renewed, so a burst of requests at the expiry
+    /// boundary sends one refresh instead of racing on the rotating refresh
+    /// token.
+    async fn refresh(&self, within_secs: f64) -> Result<(), AnthropicOAuthError> {
+        let _refreshing = self.refresh_lock.lock().await;
         let refresh_token = {
             let tokens = self.tokens.lock().await;
-            if tokens.env_access_token || !tokens.needs_refresh() {
+            if !tokens.expires_within(within_secs) {
                 return Ok(());
             }
             tokens.refresh_token.clone()
@@ -1046,16 +1126,54 @@ impl AnthropicOAuthClient {
 
 impl AnthropicOAuthTokens {
     fn needs_refresh(&self) -> bool {
+        self.expires_within(OAUTH_EXPIRY_MARGIN_SECS)
+    }
+
+    /// Whether a refreshable token expires within `secs` seconds.
+    fn expires_within(&self, secs: f64) -> bool {
         let Some(refresh_token) = &self.refresh_token else {
             return false;
         };
         if refresh_token.trim().is_empty() {
             return false;
         }
-        self.expires_at.unwrap_or(0.0) <= unix_now_seconds() + 60.0
+        self.expires_at.unwrap_or(0.0) <= unix_now_seconds() + secs
     }
 }
 
+/// Process-wide pooled HTTP client behind every genai `Client`. The router is
+/// rebuilt on model switches and a few CLI paths build their own; sharing the
+/// connection pool means those rebuilds reuse warm TLS connections to the
+/// provider instead of handshaking again. No overall timeout, matching
+/// genai's default client (long streamed replies must not be cut off).
+fn shared_llm_http() -> reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT
+        .get_or_init(|| {
+            reqwest::Client::builder()
+                .tcp_keepalive(Duration::from_secs(60))
+                .build()
+                .unwrap_or_default()
+        })
+        .clone()
+}
+
+/// Pooled HTTP client shared by the Anthropic and OpenAI OAuth transports
+/// (same reuse rationale as [`shared_llm_http`], with their 10-minute
+/// request timeout). `None` if the TLS backend failed to initialise.
+pub(crate) fn oauth_http_client() -> Option<reqwest::Client> {
+    static CLIENT: OnceLock<Option<reqwest::Client>> = OnceLock::new();
+    CLIENT
+        .get_or_init(|| {
+            reqwest::Client::builder()
+                .timeout(Duration::from_secs(600))
+                .tcp_keepalive(Duration::from_secs(60))
+                .build()
+                .ok()
+        })
+        .clone()
+}
+
 fn build_client(config: &LlmRouterConfig) -> Client {
     let resolver_config = config.clone();
     let target_resolver = ServiceTargetResolver::from_resolver_fn(
@@ -1068,6 +1186,7 @@ fn build_client(config: &LlmRouterConfig) -> Client {
         },
     );
     Client::builder()
+        .with_reqwest(shared_llm_http())
         .with_service_target_resolver(target_resolver)
         .build()
 }
@@ -1238,6 +1357,11 @@ fn llm_debug_request_payload(
     request: &ChatRequest,
     options: &ChatOptions,
 ) -> Value {
+    // Serializing the whole request is the expensive part; skip it unless
+    // `log_llm_interaction` will actually write it out.
+    if !llm_debug_enabled() {
+        return Value::Null;
+    }
     json!({
         "auth": auth,
         "model": model,
@@ -1280,28 +1404,37 @@ pub(crate) fn log_llm_interaction(label: &str, model: &str, request: Value, resp
     }
 }
 
+/// Checked before every model request. Cached on first use: the env (incl.
+/// the config `.env`, loaded by `Settings::from_env` at startup) is fixed by
+/// the time the first request goes out.
 fn llm_debug_enabled() -> bool {
-    env::var("LLM_DEBUG")
-        .map(|value| {
-            matches!(
-                value.to_ascii_lowercase().as_str(),
-                "1" | "true" | "yes" | "on"
-            )
-        })
-        .unwrap_or(false)
+    static ENABLED: OnceLock<bool> = OnceLock::new();
+    *ENABLED.get_or_init(|| {
+        env::var("LLM_DEBUG")
+            .map(|value| {
+                matches!(
+                    value.to_ascii_lowercase().as_str(),
+                    "1" | "true" | "yes" | "on"
+                )
+            })
+            .unwrap_or(false)
+    })
 }
 
-fn llm_debug_dir() -> PathBuf {
-    if let Some(path) = env::var_os("LLM_DEBUG_DIR") {
-        return PathBuf::from(path);
-    }
-    if let Some(path) = env::var_os("LOGS_DIR") {
-        return PathBuf::from(path).join("llm");
-    }
-    if let Some(path) = env::var_os("LETHE_HOME") {
-        return PathBuf::from(path).join("logs").join("llm");
-    }
-    PathBuf::from("logs").join("llm")
+fn llm_debug_dir() -> &'static Path {
+    static DIR: OnceLock<PathBuf> = OnceLock::new();
+    DIR.get_or_init(|| {
+        if let Some(path) = env::var_os("LLM_DEBUG_DIR") {
+            return PathBuf::from(path);
+        }
+        if let Some(path) = env::var_os("LOGS_DIR") {
+            return PathBuf::from(path).join("llm");
+        }
+        if let Some(path) = env::var_os("LETHE_HOME") {
+            return PathBuf::from(path).join("logs").join("llm");
+        }
+        PathBuf::from("logs").join("llm")
+    })
 }
 
 fn should_use_anthropic_oauth(model: &str, config: &LlmRouterConfig) -> bool {
@@ -1391,11 +1524,12 @@ fn auth_mode_for_model(model: &str, config: &LlmRouterConfig) -> String {
     }
 }
 
+/// Goes through the shared client rather than parsing the token file again:
+/// once credentials have loaded, availability checks and router builds reuse
+/// the in-memory state (expiry is kept as epoch seconds, so checking it is a
+/// float compare); the file is only stat'ed, and re-read once it changes.
 pub fn anthropic_oauth_available() -> bool {
-    env::var("ANTHROPIC_AUTH_TOKEN")
-        .map(|token| !token.trim().is_empty())
-        .unwrap_or(false)
-        || read_anthropic_oauth_tokens(&anthropic_oauth_token_file()).is_some()
+    AnthropicOAuthClient::from_env().is_some()
 }
 
 pub(crate) fn anthropic_oauth_token_file() -> PathBuf {
@@ -1413,8 +1547,8 @@ pub(crate) fn anthropic_oauth_token_file() -> PathBuf {
 }
 
 fn read_anthropic_oauth_tokens(path: &Path) -> Option<AnthropicOAuthTokens> {
-    let text = fs::read_to_string(path).ok()?;
-    let mut tokens: AnthropicOAuthTokens = serde_json::from_str(&text).ok()?;
+    let bytes = fs::read(path).ok()?;
+    let mut tokens: AnthropicOAuthTokens = serde_json::from_slice(&bytes).ok()?;
     tokens.env_access_token = false;
     tokens
         .access_token
@@ -1424,21 +1558,7 @@ fn read_anthropic_oauth_tokens(path: &Path) -> Option<AnthropicOAuthTokens> {
 }
 
 fn write_anthropic_oauth_tokens(path: &Path, tokens: &AnthropicOAuthTokens) -> Result<()> {
-    let Some(parent) = path.parent() else {
-        bail!(
-            "Anthropic OAuth token path has no parent: {}",
-            path.display()
-        );
-    };
-    fs::create_dir_all(parent)?;
-    let text = serde_json::to_string_pretty(tokens)?;
-    fs::write(path, text)?;
-    #[cfg(unix)]
-    {
-        use std::os::unix::fs::PermissionsExt;
-        fs::set_permissions(path, fs::Permissions::from_mode(0o600))?;
-    }
-    Ok(())
+    crate::llm::oauth_env::write_private_file_atomically(path, &serde_json::to_vec_pretty(tokens)?)
 }
 
 fn oauth_max_concurrency() -> usize {
@@ -2401,6 +2521,45 @@ fn into_message_content(content: String, attachments: Vec<LlmAttachment>) -> Mes
 mod tests {
     use super::*;
 
+    #[test]
+    fn proactive_refresh_window_precedes_hard_expiry() {
+        let tokens = AnthropicOAuthTokens {
+            access_token: Some("access".to_string()),
+            refresh_token: Some("refresh".to_string()),
+            expires_at: Some(unix_now_seconds() + 180.0),
+            env_access_token: false,
+        };
+        // Inside the proactive window but still usable: refreshed in the
+        // background, not inline.
+        assert!(tokens.expires_within(OAUTH_PROACTIVE_REFRESH_SECS));
+        assert!(!tokens.needs_refresh());
+
+        let without_refresh_token = AnthropicOAuthTokens {
+            refresh_token: None,
+            ..tokens
+        };
+        assert!(!without_refresh_token.expires_within(OAUTH_PROACTIVE_REFRESH_SECS));
+    }
+
+    #[test]
+    fn oauth_source_key_changes_when_the_token_file_is_rewritten() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("tokens.json");
+        let missing = oauth_source_key(path.clone(), "LETHE_TEST_UNSET_AUTH_TOKEN");
+        assert_eq!(missing.1, None);
+
+        fs::write(&path, "{\"access_token\":\"a\"}").unwrap();
+        let first = oauth_source_key(path.clone(), "LETHE_TEST_UNSET_AUTH_TOKEN");
+        assert_ne!(first, missing);
+        assert_eq!(
+            oauth_source_key(path.clone(), "LETHE_TEST_UNSET_AUTH_TOKEN"),
+            first
+        );
+
+        fs::write(&path, "{\"access_token\":\"rotated\"}").unwrap();
+        assert_ne!(oauth_source_key(path, "LETHE_TEST_UNSET_AUTH_TOKEN"), first);
+    }
+
     #[test]
     fn aux_model_falls_back_to_main_model() {
         let config = LlmRouterConfig {
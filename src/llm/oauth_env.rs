@@ -11,6 +11,7 @@ use std::env;
 use std::fs;
 use std::io::{self, BufRead, Write};
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
 
 use anyhow::{Context, Result, anyhow, bail};
 
@@ -380,20 +381,60 @@ pub fn env_file_path() -> PathBuf {
 }
 
 fn write_env_atomically(path: &Path, body: &str) -> Result<()> {
-    let parent = path
-        .parent()
-        .ok_or_else(|| anyhow!(".env path has no parent: {}", path.display()))?;
+    write_private_file_atomically(path, body.as_bytes())
+}
+
+/// Write an owner-only file (the .env, OAuth token files) through a temp
+/// sibling and a rename. A crash mid-write leaves the previous file intact;
+/// a truncated token file would otherwise read as "not logged in" and force
+/// a full re-login. The temp file is created owner-only rather than chmod'ed
+/// afterwards, so the secret never sits in a file other users can read.
+pub(crate) fn write_private_file_atomically(path: &Path, bytes: &[u8]) -> Result<()> {
+    write_file_atomically(path, bytes, 0o600).with_context(|| format!("writing {}", path.display()))
+}
+
+/// Replace `path` with `bytes` via a synced temp sibling created with `mode`
+/// (before umask; ignored off Unix) and a rename, removing the temp file if
+/// any step fails. Readers see the old file or the new one, never a partial
+/// write.
+pub(crate) fn write_file_atomically(path: &Path, bytes: &[u8], mode: u32) -> io::Result<()> {
+    static NEXT_TEMP: AtomicU64 = AtomicU64::new(0);
+    let parent = path.parent().ok_or_else(|| {
+        io::Error::new(
+            io::ErrorKind::InvalidInput,
+            format!("path has no parent: {}", path.display()),
+        )
+    })?;
     fs::create_dir_all(parent)?;
-    let temp = parent.join(format!(".env.lethe-login.{}.tmp", std::process::id()));
-    fs::write(&temp, body).with_context(|| format!("writing {}", temp.display()))?;
+    // Unique per call, not just per process: two writers in one process
+    // (say a token refresh racing a login) must not share a temp file.
+    let mut temp_name = path.file_name().unwrap_or_default().to_os_string();
+    temp_name.push(format!(
+        ".lethe.{}.{}.tmp",
+        std::process::id(),
+        NEXT_TEMP.fetch_add(1, Ordering::Relaxed)
+    ));
+    let temp = parent.join(temp_name);
+    let written = write_new_file(&temp, bytes, mode).and_then(|()| fs::rename(&temp, path));
+    if written.is_err() {
+        let _ = fs::remove_file(&temp);
+    }
+    written
+}
+
+fn write_new_file(path: &Path, bytes: &[u8], mode: u32) -> io::Result<()> {
+    let mut options = fs::OpenOptions::new();
+    options.write(true).create_new(true);
     #[cfg(unix)]
     {
-        use std::os::unix::fs::PermissionsExt;
-        let _ = fs::set_permissions(&temp, fs::Permissions::from_mode(0o600));
+        use std::os::unix::fs::OpenOptionsExt;
+        options.mode(mode);
     }
-    fs::rename(&temp, path)
-        .with_context(|| format!("promoting {} → {}", temp.display(), path.display()))?;
-    Ok(())
+    #[cfg(not(unix))]
+    let _ = mode;
+    let mut file = options.open(path)?;
+    file.write_all(bytes)?;
+    file.sync_all()
 }
 
 #[cfg(test)]
@@ -556,4 +597,25 @@ TELEGRAM_BOT_TOKEN=tg
         assert!(rewritten.contains("\nLLM_PROVIDER=openrouter\n"));
         assert!(rewritten.contains("\nOPENROUTER_API_KEY=sk-or-new\n"));
     }
+
+    #[test]
+    fn private_file_replaces_previous_contents_without_leftovers() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("credentials").join("tokens.json");
+        write_private_file_atomically(&path, b"{\"access_token\":\"old\"}").unwrap();
+        write_private_file_atomically(&path, b"{\"access_token\":\"new\"}").unwrap();
+
+        assert_eq!(
+            std::fs::read_to_string(&path).unwrap(),
+            "{\"access_token\":\"new\"}"
+        );
+        let entries = std::fs::read_dir(path.parent().unwrap()).unwrap().count();
+        assert_eq!(entries, 1);
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::PermissionsExt;
+            let mode = std::fs::metadata(&path).unwrap().permissions().mode();
+            assert_eq!(mode & 0o777, 0o600);
+        }
+    }
 }
@@ -15,7 +15,8 @@
 use std::env;
 use std::fs;
 use std::path::{Path, PathBuf};
-use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, OnceLock, PoisonError};
 use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use anyhow::{Context, Result, anyhow, bail};
@@ -36,7 +37,10 @@ use thiserror::Error;
 use tokio::sync::{Mutex, Semaphore};
 use uuid::Uuid;
 
-use crate::llm::client::DeltaCallback;
+use crate::llm::client::{
+    DeltaCallback, OAUTH_EXPIRY_MARGIN_SECS, OAUTH_PROACTIVE_REFRESH_SECS, OAuthSourceKey,
+    oauth_source_key,
+};
 
 // --- Endpoints / constants ---------------------------------------------------
 
@@ -52,6 +56,9 @@ const OPENAI_DEVICE_REDIRECT_URI: &str = "https://auth.openai.com/deviceauth/cal
 const DEFAULT_INSTRUCTIONS: &str = "You are Lethe, a helpful and precise assistant.";
 const DEVICE_AUTH_TIMEOUT_SECS: u64 = 900;
 const DEVICE_POLL_SAFETY_MARGIN_SECS: u64 = 3;
+/// Per-request cap for the device-login calls; the shared OAuth client's own
+/// timeout is sized for long completions.
+const LOGIN_REQUEST_TIMEOUT: Duration = Duration::from_secs(60);
 const JWT_ACCOUNT_PATH: &str = "https://api.openai.com/auth";
 
 // --- Client ------------------------------------------------------------------
@@ -63,6 +70,8 @@ pub struct OpenAiOAuthClient {
     tokens: Arc<Mutex<OpenAiOAuthTokens>>,
     request_gate: Arc<Semaphore>,
     rate_limit_until: Arc<Mutex<Option<Instant>>>,
+    background_refresh: Arc<AtomicBool>,
+    refresh_lock: Arc<Mutex<()>>,
 }
 
 #[derive(Clone, Debug, Default, Serialize, Deserialize)]
@@ -92,9 +101,30 @@ enum OpenAiOAuthError {
 }
 
 impl OpenAiOAuthClient {
+    /// Returns the process-wide client for the current credentials, so router
+    /// rebuilds share token state, the concurrency gate and rate-limit backoff
+    /// (see `AnthropicOAuthClient::from_env`).
     pub fn from_env() -> Option<Self> {
-        let token_file = openai_oauth_token_file();
-        let tokens = if let Ok(access_token) = env::var("OPENAI_AUTH_TOKEN") {
+        static SHARED: OnceLock<std::sync::Mutex<Option<(OAuthSourceKey, OpenAiOAuthClient)>>> =
+            OnceLock::new();
+        let key = oauth_source_key(openai_oauth_token_file(), "OPENAI_AUTH_TOKEN");
+        let mut shared = SHARED
+            .get_or_init(Default::default)
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if let Some((cached_key, client)) = shared.as_ref()
+            && *cached_key == key
+        {
+            return Some(client.clone());
+        }
+        let client = Self::load(&key)?;
+        *shared = Some((key, client.clone()));
+        Some(client)
+    }
+
+    fn load((token_file, _, env_token): &OAuthSourceKey) -> Option<Self> {
+        let token_file = token_file.clone();
+        let tokens = if let Some(access_token) = env_token {
             let access_token = access_token.trim().to_string();
             if access_token.is_empty() {
                 None
@@ -114,14 +144,13 @@ impl OpenAiOAuthClient {
         }?;
 
         Some(Self {
-            http: reqwest::Client::builder()
-                .timeout(Duration::from_secs(600))
-                .build()
-                .ok()?,
+            http: crate::llm::client::oauth_http_client()?,
             token_file,
             tokens: Arc::new(Mutex::new(tokens)),
             request_gate: Arc::new(Semaphore::new(oauth_max_concurrency())),
             rate_limit_until: Arc::new(Mutex::new(None)),
+            background_refresh: Arc::new(AtomicBool::new(false)),
+            refresh_lock: Arc::new(Mutex::new(())),
         })
     }
 
@@ -409,10 +438,44 @@ impl OpenAiOAuthClient {
         openai_response_to_chat_response(data, model).map_err(Into::into)
     }
 
+    /// Makes sure the access token is usable for the next request. Inside the
+    /// proactive window the still-valid token is used as-is and the refresh
+    /// runs on a background task, so the reply that crossed the boundary does
+    /// not wait on the token endpoint; only an (almost) expired token is
+    /// refreshed inline.
     async fn ensure_access(&self) -> Result<(), OpenAiOAuthError> {
+        let expired = {
+            let tokens = self.tokens.lock().await;
+            if tokens.env_access_token || !tokens.expires_within(OAUTH_PROACTIVE_REFRESH_SECS) {
+                return Ok(());
+            }
+            tokens.needs_refresh()
+        };
+        if expired {
+            return self.refresh(OAUTH_EXPIRY_MARGIN_SECS).await;
+        }
+        if !self.background_refresh.swap(true, Ordering::AcqRel) {
+            let client = self.clone();
+            tokio::spawn(async move {
+                if let Err(error) = client.refresh(OAUTH_PROACTIVE_REFRESH_SECS).await {
+                    tracing::warn!("background OAuth token refresh failed: {error}");
+                }
+                client.background_refresh.store(false, Ordering::Release);
+            });
+        }
+        Ok(())
+    }
+
+    /// Refreshes the token if it still expires within `within_secs` once the
+    /// refresh lock is held. Concurrent callers queue on the lock and then
+    /// find the token already renewed, so a burst of requests at the expiry
+    /// boundary sends one refresh instead of racing on the rotating refresh
+    /// token.
+    async fn refresh(&self, within_secs: f64) -> Result<(), OpenAiOAuthError> {
+        let _refreshing = self.refresh_lock.lock().await;
         let refresh_token = {
             let tokens = self.tokens.lock().await;
-            if tokens.env_access_token || !tokens.needs_refresh() {
+            if !tokens.expires_within(within_secs) {
                 return Ok(());
             }
             tokens.refresh_token.clone()
@@ -504,13 +567,18 @@ impl OpenAiOAuthClient {
 
 impl OpenAiOAuthTokens {
     fn needs_refresh(&self) -> bool {
+        self.expires_within(OAUTH_EXPIRY_MARGIN_SECS)
+    }
+
+    /// Whether a refreshable token expires within `secs` seconds.
+    fn expires_within(&self, secs: f64) -> bool {
         let Some(refresh_token) = &self.refresh_token else {
             return false;
         };
         if refresh_token.trim().is_empty() {
             return false;
         }
-        self.expires_at.unwrap_or(0.0) <= unix_now_seconds() + 60.0
+        self.expires_at.unwrap_or(0.0) <= unix_now_seconds() + secs
     }
 }
 
@@ -1301,8 +1369,8 @@ pub fn openai_oauth_token_file() -> PathBuf {
 }
 
 fn read_openai_oauth_tokens(path: &Path) -> Option<OpenAiOAuthTokens> {
-    let text = fs::read_to_string(path).ok()?;
-    let mut tokens: OpenAiOAuthTokens = serde_json::from_str(&text).ok()?;
+    let bytes = fs::read(path).ok()?;
+    let mut tokens: OpenAiOAuthTokens = serde_json::from_slice(&bytes).ok()?;
     tokens.env_access_token = false;
     tokens
         .access_token
@@ -1312,25 +1380,12 @@ fn read_openai_oauth_tokens(path: &Path) -> Option<OpenAiOAuthTokens> {
 }
 
 fn write_openai_oauth_tokens(path: &Path, tokens: &OpenAiOAuthTokens) -> Result<()> {
-    let Some(parent) = path.parent() else {
-        bail!("OpenAI OAuth token path has no parent: {}", path.display());
-    };
-    fs::create_dir_all(parent)?;
-    let text = serde_json::to_string_pretty(tokens)?;
-    fs::write(path, text)?;
-    #[cfg(unix)]
-    {
-        use std::os::unix::fs::PermissionsExt;
-        fs::set_permissions(path, fs::Permissions::from_mode(0o600))?;
-    }
-    Ok(())
+    crate::llm::oauth_env::write_private_file_atomically(path, &serde_json::to_vec_pretty(tokens)?)
 }
 
+/// Answered from the shared client, like `anthropic_oauth_available`.
 pub fn openai_oauth_available() -> bool {
-    env::var("OPENAI_AUTH_TOKEN")
-        .map(|token| !token.trim().is_empty())
-        .unwrap_or(false)
-        || read_openai_oauth_tokens(&openai_oauth_token_file()).is_some()
+    OpenAiOAuthClient::from_env().is_some()
 }
 
 // --- Device-code login flow --------------------------------------------------
@@ -1347,10 +1402,10 @@ pub fn openai_oauth_available() -> bool {
 /// callers that want LLM_PROVIDER set automatically should call
 /// `update_env_for_openai_oauth` after this returns.
 pub async fn run_device_login() -> Result<()> {
-    let http = reqwest::Client::builder()
-        .timeout(Duration::from_secs(60))
-        .build()
-        .context("building HTTP client for OpenAI device flow")?;
+    // The pooled client the OAuth transport refreshes tokens with: the
+    // device-flow polls and the code exchange all reuse one warm connection.
+    let http = crate::llm::client::oauth_http_client()
+        .ok_or_else(|| anyhow!("building HTTP client for OpenAI device flow failed"))?;
 
     println!();
     println!("OpenAI OAuth login (ChatGPT Plus/Pro Codex)");
@@ -1460,6 +1515,7 @@ pub async fn run_device_login() -> Result<()> {
 async fn start_device_flow(http: &reqwest::Client) -> Result<Value> {
     let response = http
         .post(OPENAI_DEVICE_USERCODE_URL)
+        .timeout(LOGIN_REQUEST_TIMEOUT)
         .header("content-type", "application/json")
         .header("user-agent", "lethe-oauth-login")
         .json(&json!({"client_id": OPENAI_OAUTH_CLIENT_ID}))
@@ -1489,6 +1545,7 @@ async fn poll_for_authorization_code(
     loop {
         let response = http
             .post(OPENAI_DEVICE_TOKEN_URL)
+            .timeout(LOGIN_REQUEST_TIMEOUT)
             .header("content-type", "application/json")
             .header("user-agent", "lethe-oauth-login")
             .json(&json!({
@@ -1539,6 +1596,7 @@ async fn exchange_authorization_code(
     ];
     let response = http
         .post(OPENAI_OAUTH_TOKEN_URL)
+        .timeout(LOGIN_REQUEST_TIMEOUT)
         .header("content-type", "application/x-www-form-urlencoded")
         .form(&form)
         .send()
@@ -1,6 +1,8 @@
 use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
+use std::time::SystemTime;
 
 use serde::{Deserialize, Serialize};
 
@@ -36,20 +38,19 @@ impl PromptStore {
     pub fn load(&self, name: &str, fallback: &str) -> PromptTemplate {
         let file_name = prompt_file_name(name);
         for candidate in self.candidate_paths(&file_name) {
-            if let Ok(text) = fs::read_to_string(&candidate) {
-                let trimmed = text.trim().to_string();
-                if !trimmed.is_empty() {
-                    let source = if candidate.starts_with(self.workspace_dir.join("prompts")) {
-                        PromptSource::Workspace(candidate)
-                    } else {
-                        PromptSource::Config(candidate)
-                    };
-                    return PromptTemplate {
-                        name: name.to_string(),
-                        source,
-                        text: trimmed,
-                    };
-                }
+            if let Some(trimmed) = read_prompt_file(&candidate)
+                && !trimmed.is_empty()
+            {
+                let source = if candidate.starts_with(self.workspace_dir.join("prompts")) {
+                    PromptSource::Workspace(candidate)
+                } else {
+                    PromptSource::Config(candidate)
+                };
+                return PromptTemplate {
+                    name: name.to_string(),
+                    source,
+                    text: trimmed,
+                };
             }
         }
 
@@ -75,8 +76,8 @@ impl PromptStore {
         fallback: &str,
     ) -> PromptTemplate {
         let mut template = self.load(name, fallback);
-        for (key, value) in variables {
-            template.text = template.text.replace(&format!("{{{key}}}"), value);
+        if !variables.is_empty() {
+            template.text = substitute(&template.text, variables);
         }
         template
     }
@@ -93,6 +94,55 @@ impl PromptStore {
     }
 }
 
+/// Trimmed contents of a prompt override file, or `None` if it can't be
+/// read. Cached process-wide by path and keyed on (mtime, size), so the
+/// many prompt builds per turn (one per actor) cost a `stat` instead of a
+/// read, while edits to the file still show up on the next load.
+fn read_prompt_file(path: &Path) -> Option<String> {
+    static CACHE: OnceLock<Mutex<HashMap<PathBuf, (SystemTime, u64, String)>>> = OnceLock::new();
+    let metadata = fs::metadata(path).ok()?;
+    let stamp = (metadata.modified().ok()?, metadata.len());
+    let cache = CACHE.get_or_init(Mutex::default);
+    if let Ok(cache) = cache.lock()
+        && let Some((modified, len, text)) = cache.get(path)
+        && (*modified, *len) == stamp
+    {
+        return Some(text.clone());
+    }
+    let text = fs::read_to_string(path).ok()?.trim().to_string();
+    if let Ok(mut cache) = cache.lock() {
+        cache.insert(path.to_path_buf(), (stamp.0, stamp.1, text.clone()));
+    }
+    Some(text)
+}
+
+/// Fill `{name}` slots in one pass over the template, instead of a full
+/// `replace` (and a fresh copy of the text) per variable. Braces that don't
+/// enclose a known variable — JSON examples, `{{`-escaped text — are kept
+/// as-is, and substituted values are never themselves rescanned.
+fn substitute(template: &str, variables: &HashMap<String, String>) -> String {
+    let mut out = String::with_capacity(template.len());
+    let mut rest = template;
+    while let Some(open) = rest.find('{') {
+        out.push_str(&rest[..open]);
+        let after = &rest[open + 1..];
+        // Stop at the next brace of either kind so a stray `{` never scans
+        // the rest of the template.
+        if let Some(close) = after.find(['{', '}'])
+            && after[close..].starts_with('}')
+            && let Some(value) = variables.get(&after[..close])
+        {
+            out.push_str(value);
+            rest = &after[close + 1..];
+        } else {
+            out.push('{');
+            rest = after;
+        }
+    }
+    out.push_str(rest);
+    out
+}
+
 fn prompt_file_name(name: &str) -> String {
     if Path::new(name).extension().is_some() {
         name.to_string()
@@ -220,6 +270,25 @@ mod tests {
         assert!(matches!(prompt.source, PromptSource::Workspace(_)));
     }
 
+    #[test]
+    fn cached_prompt_file_picks_up_edits() {
+        let tmp = tempdir().unwrap();
+        let workspace = tmp.path().join("workspace");
+        fs::create_dir_all(workspace.join("prompts")).unwrap();
+        let path = workspace.join("prompts/example.md");
+        fs::write(&path, "first").unwrap();
+
+        let store = PromptStore::new(&workspace, tmp.path().join("config"));
+        assert_eq!(store.load("example", "fallback").text, "first");
+        assert_eq!(store.load("example", "fallback").text, "first");
+
+        // Different length, so the edit is seen even within one mtime tick.
+        fs::write(&path, "second version").unwrap();
+        assert_eq!(store.load("example", "fallback").text, "second version");
+        fs::remove_file(&path).unwrap();
+        assert_eq!(store.load("example", "fallback").text, "fallback");
+    }
+
     #[test]
     fn embedded_prompt_allows_single_binary_startup() {
         let tmp = tempdir().unwrap();
@@ -244,4 +313,21 @@ mod tests {
 
         assert_eq!(prompt.text, "hello lethe");
     }
+
+    #[test]
+    fn render_leaves_unknown_braces_and_values_untouched() {
+        let mut variables = HashMap::new();
+        variables.insert("signal".to_string(), "{context}".to_string());
+        variables.insert("context".to_string(), "recent".to_string());
+
+        let rendered = substitute(
+            "{{\"send\": true}} {signal} / {context} {missing} {",
+            &variables,
+        );
+
+        assert_eq!(
+            rendered,
+            "{{\"send\": true}} {context} / recent {missing} {"
+        );
+    }
 }
@@ -51,6 +51,56 @@ fn collect_message_values(values: &[Value]) -> Vec<String> {
         .collect()
 }
 
+/// First balanced `{...}` in `text` that parses as a JSON object. Models wrap
+/// their JSON in prose or code fences; tracking brace depth outside string
+/// literals finds the object in one pass and copes with nested objects and
+/// with braces in the surrounding text, where slicing from the first `{` to
+/// the last `}` swallowed trailing prose and failed to parse.
+pub fn first_json_object(text: &str) -> Option<Value> {
+    let mut from = 0;
+    while let Some(offset) = text[from..].find('{') {
+        let open = from + offset;
+        if let Some(close) = balanced_object_end(text.as_bytes(), open)
+            && let Ok(value @ Value::Object(_)) = serde_json::from_str(&text[open..=close])
+        {
+            return Some(value);
+        }
+        from = open + 1;
+    }
+    None
+}
+
+/// Index of the `}` closing the object opened at `open`. Works on bytes: the
+/// delimiters are ASCII and never occur inside a multi-byte UTF-8 sequence.
+fn balanced_object_end(bytes: &[u8], open: usize) -> Option<usize> {
+    let mut depth = 0_usize;
+    let mut in_string = false;
+    let mut escaped = false;
+    for (index, &byte) in bytes.iter().enumerate().skip(open) {
+        if in_string {
+            match byte {
+                _ if escaped => escaped = false,
+                b'\\' => escaped = true,
+                b'"' => in_string = false,
+                _ => {}
+            }
+            continue;
+        }
+        match byte {
+            b'"' => in_string = true,
+            b'{' => depth += 1,
+            b'}' => {
+                depth -= 1;
+                if depth == 0 {
+                    return Some(index);
+                }
+            }
+            _ => {}
+        }
+    }
+    None
+}
+
 fn strip_json_code_fence(text: &str) -> String {
     let Some(rest) = text.strip_prefix("```") else {
         return text.to_string();
@@ -87,4 +137,16 @@ mod tests {
             vec!["one", "two"]
         );
     }
+
+    #[test]
+    fn first_json_object_skips_surrounding_prose_and_string_braces() {
+        let text = r#"Sure! {"send": true, "meta": {"note": "a } in text"}} Hope that helps {:"#;
+        let value = first_json_object(text).unwrap();
+        assert_eq!(value["send"], true);
+        assert_eq!(value["meta"]["note"], "a } in text");
+
+        let value = first_json_object("use {braces} then {\"ok\": 1}").unwrap();
+        assert_eq!(value["ok"], 1);
+        assert!(first_json_object("no object {here").is_none());
+    }
 }
@@ -197,8 +197,10 @@ pub fn truncate_with_ellipsis(value: &str, max_chars: usize) -> String {
     if max_chars == 0 {
         return String::new();
     }
-    let total_chars = value.chars().count();
-    if total_chars <= max_chars {
+    // Previews are taken of whole tool outputs and memory blocks, so only
+    // walk as far as the limit and slice the prefix by byte offset instead
+    // of counting and re-collecting every char.
+    if char_boundary(value, max_chars).is_none() {
         return value.to_string();
     }
     let ellipsis_chars = ELLIPSIS.chars().count();
@@ -206,12 +208,20 @@ pub fn truncate_with_ellipsis(value: &str, max_chars: usize) -> String {
         return ELLIPSIS.chars().take(max_chars).collect();
     }
     let budget = max_chars - ellipsis_chars;
-    let prefix: String = value.chars().take(budget).collect();
+    let prefix = &value[..char_boundary(value, budget).unwrap_or(value.len())];
     let trimmed = match prefix.rfind(char::is_whitespace) {
-        Some(idx) if idx >= prefix.len() / 2 => prefix[..idx].trim_end().to_string(),
+        Some(idx) if idx >= prefix.len() / 2 => prefix[..idx].trim_end(),
         _ => prefix,
     };
-    format!("{trimmed}{ELLIPSIS}")
+    let mut output = String::with_capacity(trimmed.len() + ELLIPSIS.len());
+    output.push_str(trimmed);
+    output.push_str(ELLIPSIS);
+    output
+}
+
+/// Byte offset of the `n`th char, or `None` if `value` has at most `n` chars.
+fn char_boundary(value: &str, n: usize) -> Option<usize> {
+    value.char_indices().nth(n).map(|(index, _)| index)
 }
 
 pub fn format_truncation_notice(
@@ -408,6 +418,19 @@ mod tests {
         assert!(notice.contains("/tmp/output.log"));
     }
 
+    #[test]
+    fn ellipsis_truncation_counts_chars_not_bytes() {
+        assert_eq!(truncate_with_ellipsis("short", 5), "short");
+        assert_eq!(truncate_with_ellipsis("🎉🎉🎉", 3), "🎉🎉🎉");
+        assert_eq!(truncate_with_ellipsis("🎉🎉🎉🎉", 3), "🎉🎉…");
+        assert_eq!(
+            truncate_with_ellipsis("hello brave new world", 14),
+            "hello brave…"
+        );
+        assert_eq!(truncate_with_ellipsis("abc", 1), "…");
+        assert_eq!(truncate_with_ellipsis("abc", 0), "");
+    }
+
     #[test]
     fn utf8_tail_truncation_does_not_break_characters() {
         let content = format!("{}{}", "x".repeat(100), "🎉".repeat(100));
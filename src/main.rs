@@ -1,11 +1,12 @@
-use anyhow::Result;
+use anyhow::{Context as _, Result};
 use clap::{CommandFactory, Parser, Subcommand};
 use lethe::config::{RuntimeMode, Settings};
 use lethe::tools::shell::DEFAULT_TIMEOUT_SECONDS;
 use std::fs::{File, OpenOptions};
 use std::io::{self, Write};
 use std::path::PathBuf;
-use std::sync::{Arc, Mutex};
+use std::sync::mpsc::{self, SyncSender};
+use std::time::Duration;
 use tracing_subscriber::EnvFilter;
 
 mod cli;
@@ -782,24 +783,41 @@ pub enum HeartbeatCommand {
     },
 }
 
-#[tokio::main]
-async fn main() -> Result<()> {
+fn main() -> Result<()> {
     // Parse before loading settings so a global `--config` can redirect
     // where `Settings::from_env` reads the `.env` from.
     let cli = Cli::parse();
     if let Some(path) = &cli.config {
-        // SAFETY: single-threaded startup, before any tasks are spawned.
+        // SAFETY: still single-threaded — the runtime (and its worker
+        // threads) is only built below.
         unsafe { std::env::set_var("LETHE_CONFIG_FILE", path) };
     }
+    // Built by hand rather than via `#[tokio::main]` so the env mutation
+    // above really happens before any worker thread exists, and so the
+    // workers carry a name in profiles and thread dumps.
+    tokio::runtime::Builder::new_multi_thread()
+        .enable_all()
+        .thread_name("lethe-worker")
+        .build()
+        .context("failed to start the async runtime")?
+        .block_on(run(cli))
+}
 
+async fn run(cli: Cli) -> Result<()> {
     let settings = Settings::from_env();
     // Debug-level so one-shot CLI commands (status, completions, identity)
     // stay quiet on stderr; bump RUST_LOG=debug to see it.
-    if let Some(log_path) = init_logging(&settings) {
-        tracing::debug!(path = %log_path.display(), "logging initialized");
-    } else {
-        tracing::debug!("logging initialized without file output");
-    }
+    // Held for the whole run: dropping it drains queued log lines on exit.
+    let _log_flush = match init_logging(&settings) {
+        Some((log_path, flush)) => {
+            tracing::debug!(path = %log_path.display(), "logging initialized");
+            Some(flush)
+        }
+        None => {
+            tracing::debug!("logging initialized without file output");
+            None
+        }
+    };
     let command = match cli.command {
         Some(command) => command,
         // Bare `lethe` in CLI mode is a fast status view (no live probes);
@@ -935,33 +953,38 @@ async fn main() -> Result<()> {
     }
 }
 
+/// Log lines queued for the writer thread before logging call sites block.
+/// Backpressure under a log storm, rather than an unbounded queue.
+const LOG_QUEUE_CAPACITY: usize = 8_192;
+/// Upper bound on waiting for queued log lines to be written at exit.
+const LOG_FLUSH_TIMEOUT: Duration = Duration::from_secs(2);
+
+enum LogMessage {
+    Line(Vec<u8>),
+    Flush(mpsc::Sender<()>),
+}
+
+/// Hands formatted lines to a dedicated writer thread, so stderr and log-file
+/// I/O never run on (and stall) the async runtime's worker threads.
 #[derive(Clone)]
 struct LogWriter {
-    file: Arc<Mutex<File>>,
+    queue: SyncSender<LogMessage>,
 }
 
 struct LogLineWriter {
-    file: Arc<Mutex<File>>,
+    queue: SyncSender<LogMessage>,
 }
 
 impl Write for LogLineWriter {
     fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
-        let _ = io::stderr().write_all(buf);
-        let mut file = self
-            .file
-            .lock()
-            .map_err(|_| io::Error::other("log file lock poisoned"))?;
-        file.write_all(buf)?;
+        self.queue
+            .send(LogMessage::Line(buf.to_vec()))
+            .map_err(|_| io::Error::other("log writer thread stopped"))?;
         Ok(buf.len())
     }
 
     fn flush(&mut self) -> io::Result<()> {
-        let _ = io::stderr().flush();
-        let mut file = self
-            .file
-            .lock()
-            .map_err(|_| io::Error::other("log file lock poisoned"))?;
-        file.flush()
+        Ok(())
     }
 }
 
@@ -970,12 +993,54 @@ impl<'writer> tracing_subscriber::fmt::MakeWriter<'writer> for LogWriter {
 
     fn make_writer(&'writer self) -> Self::Writer {
         LogLineWriter {
-            file: self.file.clone(),
+            queue: self.queue.clone(),
+        }
+    }
+}
+
+/// Waits (bounded) for the writer thread to drain the queue when dropped, so
+/// the last lines before exit — often the interesting ones — are not lost.
+struct LogFlushGuard {
+    queue: SyncSender<LogMessage>,
+}
+
+impl Drop for LogFlushGuard {
+    fn drop(&mut self) {
+        let (done, flushed) = mpsc::channel();
+        if self.queue.send(LogMessage::Flush(done)).is_ok() {
+            let _ = flushed.recv_timeout(LOG_FLUSH_TIMEOUT);
         }
     }
 }
 
-fn init_logging(settings: &Settings) -> Option<PathBuf> {
+fn spawn_log_writer(mut file: File) -> io::Result<(LogWriter, LogFlushGuard)> {
+    let (queue, messages) = mpsc::sync_channel(LOG_QUEUE_CAPACITY);
+    std::thread::Builder::new()
+        .name("lethe-log".to_string())
+        .spawn(move || {
+            for message in messages {
+                match message {
+                    LogMessage::Line(line) => {
+                        let _ = io::stderr().write_all(&line);
+                        let _ = file.write_all(&line);
+                    }
+                    LogMessage::Flush(done) => {
+                        let _ = io::stderr().flush();
+                        let _ = file.flush();
+                        let _ = done.send(());
+                    }
+                }
+            }
+        })?;
+    Ok((
+        LogWriter {
+            queue: queue.clone(),
+        },
+        LogFlushGuard { queue },
+    ))
+}
+
+fn init_logging(settings: &Settings) -> Option<(PathBuf, LogFlushGuard)> {
     let filter = || EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("info"));
     if let Err(error) = std::fs::create_dir_all(&settings.paths.logs_dir) {
         eprintln!(
@@ -1006,19 +1071,29 @@ fn init_logging(settings: &Settings) -> Option<PathBuf> {
         }
     };
 
+    let (writer, flush) = match spawn_log_writer(file) {
+        Ok(spawned) => spawned,
+        Err(error) => {
+            eprintln!("logging_file_unavailable: cannot start log writer: {error}");
+            let _ = tracing_subscriber::fmt()
+                .with_env_filter(filter())
+                .with_target(true)
+                .with_ansi(false)
+                .try_init();
+            return None;
+        }
+    };
     if let Err(error) = tracing_subscriber::fmt()
         .with_env_filter(filter())
         .with_target(true)
         .with_ansi(false)
-        .with_writer(LogWriter {
-            file: Arc::new(Mutex::new(file)),
-        })
+        .with_writer(writer)
         .try_init()
     {
         eprintln!("logging_setup_failed: {error}");
         return None;
     }
-    Some(log_path)
+    Some((log_path, flush))
 }
 
 /// Fast, side-effect-free status view: version, the resolved config path,
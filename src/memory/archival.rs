@@ -9,7 +9,9 @@ use thiserror::Error;
 use uuid::Uuid;
 
 use super::db::{MemoryDb, MemoryKind, MemoryRow, NewMemoryRow};
-use super::search::{clean_tags, indent_block, query_terms, search_result_text, tags_match_any};
+use super::search::{
+    clean_tags, indent_block, keep_top, query_terms, search_result_text, tags_match_any,
+};
 
 const SEARCH_RESULT_MAX_LINES: usize = 50;
 
@@ -135,25 +137,42 @@ impl ArchivalMemory {
         let query = query.trim();
         let limit = if limit == 0 { 10 } else { limit };
         let terms = query_terms(query);
+        // Lowered once here rather than inside the scorer for every candidate.
+        let query_lower = query.to_ascii_lowercase();
         let tag_filter = clean_tags(tags.unwrap_or_default());
         let mut merged: HashMap<String, ArchivalEntry> = HashMap::new();
 
-        for row in self.db.list_kind(MemoryKind::Archival)? {
+        // The vector leg (query embedding + KNN) is independent of the
+        // lexical scan, so it runs on its own thread while the scan proceeds.
+        let (lexical, vector) = std::thread::scope(|scope| {
+            let vector = (!query.is_empty()).then(|| {
+                scope.spawn(|| {
+                    self.db
+                        .vector_search(MemoryKind::Archival, query, limit * 3)
+                })
+            });
+            let lexical = self.db.list_kind(MemoryKind::Archival);
+            let vector = vector.map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            });
+            (lexical, vector)
+        });
+
+        for row in lexical? {
             let mut entry = ArchivalEntry::from_row(row);
             if !tags_match_any(&entry.tags, &tag_filter) {
                 continue;
             }
-            entry.score = score_entry(query, &terms, &entry);
+            entry.score = score_entry(&query_lower, &terms, &entry);
             if terms.is_empty() || entry.score > 0.0 {
                 merged.insert(entry.id.clone(), entry);
             }
         }
 
-        if !query.is_empty() {
-            match self
-                .db
-                .vector_search(MemoryKind::Archival, query, limit * 3)
-            {
+        if let Some(vector) = vector {
+            match vector {
                 Ok(scored_rows) => {
                     for scored in scored_rows {
                         let mut entry = ArchivalEntry::from_row(scored.row);
@@ -173,10 +192,14 @@ impl ArchivalMemory {
             }
         }
 
-        let mut entries = merged.into_values().collect::<Vec<_>>();
-        entries.sort_by(compare_entries);
-        entries.truncate(limit);
-        Ok(entries)
+        // Each candidate's timestamp is parsed once here rather than on both
+        // sides of every comparison the ranking makes.
+        let mut ranked = merged
+            .into_values()
+            .map(|entry| (parse_time(&entry.created_at), entry))
+            .collect::<Vec<_>>();
+        keep_top(&mut ranked, limit, compare_ranked);
+        Ok(ranked.into_iter().map(|(_, entry)| entry).collect())
     }
 
     pub fn get(&self, memory_id: &str) -> ArchivalResult<Option<ArchivalEntry>> {
@@ -191,6 +214,12 @@ impl ArchivalMemory {
         Ok(self.db.delete(memory_id)?)
     }
 
+    /// Batch form of [`delete`](Self::delete): one transaction instead of a
+    /// connection + commit per id. Returns the number of rows removed.
+    pub fn delete_many(&self, memory_ids: &[String]) -> ArchivalResult<usize> {
+        Ok(self.db.delete_many(memory_ids)?)
+    }
+
     pub fn update_tags(&self, memory_id: &str, tags: &[String]) -> ArchivalResult<bool> {
         Ok(self.db.update_tags(memory_id, tags)?)
     }
@@ -307,12 +336,15 @@ impl ArchivalMemory {
     }
 }
 
-fn compare_entries(left: &ArchivalEntry, right: &ArchivalEntry) -> Ordering {
+type RankedEntry = (Option<DateTime<Utc>>, ArchivalEntry);
+
+/// Best score first, then newest, then id.
+fn compare_ranked((left_time, left): &RankedEntry, (right_time, right): &RankedEntry) -> Ordering {
     right
         .score
         .partial_cmp(&left.score)
         .unwrap_or(Ordering::Equal)
-        .then_with(|| parse_time(&right.created_at).cmp(&parse_time(&left.created_at)))
+        .then_with(|| right_time.cmp(left_time))
         .then_with(|| left.id.cmp(&right.id))
 }
 
@@ -322,17 +354,28 @@ fn parse_time(value: &str) -> Option<DateTime<Utc>> {
         .map(|time| time.with_timezone(&Utc))
 }
 
-fn score_entry(query: &str, terms: &[String], entry: &ArchivalEntry) -> f64 {
+fn score_entry(query_lower: &str, terms: &[String], entry: &ArchivalEntry) -> f64 {
     if terms.is_empty() {
         return 1.0;
     }
-    let query_lower = query.to_ascii_lowercase();
     let text_lower = entry.text.to_ascii_lowercase();
-    let tags_lower = entry.tags.join(" ").to_ascii_lowercase();
-    let metadata_lower = entry.metadata.to_string().to_ascii_lowercase();
+    // Joined/serialised strings are fresh allocations: lowercase in place.
+    let mut tags_lower = entry.tags.join(" ");
+    tags_lower.make_ascii_lowercase();
+    // Most entries carry no metadata; skip serialising an empty `{}` just to
+    // search it.
+    let metadata_lower = entry
+        .metadata
+        .as_object()
+        .is_none_or(|map| !map.is_empty())
+        .then(|| {
+            let mut text = entry.metadata.to_string();
+            text.make_ascii_lowercase();
+            text
+        });
     let mut score = 0.0;
 
-    if !query_lower.is_empty() && text_lower.contains(&query_lower) {
+    if !query_lower.is_empty() && text_lower.contains(query_lower) {
         score += 5.0;
     }
     for term in terms {
@@ -342,7 +385,10 @@ fn score_entry(query: &str, terms: &[String], entry: &ArchivalEntry) -> f64 {
         } else if tags_lower.contains(term) {
             score += 1.5;
         }
-        if metadata_lower.contains(term) {
+        if metadata_lower
+            .as_deref()
+            .is_some_and(|metadata| metadata.contains(term))
+        {
             score += 1.0;
         }
     }
@@ -381,6 +427,13 @@ mod tests {
 
         assert!(memory.delete(&second).unwrap());
         assert_eq!(memory.count().unwrap(), 1);
+
+        let third = memory.add("third entry", None, &[]).unwrap();
+        let removed = memory
+            .delete_many(&[first, third, "missing".to_string()])
+            .unwrap();
+        assert_eq!(removed, 2);
+        assert_eq!(memory.count().unwrap(), 0);
     }
 
     #[test]
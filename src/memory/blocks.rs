@@ -5,6 +5,8 @@ use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
+use crate::llm::oauth_env::write_file_atomically;
+
 pub const DEFAULT_BLOCK_LIMIT: usize = 20_000;
 
 #[derive(Debug, Error)]
@@ -147,32 +149,32 @@ impl BlockManager {
         }
         enforce_limit(value, limit)?;
 
-        fs::write(block_path, value)?;
         let now = Utc::now();
-        self.save_meta(
-            label,
-            &BlockMetadata {
-                label: label.to_string(),
-                description: description.to_string(),
-                limit,
-                read_only,
-                hidden,
-                stable: false,
-                created_at: Some(now),
-                updated_at: Some(now),
-            },
-        )?;
+        let meta = BlockMetadata {
+            label: label.to_string(),
+            description: description.to_string(),
+            limit,
+            read_only,
+            hidden,
+            stable: false,
+            created_at: Some(now),
+            updated_at: Some(now),
+        };
+        // Metadata first: the value file is what makes a block exist, so a
+        // crash between the writes leaves no block (and a stray meta file the
+        // next create overwrites) rather than a block with default metadata.
+        self.write_files(vec![
+            (self.meta_path(label), serde_json::to_vec_pretty(&meta)?),
+            (block_path, value.as_bytes().to_vec()),
+        ])?;
         Ok(label.to_string())
     }
 
     pub fn get(&self, label: &str) -> MemoryResult<Option<MemoryBlock>> {
         validate_label(label)?;
-        let block_path = self.block_path(label);
-        if !block_path.exists() {
+        let Some(value) = not_found_as_none(fs::read_to_string(self.block_path(label)))? else {
             return Ok(None);
-        }
-
-        let value = fs::read_to_string(block_path)?;
+        };
         let meta = self.load_meta(label)?;
         Ok(Some(MemoryBlock {
             label: label.to_string(),
@@ -220,9 +222,10 @@ impl BlockManager {
         if !bypass_read_only && meta.read_only && value.is_some() {
             return Err(MemoryError::ReadOnly(label.to_string()));
         }
+        let mut files = Vec::with_capacity(2);
         if let Some(value) = value {
             enforce_limit(value, meta.limit)?;
-            fs::write(&block_path, value)?;
+            files.push((block_path, value.as_bytes().to_vec()));
         }
         if let Some(description) = description {
             meta.description = description.to_string();
@@ -231,7 +234,8 @@ impl BlockManager {
             meta.created_at = Some(Utc::now());
         }
         meta.updated_at = Some(Utc::now());
-        self.save_meta(label, &meta)?;
+        files.push((self.meta_path(label), serde_json::to_vec_pretty(&meta)?));
+        self.write_files(files)?;
         Ok(true)
     }
 
@@ -256,15 +260,10 @@ impl BlockManager {
 
     pub fn delete(&self, label: &str) -> MemoryResult<bool> {
         validate_label(label)?;
-        let block_path = self.block_path(label);
-        if !block_path.exists() {
+        if not_found_as_none(fs::remove_file(self.block_path(label)))?.is_none() {
             return Ok(false);
         }
-        fs::remove_file(block_path)?;
-        let meta_path = self.meta_path(label);
-        if meta_path.exists() {
-            fs::remove_file(meta_path)?;
-        }
+        not_found_as_none(fs::remove_file(self.meta_path(label)))?;
         Ok(true)
     }
 
@@ -289,6 +288,20 @@ impl BlockManager {
         Ok(blocks)
     }
 
+    /// Number of blocks, hidden ones included, without reading any of them.
+    pub fn count(&self) -> MemoryResult<usize> {
+        let mut count = 0;
+        for entry in fs::read_dir(&self.blocks_dir)? {
+            let path = entry?.path();
+            if path.extension().and_then(|ext| ext.to_str()) == Some("md")
+                && path.file_stem().and_then(|stem| stem.to_str()).is_some()
+            {
+                count += 1;
+            }
+        }
+        Ok(count)
+    }
+
     fn write_seed_if_missing(
         &self,
         label: &str,
@@ -327,14 +340,15 @@ impl BlockManager {
     }
 
     fn load_meta(&self, label: &str) -> MemoryResult<BlockMetadata> {
-        let path = self.meta_path(label);
-        if !path.exists() {
+        let Some(raw) = not_found_as_none(fs::read(self.meta_path(label)))? else {
             return Ok(BlockMetadata {
                 label: label.to_string(),
                 ..Default::default()
             });
-        }
-        let mut meta: BlockMetadata = serde_json::from_str(&fs::read_to_string(path)?)?;
+        };
+        // Parse straight from bytes: serde_json validates UTF-8 while it
+        // parses, so a separate read_to_string decode pass is wasted work.
+        let mut meta: BlockMetadata = serde_json::from_slice(&raw)?;
         if meta.label.is_empty() {
             meta.label = label.to_string();
         }
@@ -345,11 +359,39 @@ impl BlockManager {
     }
 
     fn save_meta(&self, label: &str, meta: &BlockMetadata) -> MemoryResult<()> {
-        fs::write(self.meta_path(label), serde_json::to_string_pretty(meta)?)?;
+        self.write_files(vec![(
+            self.meta_path(label),
+            serde_json::to_vec_pretty(meta)?,
+        )])
+    }
+
+    /// Replace each of a block's files atomically, in the order given: each
+    /// is written to a uniquely named, synced temp sibling and renamed into
+    /// place, so a crash leaves every file either old or new, never truncated,
+    /// and no temp file survives a failed write. The files are not replaced as
+    /// one unit: `update` writes value before metadata, so a crash between
+    /// them only leaves `updated_at` stale. The directory itself is not
+    /// synced: after power loss a rename may roll back to the previous intact
+    /// file, which is not worth an extra fsync on every block write.
+    fn write_files(&self, files: Vec<(PathBuf, Vec<u8>)>) -> MemoryResult<()> {
+        for (path, bytes) in files {
+            write_file_atomically(&path, &bytes, 0o644)?;
+        }
         Ok(())
     }
 }
 
+/// Map a NotFound I/O error to `None`. Attempting the operation and handling
+/// a missing file costs one syscall; an `exists()` probe first costs two, and
+/// races with concurrent deletes anyway.
+fn not_found_as_none<T>(result: std::io::Result<T>) -> std::io::Result<Option<T>> {
+    match result {
+        Ok(value) => Ok(Some(value)),
+        Err(error) if error.kind() == std::io::ErrorKind::NotFound => Ok(None),
+        Err(error) => Err(error),
+    }
+}
+
 fn default_limit() -> usize {
     DEFAULT_BLOCK_LIMIT
 }
@@ -426,6 +468,12 @@ mod tests {
         assert_eq!(block.value, "updated");
         assert_eq!(block.description, "about the user");
         assert_eq!(manager.list_blocks(false).unwrap().len(), 1);
+        let leftovers = fs::read_dir(tmp.path())
+            .unwrap()
+            .filter_map(Result::ok)
+            .filter(|entry| entry.path().extension().is_some_and(|ext| ext == "tmp"))
+            .count();
+        assert_eq!(leftovers, 0);
     }
 
     #[test]
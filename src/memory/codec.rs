@@ -1,17 +1,95 @@
-use std::path::Path;
+use std::ops::{Deref, DerefMut};
+use std::path::{Path, PathBuf};
+use std::sync::{Mutex, PoisonError};
 
 use rusqlite::Connection;
+use serde_json::{Map, Value};
 
 use crate::sqlite_ext;
 
 pub fn open_conn(data_path: &Path) -> rusqlite::Result<Connection> {
     sqlite_ext::register();
     let conn = Connection::open(data_path)?;
-    conn.pragma_update(None, "journal_mode", "WAL")?;
-    conn.pragma_update(None, "synchronous", "NORMAL")?;
+    sqlite_ext::configure(&conn)?;
     Ok(conn)
 }
 
+/// Idle connections kept per database. Concurrent searches check out one
+/// each; more than this would only sit open.
+const MAX_IDLE_CONNS: usize = 4;
+
+/// Reuses opened connections to one database file. Opening a connection
+/// costs a file open, schema read and the WAL pragmas; memory stores touch
+/// their database on every call, so they check a connection out here and
+/// it goes back to the pool when the guard drops.
+#[derive(Debug)]
+pub struct ConnPool {
+    data_path: PathBuf,
+    idle: Mutex<Vec<Connection>>,
+}
+
+impl ConnPool {
+    pub fn new(data_path: PathBuf) -> Self {
+        Self {
+            data_path,
+            idle: Mutex::new(Vec::new()),
+        }
+    }
+
+    pub fn get(&self) -> rusqlite::Result<PooledConn<'_>> {
+        let idle = self
+            .idle
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .pop();
+        let conn = match idle {
+            Some(conn) => conn,
+            None => open_conn(&self.data_path)?,
+        };
+        Ok(PooledConn {
+            pool: self,
+            conn: Some(conn),
+        })
+    }
+}
+
+pub struct PooledConn<'a> {
+    pool: &'a ConnPool,
+    conn: Option<Connection>,
+}
+
+impl Deref for PooledConn<'_> {
+    type Target = Connection;
+
+    fn deref(&self) -> &Connection {
+        self.conn.as_ref().expect("pooled connection taken")
+    }
+}
+
+impl DerefMut for PooledConn<'_> {
+    fn deref_mut(&mut self) -> &mut Connection {
+        self.conn.as_mut().expect("pooled connection taken")
+    }
+}
+
+impl Drop for PooledConn<'_> {
+    fn drop(&mut self) {
+        // A connection left inside a transaction (only possible after a
+        // failed rollback) is closed rather than handed to the next caller.
+        let Some(conn) = self.conn.take().filter(Connection::is_autocommit) else {
+            return;
+        };
+        let mut idle = self
+            .pool
+            .idle
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if idle.len() < MAX_IDLE_CONNS {
+            idle.push(conn);
+        }
+    }
+}
+
 pub fn ensure_parent(data_path: &Path) -> std::io::Result<()> {
     if let Some(parent) = data_path.parent() {
         std::fs::create_dir_all(parent)?;
@@ -32,3 +110,12 @@ pub fn f32_slice_as_bytes(values: &[f32]) -> &[u8] {
 pub fn semantic_score(distance: f64) -> f64 {
     1.0 / (1.0 + distance.max(0.0))
 }
+
+/// Stored metadata as a JSON object; anything unparseable or non-object
+/// reads back as `{}`. Deserialises straight into a `Map`, so a non-object
+/// column is rejected by the parser instead of being built into a `Value`
+/// and thrown away, and callers pass the column borrowed from the row so
+/// each read parses from SQLite's buffer without an owned copy.
+pub fn parse_metadata(raw: &str) -> Value {
+    Value::Object(serde_json::from_str::<Map<String, Value>>(raw).unwrap_or_default())
+}
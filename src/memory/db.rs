@@ -1,10 +1,14 @@
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 use rusqlite::{Connection, OptionalExtension, Row, params};
 use serde::{Deserialize, Serialize};
-use serde_json::{Value, json};
+use serde_json::Value;
 
-use super::codec::{ensure_parent, f32_slice_as_bytes, open_conn, parent_dir, semantic_score};
+use super::codec::{
+    ConnPool, PooledConn, ensure_parent, f32_slice_as_bytes, parent_dir, parse_metadata,
+    semantic_score,
+};
 use super::search::clean_tags;
 use super::semantic::{EmbeddingEngine, LEGACY_EMBEDDING_DIMENSIONS};
 
@@ -66,6 +70,7 @@ pub struct ScoredRow {
 pub struct MemoryDb {
     data_path: PathBuf,
     embedder: EmbeddingEngine,
+    conns: Arc<ConnPool>,
 }
 
 impl MemoryDb {
@@ -73,6 +78,7 @@ impl MemoryDb {
         let data_path = data_path.into();
         let db = Self {
             embedder: EmbeddingEngine::from_env(parent_dir(&data_path)),
+            conns: Arc::new(ConnPool::new(data_path.clone())),
             data_path,
         };
         db.ensure_schema()?;
@@ -87,6 +93,7 @@ impl MemoryDb {
         let data_path = data_path.into();
         let db = Self {
             embedder: EmbeddingEngine::with_hash_dimensions(dimensions),
+            conns: Arc::new(ConnPool::new(data_path.clone())),
             data_path,
         };
         db.ensure_schema()?;
@@ -101,8 +108,8 @@ impl MemoryDb {
         &self.embedder
     }
 
-    pub fn open_conn(&self) -> rusqlite::Result<Connection> {
-        open_conn(&self.data_path)
+    pub fn open_conn(&self) -> rusqlite::Result<PooledConn<'_>> {
+        self.conns.get()
     }
 
     fn ensure_schema(&self) -> rusqlite::Result<()> {
@@ -176,6 +183,27 @@ impl MemoryDb {
         Ok(removed > 0)
     }
 
+    /// Delete several rows in one connection and one transaction. Returns
+    /// how many memory rows were removed (unknown ids are skipped).
+    pub fn delete_many(&self, ids: &[String]) -> rusqlite::Result<usize> {
+        if ids.is_empty() {
+            return Ok(0);
+        }
+        let mut conn = self.open_conn()?;
+        let tx = conn.transaction()?;
+        let mut removed = 0;
+        {
+            let mut delete_row = tx.prepare("DELETE FROM memory WHERE id = ?")?;
+            let mut delete_vec = tx.prepare("DELETE FROM memory_vec WHERE id = ?")?;
+            for id in ids {
+                removed += delete_row.execute(params![id])?;
+                delete_vec.execute(params![id])?;
+            }
+        }
+        tx.commit()?;
+        Ok(removed)
+    }
+
     pub fn delete_by_file_path(&self, file_path: &str) -> rusqlite::Result<usize> {
         let mut conn = self.open_conn()?;
         let tx = conn.transaction()?;
@@ -357,8 +385,6 @@ pub fn row_to_memory(row: &Row<'_>) -> rusqlite::Result<MemoryRow> {
     let kind_raw: String = row.get(1)?;
     let title: Option<String> = row.get(2)?;
     let text: String = row.get(3)?;
-    let metadata_raw: String = row.get(4)?;
-    let tags_raw: String = row.get(5)?;
     let file_path: Option<String> = row.get(6)?;
     let created_at: String = row.get(7)?;
     let updated_at: Option<String> = row.get(8)?;
@@ -380,13 +406,10 @@ pub fn row_to_memory(row: &Row<'_>) -> rusqlite::Result<MemoryRow> {
         }
     };
 
-    let metadata = serde_json::from_str(&metadata_raw).unwrap_or_else(|_| json!({}));
-    let metadata = if metadata.is_object() {
-        metadata
-    } else {
-        json!({})
-    };
-    let tags: Vec<String> = serde_json::from_str(&tags_raw).unwrap_or_default();
+    // Both JSON columns parse from the borrowed row buffer.
+    let metadata = parse_metadata(row.get_ref(4)?.as_str().unwrap_or("{}"));
+    let tags: Vec<String> =
+        serde_json::from_str(row.get_ref(5)?.as_str().unwrap_or("[]")).unwrap_or_default();
 
     Ok(MemoryRow {
         id,
@@ -422,12 +445,17 @@ fn ensure_optional_columns(conn: &Connection) -> rusqlite::Result<()> {
             )?;
         }
     }
-    conn.execute(
-        &format!(
-            "CREATE INDEX IF NOT EXISTS {table}_completed_at_idx ON {table} (completed_at)",
-            table = TABLE_NAME
-        ),
-        [],
-    )?;
+    // Partial index matching `list_completed_without_summary`: only rows
+    // still waiting for a curator summary, keyed for its kind filter and
+    // completion-time order, so the oldest pending rows come straight off
+    // the index without a sort. It replaces the plain completed_at index,
+    // which nothing else queried.
+    conn.execute_batch(&format!(
+        "DROP INDEX IF EXISTS {table}_completed_at_idx;
+         CREATE INDEX IF NOT EXISTS {table}_pending_summary_idx
+             ON {table} (kind, completed_at)
+             WHERE completed_at IS NOT NULL AND completion_summary IS NULL;",
+        table = TABLE_NAME
+    ))?;
     Ok(())
 }
@@ -1,21 +1,29 @@
 use std::cmp::Ordering;
 use std::collections::{HashMap, HashSet};
+use std::fmt::Write as _;
 use std::path::PathBuf;
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::{Duration, Instant};
 
 use chrono::{DateTime, Utc};
-use rusqlite::{Connection, OptionalExtension, params};
+use rusqlite::{Connection, OptionalExtension, Transaction, TransactionBehavior, params};
 use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
 use thiserror::Error;
 use uuid::Uuid;
 
-use super::codec::{ensure_parent, f32_slice_as_bytes, open_conn, parent_dir, semantic_score};
-use super::search::{indent_block, query_terms, search_result_text};
+use super::codec::{
+    ConnPool, PooledConn, ensure_parent, f32_slice_as_bytes, parent_dir, parse_metadata,
+    semantic_score,
+};
+use super::search::{indent_block, keep_top, query_terms, search_result_text};
 use super::semantic::{EmbeddingEngine, LEGACY_EMBEDDING_DIMENSIONS};
 
 const TABLE_NAME: &str = "message_history";
 const VEC_TABLE_NAME: &str = "message_history_vec";
 const SEARCH_RESULT_MAX_LINES: usize = 50;
+/// How long a queried row count is trusted before `COUNT(*)` runs again.
+const ROW_COUNT_TTL: Duration = Duration::from_secs(60);
 
 #[derive(Debug, Error)]
 pub enum MessageHistoryError {
@@ -101,6 +109,13 @@ pub struct StoredMessage {
 pub struct MessageHistory {
     data_path: PathBuf,
     embedder: EmbeddingEngine,
+    conns: Arc<ConnPool>,
+    /// Row count and when it was last queried, kept current by this
+    /// process's own writes: the prompt's memory metadata asks for it on
+    /// every turn, and `COUNT(*)` walks the whole table. Shared across
+    /// clones; it is re-queried once older than [`ROW_COUNT_TTL`] so rows
+    /// written by another process (CLI commands) show up.
+    row_count: Arc<Mutex<Option<(usize, Instant)>>>,
 }
 
 impl MessageHistory {
@@ -117,7 +132,9 @@ impl MessageHistory {
         let data_path = data_path.into();
         let history = Self {
             embedder,
+            conns: Arc::new(ConnPool::new(data_path.clone())),
             data_path,
+            row_count: Arc::default(),
         };
         history.ensure_schema()?;
         Ok(history)
@@ -149,20 +166,21 @@ impl MessageHistory {
         let now = Utc::now().to_rfc3339();
         let vector = self.embedder.embed_document(content)?;
         let metadata_str = serde_json::to_string(&metadata)?;
+        let tool_call_id = metadata.get("tool_call_id").and_then(Value::as_str);
         let role_str = role.as_str();
 
         let mut conn = self.open_conn()?;
         let tx = conn.transaction()?;
         tx.execute(
-            "INSERT INTO message_history (id, role, content, metadata, created_at) \
-             VALUES (?, ?, ?, ?, ?)",
-            params![id, role_str, content, metadata_str, now],
+            "INSERT INTO message_history (id, role, content, metadata, tool_call_id, created_at) \
+             VALUES (?, ?, ?, ?, ?, ?)",
+            params![id, role_str, content, metadata_str, tool_call_id, now],
         )?;
         tx.execute(
             "INSERT INTO message_history_vec (id, embedding) VALUES (?, ?)",
             params![id, f32_slice_as_bytes(&vector)],
         )?;
-        tx.commit()?;
+        self.commit_counted(tx, |count| count + 1)?;
         Ok(id)
     }
 
@@ -202,44 +220,60 @@ impl MessageHistory {
     ) -> MessageHistoryResult<Vec<StoredMessage>> {
         let query = query.trim();
         let limit = if limit == 0 { 20 } else { limit };
+        if query.is_empty() {
+            return self.latest(role, limit);
+        }
         let terms = query_terms(query);
+        // Lowered once here rather than inside the scorer for every candidate.
+        let query_lower = query.to_ascii_lowercase();
         let mut merged = HashMap::new();
 
-        for mut message in self.all()? {
+        // The vector leg (query embedding + KNN) is independent of the
+        // lexical scan, so it runs on its own thread while the scan proceeds.
+        let (lexical, vector) = std::thread::scope(|scope| {
+            let vector = scope.spawn(|| self.vector_search(query, limit * 4));
+            let lexical = self.all();
+            let vector = vector
+                .join()
+                .unwrap_or_else(|panic| std::panic::resume_unwind(panic));
+            (lexical, vector)
+        });
+
+        for mut message in lexical? {
             if role.is_some_and(|role| &message.role != role) {
                 continue;
             }
-            message.score = score_message(query, &terms, &message);
+            message.score = score_message(&query_lower, &terms, &message);
             if terms.is_empty() || message.score > 0.0 {
                 merged.insert(message.id.clone(), message);
             }
         }
 
-        if !query.is_empty() {
-            match self.vector_search(query, limit * 4) {
-                Ok(messages) => {
-                    for message in messages {
-                        if role.is_some_and(|role| &message.role != role) {
-                            continue;
-                        }
-                        merged
-                            .entry(message.id.clone())
-                            .and_modify(|existing: &mut StoredMessage| {
-                                existing.score += message.score
-                            })
-                            .or_insert(message);
+        match vector {
+            Ok(messages) => {
+                for message in messages {
+                    if role.is_some_and(|role| &message.role != role) {
+                        continue;
                     }
+                    merged
+                        .entry(message.id.clone())
+                        .and_modify(|existing: &mut StoredMessage| existing.score += message.score)
+                        .or_insert(message);
                 }
-                Err(error) => {
-                    tracing::warn!("message vector search failed; using lexical results: {error}");
-                }
+            }
+            Err(error) => {
+                tracing::warn!("message vector search failed; using lexical results: {error}");
             }
         }
 
-        let mut messages = merged.into_values().collect::<Vec<_>>();
-        messages.sort_by(compare_messages);
-        messages.truncate(limit);
-        Ok(messages)
+        // Each candidate's timestamp is parsed once here rather than on both
+        // sides of every comparison the ranking makes.
+        let mut ranked = merged
+            .into_values()
+            .map(|message| (parse_time(&message.created_at), message))
+            .collect::<Vec<_>>();
+        keep_top(&mut ranked, limit, compare_ranked);
+        Ok(ranked.into_iter().map(|(_, message)| message).collect())
     }
 
     pub fn search_by_role(
@@ -285,10 +319,31 @@ impl MessageHistory {
             "DELETE FROM message_history_vec WHERE id = ?",
             params![message_id],
         )?;
-        tx.commit()?;
+        self.commit_counted(tx, |count| count.saturating_sub(removed))?;
         Ok(removed > 0)
     }
 
+    /// Delete several messages in one connection and one transaction.
+    /// Returns how many were removed (unknown ids are skipped).
+    pub fn delete_many(&self, message_ids: &[String]) -> MessageHistoryResult<usize> {
+        if message_ids.is_empty() {
+            return Ok(0);
+        }
+        let mut conn = self.open_conn()?;
+        let tx = conn.transaction()?;
+        let mut removed = 0;
+        {
+            let mut delete_row = tx.prepare("DELETE FROM message_history WHERE id = ?")?;
+            let mut delete_vec = tx.prepare("DELETE FROM message_history_vec WHERE id = ?")?;
+            for id in message_ids {
+                removed += delete_row.execute(params![id])?;
+                delete_vec.execute(params![id])?;
+            }
+        }
+        self.commit_counted(tx, |count| count.saturating_sub(removed))?;
+        Ok(removed)
+    }
+
     pub fn cleanup_search_results(
         &self,
         tool_names: Option<&[String]>,
@@ -303,13 +358,10 @@ impl MessageHistory {
                     .collect()
             });
 
-        let messages = self.all()?;
+        let conn = self.open_conn()?;
         let mut tool_call_names = HashMap::new();
-        for message in &messages {
-            if !message.role.is_assistant() {
-                continue;
-            }
-            let Some(calls) = message.metadata.get("tool_calls").and_then(Value::as_array) else {
+        for (_, metadata) in metadata_by_role(&conn, &MessageRole::Assistant)? {
+            let Some(calls) = metadata.get("tool_calls").and_then(Value::as_array) else {
                 continue;
             };
             for call in calls {
@@ -327,38 +379,74 @@ impl MessageHistory {
             }
         }
 
-        let mut deleted = 0;
-        for message in messages {
-            if !message.role.is_tool() {
-                continue;
-            }
-            let Some(call_id) = message.metadata.get("tool_call_id").and_then(Value::as_str) else {
-                continue;
-            };
-            let Some(tool_name) = tool_call_names.get(call_id) else {
-                continue;
-            };
-            if names.contains(tool_name) && self.delete(&message.id)? {
-                deleted += 1;
+        let mut to_delete = Vec::new();
+        {
+            // Tool results carry their call id in a column extracted at write
+            // time, so this pass reads no metadata JSON at all.
+            let mut stmt = conn.prepare(
+                "SELECT id, tool_call_id FROM message_history \
+                 WHERE role = ? AND tool_call_id IS NOT NULL",
+            )?;
+            let rows = stmt.query_map(params![MessageRole::Tool.as_str()], |row| {
+                Ok((row.get::<_, String>(0)?, row.get::<_, String>(1)?))
+            })?;
+            for row in rows {
+                let (id, call_id) = row?;
+                if tool_call_names
+                    .get(&call_id)
+                    .is_some_and(|tool_name| names.contains(tool_name))
+                {
+                    to_delete.push(id);
+                }
             }
         }
-        Ok(deleted)
+        drop(conn);
+        self.delete_many(&to_delete)
     }
 
     pub fn count(&self) -> MessageHistoryResult<usize> {
+        let mut cached = self
+            .row_count
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if let Some((count, loaded_at)) = *cached
+            && loaded_at.elapsed() < ROW_COUNT_TTL
+        {
+            return Ok(count);
+        }
         let conn = self.open_conn()?;
         let count: i64 =
             conn.query_row("SELECT COUNT(*) FROM message_history", [], |row| row.get(0))?;
+        *cached = Some((count as usize, Instant::now()));
         Ok(count as usize)
     }
 
+    /// Commit a write and apply its effect to the cached row count. The
+    /// count lock is held across the commit, so `count()` can't load the
+    /// table after the commit but before the adjustment and count it twice.
+    fn commit_counted(
+        &self,
+        tx: Transaction<'_>,
+        adjust: impl FnOnce(usize) -> usize,
+    ) -> MessageHistoryResult<()> {
+        let mut cached = self
+            .row_count
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        tx.commit()?;
+        if let Some((count, _)) = cached.as_mut() {
+            *count = adjust(*count);
+        }
+        Ok(())
+    }
+
     pub fn clear(&self) -> MessageHistoryResult<usize> {
         let count = self.count()?;
         let mut conn = self.open_conn()?;
         let tx = conn.transaction()?;
         tx.execute("DELETE FROM message_history", [])?;
         tx.execute("DELETE FROM message_history_vec", [])?;
-        tx.commit()?;
+        self.commit_counted(tx, |_| 0)?;
         Ok(count)
     }
 
@@ -367,18 +455,20 @@ impl MessageHistory {
         max_messages: usize,
         max_chars: usize,
     ) -> MessageHistoryResult<Vec<StoredMessage>> {
-        let messages = self.get_recent(max_messages)?;
+        let mut messages = self.get_recent(max_messages)?;
+        // Count how many of the newest messages fit, then cut the older ones
+        // off the front in place: no second list and no double reversal.
         let mut total_chars = 0;
-        let mut result = Vec::new();
-        for message in messages.into_iter().rev() {
-            let message_chars = message.content.chars().count();
-            if total_chars + message_chars > max_chars {
-                break;
-            }
-            total_chars += message_chars;
-            result.insert(0, message);
-        }
-        Ok(result)
+        let fitting = messages
+            .iter()
+            .rev()
+            .take_while(|message| {
+                total_chars += message.content.chars().count();
+                total_chars <= max_chars
+            })
+            .count();
+        messages.drain(..messages.len() - fitting);
+        Ok(messages)
     }
 
     /// Render a single stored message in full, including the entire content
@@ -409,30 +499,27 @@ impl MessageHistory {
         if messages.is_empty() {
             return "No messages found.".to_string();
         }
-        let mut lines = vec![format!("Found {} message(s):", messages.len())];
+        let mut out = format!("Found {} message(s):", messages.len());
         for message in messages {
-            let score = if message.score > 0.0 {
-                format!(" score={:.2}", message.score)
-            } else {
-                String::new()
-            };
-            lines.push(format!(
-                "\n- [{}] {} {}{}\n{}",
-                message.created_at,
-                message.role,
-                message.id,
-                score,
-                indent_block(
-                    &search_result_text(&message.content, SEARCH_RESULT_MAX_LINES),
-                    "  "
-                )
+            let _ = write!(
+                out,
+                "\n\n- [{}] {} {}",
+                message.created_at, message.role, message.id
+            );
+            if message.score > 0.0 {
+                let _ = write!(out, " score={:.2}", message.score);
+            }
+            out.push('\n');
+            out.push_str(&indent_block(
+                &search_result_text(&message.content, SEARCH_RESULT_MAX_LINES),
+                "  ",
             ));
         }
-        lines.join("\n")
+        out
     }
 
-    fn open_conn(&self) -> MessageHistoryResult<Connection> {
-        Ok(open_conn(&self.data_path)?)
+    fn open_conn(&self) -> MessageHistoryResult<PooledConn<'_>> {
+        Ok(self.conns.get()?)
     }
 
     fn ensure_schema(&self) -> MessageHistoryResult<()> {
@@ -444,10 +531,18 @@ impl MessageHistory {
                 role        TEXT NOT NULL,
                 content     TEXT NOT NULL,
                 metadata    TEXT NOT NULL DEFAULT '{{}}',
+                tool_call_id TEXT,
                 created_at  TEXT NOT NULL
             );
-            CREATE INDEX IF NOT EXISTS {table}_created_at_idx ON {table} (created_at);
-            CREATE INDEX IF NOT EXISTS {table}_role_idx ON {table} (role);
+            -- Composite indexes match the (created_at, id) ordering of the
+            -- recent-history and by-role reads, so SQLite walks the index
+            -- and stops at LIMIT instead of sorting the whole table. They
+            -- supersede the single-column indexes of older databases.
+            DROP INDEX IF EXISTS {table}_created_at_idx;
+            DROP INDEX IF EXISTS {table}_role_idx;
+            CREATE INDEX IF NOT EXISTS {table}_created_id_idx ON {table} (created_at, id);
+            CREATE INDEX IF NOT EXISTS {table}_role_created_id_idx
+                ON {table} (role, created_at, id);
             CREATE VIRTUAL TABLE IF NOT EXISTS {vec_table} USING vec0(
                 id TEXT PRIMARY KEY,
                 embedding float[{dim}]
@@ -456,6 +551,7 @@ impl MessageHistory {
             vec_table = VEC_TABLE_NAME,
             dim = LEGACY_EMBEDDING_DIMENSIONS,
         ))?;
+        ensure_tool_call_id_column(&conn)?;
         Ok(())
     }
 
@@ -472,6 +568,38 @@ impl MessageHistory {
         Ok(messages)
     }
 
+    /// Newest messages first, optionally of one role: what an empty query
+    /// ranks to (every row scores the same), read off the index instead of
+    /// scanning and scoring the whole table or embedding a blank query.
+    fn latest(
+        &self,
+        role: Option<&MessageRole>,
+        limit: usize,
+    ) -> MessageHistoryResult<Vec<StoredMessage>> {
+        let conn = self.open_conn()?;
+        let filter = if role.is_some() {
+            "WHERE role = ? "
+        } else {
+            ""
+        };
+        let mut stmt = conn.prepare(&format!(
+            "SELECT id, role, content, metadata, created_at FROM message_history \
+             {filter}ORDER BY created_at DESC, id DESC LIMIT ?"
+        ))?;
+        let limit = limit as i64;
+        let rows = match role {
+            Some(role) => stmt.query_map(params![role.as_str(), limit], row_to_message)?,
+            None => stmt.query_map(params![limit], row_to_message)?,
+        };
+        let mut messages = Vec::new();
+        for row in rows {
+            let mut message = row?;
+            message.score = 1.0;
+            messages.push(message);
+        }
+        Ok(messages)
+    }
+
     fn vector_search(&self, query: &str, limit: usize) -> MessageHistoryResult<Vec<StoredMessage>> {
         let query_vector = self.embedder.embed_query(query)?;
         let limit = limit.max(1);
@@ -500,18 +628,62 @@ impl MessageHistory {
     }
 }
 
+/// Migration for databases created before `tool_call_id` was its own
+/// column: add it and backfill it once from the stored metadata JSON. The
+/// service and a CLI command can open an unmigrated database at the same
+/// time, so the check is repeated inside an immediate (write-locked)
+/// transaction and only one of them runs the ALTER.
+fn ensure_tool_call_id_column(conn: &Connection) -> MessageHistoryResult<()> {
+    let has_column = |conn: &Connection| -> rusqlite::Result<bool> {
+        conn.prepare(&format!(
+            "SELECT 1 FROM pragma_table_info('{TABLE_NAME}') WHERE name = 'tool_call_id'"
+        ))?
+        .exists([])
+    };
+    if has_column(conn)? {
+        return Ok(());
+    }
+    let tx = Transaction::new_unchecked(conn, TransactionBehavior::Immediate)?;
+    if !has_column(&tx)? {
+        tx.execute_batch(&format!(
+            "ALTER TABLE {TABLE_NAME} ADD COLUMN tool_call_id TEXT;
+            UPDATE {TABLE_NAME}
+               SET tool_call_id = json_extract(metadata, '$.tool_call_id')
+             WHERE json_valid(metadata)
+               AND json_type(metadata, '$.tool_call_id') = 'text';"
+        ))?;
+    }
+    tx.commit()?;
+    Ok(())
+}
+
+/// `(id, metadata)` of every message with `role`, without the content
+/// column. The role filter runs in SQLite on the role index, so metadata-only
+/// scans such as `cleanup_search_results` never parse rows of other roles or
+/// read message bodies.
+fn metadata_by_role(
+    conn: &Connection,
+    role: &MessageRole,
+) -> MessageHistoryResult<Vec<(String, Value)>> {
+    let mut stmt = conn.prepare("SELECT id, metadata FROM message_history WHERE role = ?")?;
+    let rows = stmt.query_map(params![role.as_str()], |row| {
+        let id: String = row.get(0)?;
+        let metadata = parse_metadata(row.get_ref(1)?.as_str().unwrap_or("{}"));
+        Ok((id, metadata))
+    })?;
+    let mut entries = Vec::new();
+    for row in rows {
+        entries.push(row?);
+    }
+    Ok(entries)
+}
+
 fn row_to_message(row: &rusqlite::Row<'_>) -> rusqlite::Result<StoredMessage> {
     let id: String = row.get(0)?;
     let role: String = row.get(1)?;
     let content: String = row.get(2)?;
-    let metadata_raw: String = row.get(3)?;
+    let metadata = parse_metadata(row.get_ref(3)?.as_str().unwrap_or("{}"));
     let created_at: String = row.get(4)?;
-    let metadata = serde_json::from_str(&metadata_raw).unwrap_or_else(|_| json!({}));
-    let metadata = if metadata.is_object() {
-        metadata
-    } else {
-        json!({})
-    };
     Ok(StoredMessage {
         id,
         role: MessageRole::parse(&role),
@@ -522,12 +694,18 @@ fn row_to_message(row: &rusqlite::Row<'_>) -> rusqlite::Result<StoredMessage> {
     })
 }
 
-fn compare_messages(left: &StoredMessage, right: &StoredMessage) -> Ordering {
+type RankedMessage = (Option<DateTime<Utc>>, StoredMessage);
+
+/// Best score first, then newest, then id.
+fn compare_ranked(
+    (left_time, left): &RankedMessage,
+    (right_time, right): &RankedMessage,
+) -> Ordering {
     right
         .score
         .partial_cmp(&left.score)
         .unwrap_or(Ordering::Equal)
-        .then_with(|| parse_time(&right.created_at).cmp(&parse_time(&left.created_at)))
+        .then_with(|| right_time.cmp(left_time))
         .then_with(|| left.id.cmp(&right.id))
 }
 
@@ -537,16 +715,17 @@ fn parse_time(value: &str) -> Option<DateTime<Utc>> {
         .map(|time| time.with_timezone(&Utc))
 }
 
-fn score_message(query: &str, terms: &[String], message: &StoredMessage) -> f64 {
+fn score_message(query_lower: &str, terms: &[String], message: &StoredMessage) -> f64 {
     if terms.is_empty() {
         return 1.0;
     }
-    let query_lower = query.to_ascii_lowercase();
     let content_lower = message.content.to_ascii_lowercase();
-    let metadata_lower = message.metadata.to_string().to_ascii_lowercase();
+    // Serialising is already a fresh allocation: lowercase it in place.
+    let mut metadata_lower = message.metadata.to_string();
+    metadata_lower.make_ascii_lowercase();
     let mut score = 0.0;
 
-    if !query_lower.is_empty() && content_lower.contains(&query_lower) {
+    if !query_lower.is_empty() && content_lower.contains(query_lower) {
         score += 5.0;
     }
     for term in terms {
@@ -568,6 +747,7 @@ fn clean_names(names: &[String]) -> HashSet<String> {
 
 #[cfg(test)]
 mod tests {
+    use serde_json::json;
     use tempfile::tempdir;
 
     use super::*;
@@ -602,6 +782,41 @@ mod tests {
         assert_eq!(history.count().unwrap(), 0);
     }
 
+    #[test]
+    fn cached_count_follows_adds_and_deletes() {
+        let (_tmp, history) = history();
+        // Load the count first so every later write adjusts the cached value.
+        assert_eq!(history.count().unwrap(), 0);
+        let ids =
+            ["a", "b", "c"].map(|content| history.add(MessageRole::User, content, None).unwrap());
+        assert_eq!(history.count().unwrap(), 3);
+
+        assert!(history.delete(&ids[0]).unwrap());
+        assert!(!history.delete(&ids[0]).unwrap());
+        assert_eq!(history.count().unwrap(), 2);
+
+        let unknown = "msg-missing".to_string();
+        assert_eq!(history.delete_many(&[ids[1].clone(), unknown]).unwrap(), 1);
+        assert_eq!(history.count().unwrap(), 1);
+
+        // A fresh handle on the same file agrees with the cached value.
+        let reopened = MessageHistory::open_with_hash_embedder(
+            history.data_path.clone(),
+            LEGACY_EMBEDDING_DIMENSIONS,
+        )
+        .unwrap();
+        assert_eq!(reopened.count().unwrap(), 1);
+
+        // Writes through another handle (another process, in production)
+        // are picked up once the cached value expires.
+        reopened.add(MessageRole::User, "d", None).unwrap();
+        assert_eq!(history.count().unwrap(), 1);
+        if let Some(expired) = Instant::now().checked_sub(ROW_COUNT_TTL) {
+            history.row_count.lock().unwrap().as_mut().unwrap().1 = expired;
+            assert_eq!(history.count().unwrap(), 2);
+        }
+    }
+
     #[test]
     fn search_and_role_filters_rank_messages() {
         let (_tmp, history) = history();
@@ -625,7 +840,19 @@ mod tests {
         assert_eq!(assistant[0].role, MessageRole::Assistant);
 
         let users = history.get_by_role(&MessageRole::User, 10).unwrap();
-        assert_eq!(users.len(), 2);
+        assert_eq!(
+            users
+                .iter()
+                .map(|message| message.content.as_str())
+                .collect::<Vec<_>>(),
+            ["Graph API email access", "Graph tokens are in a file"]
+        );
+        let first_user = history.get_by_role(&MessageRole::User, 1).unwrap();
+        assert_eq!(first_user[0].content, "Graph API email access");
+
+        let latest_user = history.search_by_role("  ", &MessageRole::User, 1).unwrap();
+        assert_eq!(latest_user.len(), 1);
+        assert_eq!(latest_user[0].content, "Graph tokens are in a file");
     }
 
     #[test]
@@ -663,4 +890,83 @@ mod tests {
         let window = history.get_context_window(3, 10).unwrap();
         assert!(window.is_empty() || window.last().unwrap().content.len() <= 10);
     }
+
+    #[test]
+    fn caller_supplied_roles_and_ids_are_bound_not_spliced() {
+        let (_tmp, history) = history();
+        history.add(MessageRole::User, "hello", None).unwrap();
+        let injected = "' OR '1'='1";
+
+        let role = MessageRole::parse(injected);
+        assert!(history.get_by_role(&role, 10).unwrap().is_empty());
+        assert!(history.search_by_role("", &role, 10).unwrap().is_empty());
+        assert!(history.get(injected).unwrap().is_none());
+        assert!(!history.delete(injected).unwrap());
+        assert_eq!(history.count().unwrap(), 1);
+    }
+
+    #[test]
+    fn cleanup_removes_only_results_of_the_named_tools() {
+        let (_tmp, history) = history();
+        history
+            .add(
+                MessageRole::Assistant,
+                "",
+                Some(json!({ "tool_calls": [
+                    { "id": "call-search", "function": { "name": "conversation_search" } },
+                    { "id": "call-read", "function": { "name": "read_file" } },
+                ] })),
+            )
+            .unwrap();
+        history
+            .add(
+                MessageRole::Tool,
+                "old search hits",
+                Some(json!({ "tool_call_id": "call-search" })),
+            )
+            .unwrap();
+        let kept = history
+            .add(
+                MessageRole::Tool,
+                "file contents",
+                Some(json!({ "tool_call_id": "call-read" })),
+            )
+            .unwrap();
+
+        assert_eq!(history.cleanup_search_results(None).unwrap(), 1);
+        assert_eq!(history.count().unwrap(), 2);
+        assert!(history.get(&kept).unwrap().is_some());
+        assert_eq!(history.cleanup_search_results(None).unwrap(), 0);
+    }
+
+    #[test]
+    fn tool_call_id_column_is_backfilled_for_older_databases() {
+        let tmp = tempdir().unwrap();
+        let path = tmp.path().join("messages.db");
+        {
+            let conn = Connection::open(&path).unwrap();
+            conn.execute_batch(
+                r#"CREATE TABLE message_history (
+                    id TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    metadata TEXT NOT NULL DEFAULT '{}',
+                    created_at TEXT NOT NULL
+                );
+                INSERT INTO message_history VALUES
+                    ('msg-a', 'assistant', '',
+                     '{"tool_calls":[{"id":"call-1","function":{"name":"archival_search"}}]}',
+                     '2026-01-01T00:00:00Z'),
+                    ('msg-t', 'tool', 'hits', '{"tool_call_id":"call-1"}',
+                     '2026-01-01T00:00:01Z');"#,
+            )
+            .unwrap();
+        }
+
+        let history =
+            MessageHistory::open_with_hash_embedder(path, LEGACY_EMBEDDING_DIMENSIONS).unwrap();
+        assert_eq!(history.cleanup_search_results(None).unwrap(), 1);
+        assert!(history.get("msg-t").unwrap().is_none());
+        assert!(history.get("msg-a").unwrap().is_some());
+    }
 }
@@ -35,4 +35,4 @@ pub use semantic::{
     EmbeddingEngine, LEGACY_EMBEDDING_DIMENSIONS, LEGACY_EMBEDDING_MODEL, SemanticDocument,
     SemanticHit, SemanticIndexConfig, TextEmbedder,
 };
-pub use store::{MemoryStats, MemoryStore, MemoryStoreError, MemoryStoreResult};
+pub use store::{MemoryStats, MemoryStore, MemoryStoreError, MemoryStoreResult, PromptMemory};
@@ -1,6 +1,7 @@
 use std::cmp::Ordering;
 use std::collections::BTreeSet;
 use std::fs;
+use std::io::{BufRead, BufReader};
 use std::path::{Component, Path, PathBuf};
 
 use chrono::Utc;
@@ -11,7 +12,7 @@ use uuid::Uuid;
 use walkdir::WalkDir;
 
 use super::db::{MemoryDb, MemoryKind, MemoryRow, NewMemoryRow};
-use super::search::{clean_tags, query_terms};
+use super::search::{clean_tags, keep_top, query_terms};
 
 #[derive(Debug, Error)]
 pub enum NoteError {
@@ -144,8 +145,7 @@ impl NoteStore {
         let tag_filter = clean_tags(tags.unwrap_or_default());
         let mut notes = Vec::new();
         for path in self.markdown_files()? {
-            let raw = fs::read_to_string(&path)?;
-            let (meta, _) = parse_frontmatter(&raw);
+            let meta = read_frontmatter(&path)?;
             let note_tags = clean_tags(&meta.tags);
             if !tag_filter.is_empty() && !tag_filter.iter().all(|tag| note_tags.contains(tag)) {
                 continue;
@@ -168,6 +168,11 @@ impl NoteStore {
         Ok(notes)
     }
 
+    /// Number of notes, without reading any of them.
+    pub fn count(&self) -> NoteResult<usize> {
+        Ok(self.markdown_files()?.len())
+    }
+
     pub fn search(
         &self,
         query: &str,
@@ -176,6 +181,8 @@ impl NoteStore {
     ) -> NoteResult<Vec<NoteSearchResult>> {
         let query = query.trim();
         let query_terms_list = query_terms(query);
+        // Lowered once here rather than inside the scorer for every note.
+        let query_lower = query.to_ascii_lowercase();
         let tag_filter = clean_tags(tags.unwrap_or_default());
         let mut results = Vec::new();
 
@@ -194,7 +201,7 @@ impl NoteStore {
             } else {
                 meta.title
             };
-            let score = score_note(query, &query_terms_list, &title, &note_tags, &body);
+            let score = score_note(&query_lower, &query_terms_list, &title, &note_tags, &body);
             if score <= 0.0 && !query_terms_list.is_empty() {
                 continue;
             }
@@ -248,8 +255,11 @@ impl NoteStore {
             }
         }
 
-        results.sort_by(compare_search_results);
-        results.truncate(if limit == 0 { 5 } else { limit });
+        keep_top(
+            &mut results,
+            if limit == 0 { 5 } else { limit },
+            compare_search_results,
+        );
         Ok(results)
     }
 
@@ -461,22 +471,28 @@ fn compare_search_results(left: &NoteSearchResult, right: &NoteSearchResult) ->
         .then_with(|| left.title.cmp(&right.title))
 }
 
-fn score_note(query: &str, terms: &[String], title: &str, tags: &[String], body: &str) -> f64 {
+fn score_note(
+    query_lower: &str,
+    terms: &[String],
+    title: &str,
+    tags: &[String],
+    body: &str,
+) -> f64 {
     if terms.is_empty() {
         return 1.0;
     }
 
     let title_lower = title.to_ascii_lowercase();
-    let tags_lower = tags.join(" ").to_ascii_lowercase();
+    let mut tags_lower = tags.join(" ");
+    tags_lower.make_ascii_lowercase();
     let body_lower = body.to_ascii_lowercase();
-    let query_lower = query.to_ascii_lowercase();
     let mut score = 0.0;
 
     if !query_lower.is_empty() {
-        if title_lower.contains(&query_lower) {
+        if title_lower.contains(query_lower) {
             score += 8.0;
         }
-        if body_lower.contains(&query_lower) {
+        if body_lower.contains(query_lower) {
             score += 3.0;
         }
     }
@@ -549,6 +565,33 @@ pub fn parse_frontmatter(text: &str) -> (NoteMetadata, String) {
     (meta, body)
 }
 
+/// Frontmatter of a note file without reading (or UTF-8 decoding) the body.
+/// Listing only needs title/tags/created, and note bodies can be long; this
+/// stops at the closing `---` line. Same result as
+/// `parse_frontmatter(&fs::read_to_string(path)?).0`.
+pub fn read_frontmatter(path: &Path) -> NoteResult<NoteMetadata> {
+    let mut reader = BufReader::new(fs::File::open(path)?);
+    let mut header = String::new();
+    if reader.read_line(&mut header)? == 0 || !header.starts_with("---") {
+        return Ok(NoteMetadata::default());
+    }
+    let mut line = String::new();
+    loop {
+        line.clear();
+        if reader.read_line(&mut line)? == 0 {
+            return Ok(NoteMetadata::default());
+        }
+        if line.starts_with("---") {
+            break;
+        }
+        header.push_str(&line);
+    }
+    // Re-close the header so the shared parser sees the same shape it would
+    // in the full file.
+    header.push_str("---");
+    Ok(parse_frontmatter(&header).0)
+}
+
 pub fn render_frontmatter(meta: &NoteMetadata) -> String {
     format!(
         "---\ntitle: {}\ntags: [{}]\ncreated: {}\nupdated: {}\n---",
@@ -722,6 +765,14 @@ mod tests {
         assert_eq!(meta.title, "Test");
         assert_eq!(body, "Body");
 
+        let tmp = tempdir().unwrap();
+        let path = tmp.path().join("note.md");
+        let raw = "---\ntitle: Test\ntags: [skills]\n---\n\nBody\n---\nnot: header";
+        fs::write(&path, raw).unwrap();
+        assert_eq!(read_frontmatter(&path).unwrap(), parse_frontmatter(raw).0);
+        fs::write(&path, "no frontmatter\n---\n").unwrap();
+        assert_eq!(read_frontmatter(&path).unwrap(), NoteMetadata::default());
+
         let normalized = normalize_tags(
             &["Skills".to_string(), "graph-api".to_string()],
             &["skill".to_string(), "graph_api".to_string()],
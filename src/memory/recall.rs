@@ -1,3 +1,7 @@
+use std::collections::HashSet;
+use std::fmt::Write as _;
+use std::sync::OnceLock;
+
 use chrono::{DateTime, Local, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -14,13 +18,25 @@ const MAX_RECALL_LINES: usize = 500;
 const MAX_RECALL_CHARS: usize = 2_500 * 4;
 const MAX_CONVERSATION_ENTRY_CHARS: usize = 12_000;
 const MIN_SCORE_THRESHOLD: f64 = 0.3;
-const SEARCH_RESULT_SKIP_TOOLS: &[&str] = &["conversation_search", "archival_search"];
 
 const ACAUSAL_WARNING: &str = include_str!("../../config/prompts/hippocampus_acausal_warning.md");
 const NOTES_HEADER: &str = include_str!("../../config/prompts/hippocampus_notes_header.md");
 const ARCHIVAL_HEADER: &str = include_str!("../../config/prompts/hippocampus_archival_header.md");
 const CONVERSATION_HEADER: &str =
     include_str!("../../config/prompts/hippocampus_conversation_header.md");
+const RECALL_CLOSE: &str = "</associative_memory_recall>";
+
+/// Opening tag plus the acausal warning: identical on every recall, so it is
+/// built once rather than re-formatted per turn.
+fn recall_open() -> &'static str {
+    static OPEN: OnceLock<String> = OnceLock::new();
+    OPEN.get_or_init(|| {
+        format!(
+            "<associative_memory_recall reviewed=\"false\">\n{}\n\n",
+            ACAUSAL_WARNING.trim()
+        )
+    })
+}
 
 #[derive(Debug, Error)]
 pub enum HippocampusError {
@@ -73,7 +89,7 @@ impl Hippocampus {
         message: &str,
         recent_messages: &[StoredMessage],
     ) -> HippocampusResult<Option<String>> {
-        if !self.config.enabled {
+        if !self.config.enabled || is_trivial_message(message) {
             return Ok(None);
         }
 
@@ -82,27 +98,52 @@ impl Hippocampus {
             return Ok(None);
         }
 
-        let notes = store.search_notes(&query, None, 3)?;
-        let archival = store
-            .search_archival(&query, 5, None)?
+        // The three searches are independent reads, each opening its own
+        // connection, so they run side by side. Embedding the query first
+        // lets all three hit the shared query-vector cache instead of racing
+        // to run the model on the same text; a failure here just surfaces
+        // again, and is handled, inside the searches.
+        let _ = store.archival.embedder().embed_query(&query);
+        let (notes, archival, conversations) = std::thread::scope(|scope| {
+            let notes = scope.spawn(|| store.search_notes(&query, None, 3));
+            let archival = scope.spawn(|| store.search_archival(&query, 5, None));
+            let conversations = self.search_conversations(store, &query);
+            (join_search(notes), join_search(archival), conversations)
+        });
+        let notes = notes?;
+        let mut archival = archival?
             .into_iter()
             .filter(|entry| entry.score >= MIN_SCORE_THRESHOLD)
             .collect::<Vec<_>>();
-        let conversations = self.search_conversations(store, &query)?;
-
-        let Some(memories) =
-            self.format_memories(archival, conversations, notes, self.config.max_recall_lines)
-        else {
+        let mut conversations = conversations?;
+        drop_duplicate_hits(&mut archival, &mut conversations);
+
+        // The payload is capped in chars (~4 per token) after formatting;
+        // budgeting the sections against the same limit stops whole entries
+        // from being formatted only to be cut off mid-text by that cap.
+        let body_budget = self
+            .config
+            .max_recall_chars
+            .saturating_sub(recall_open().len() + RECALL_CLOSE.len());
+        let Some(memories) = self.format_memories(
+            archival,
+            conversations,
+            notes,
+            self.config.max_recall_lines,
+            body_budget,
+        ) else {
             return Ok(None);
         };
 
-        let recall = format!(
-            "<associative_memory_recall reviewed=\"false\">\n{}\n\n{}\n</associative_memory_recall>",
-            ACAUSAL_WARNING.trim(),
-            memories
-        );
+        let open = recall_open();
+        let mut recall =
+            String::with_capacity(open.len() + memories.len() + 1 + RECALL_CLOSE.len());
+        recall.push_str(open);
+        recall.push_str(&memories);
+        recall.push('\n');
+        recall.push_str(RECALL_CLOSE);
         Ok(Some(cap_recall_payload(
-            &recall,
+            recall,
             self.config.max_recall_chars,
         )))
     }
@@ -162,7 +203,8 @@ impl Hippocampus {
                 .get("name")
                 .and_then(Value::as_str)
                 .unwrap_or("");
-            if SEARCH_RESULT_SKIP_TOOLS.contains(&tool_name) {
+            // Search results are recursive bloat.
+            if matches!(tool_name, "conversation_search" | "archival_search") {
                 return None;
             }
             if message.content.chars().count() <= 2_000 {
@@ -193,18 +235,22 @@ impl Hippocampus {
         mut conversations: Vec<StoredMessage>,
         notes: Vec<NoteSearchResult>,
         max_lines: usize,
+        max_chars: usize,
     ) -> Option<String> {
         if archival.is_empty() && conversations.is_empty() && notes.is_empty() {
             return None;
         }
 
-        let mut sections = Vec::new();
+        // Sections are written straight into one buffer; each header is only
+        // emitted once its first entry fits the budget.
+        let mut out = String::new();
         let mut total_lines = 0;
+        let has_room = |lines: usize, out: &str| lines < max_lines && out.len() < max_chars;
 
         if !notes.is_empty() {
-            let mut note_lines = Vec::new();
+            let mut opened = false;
             for note in notes {
-                if total_lines >= max_lines {
+                if !has_room(total_lines, &out) {
                     break;
                 }
                 let created = if note.created.is_empty() {
@@ -265,107 +311,163 @@ impl Hippocampus {
                     )
                 };
                 total_lines += entry.lines().count();
-                note_lines.push(entry);
-            }
-            if !note_lines.is_empty() {
-                sections.push(format!(
-                    "{}\n{}",
-                    NOTES_HEADER.trim(),
-                    note_lines.join("\n")
-                ));
+                open_section(&mut out, &mut opened, NOTES_HEADER);
+                out.push('\n');
+                out.push_str(&entry);
             }
         }
 
-        archival.sort_by(|left, right| {
-            parse_created_at(&left.created_at).cmp(&parse_created_at(&right.created_at))
-        });
-        conversations.sort_by(|left, right| {
-            parse_created_at(&left.created_at).cmp(&parse_created_at(&right.created_at))
-        });
+        // Parse each timestamp once rather than twice per comparison.
+        archival.sort_by_cached_key(|entry| parse_created_at(&entry.created_at));
+        conversations.sort_by_cached_key(|message| parse_created_at(&message.created_at));
 
-        if !archival.is_empty() && total_lines < max_lines {
-            let mut archival_lines = Vec::new();
+        if !archival.is_empty() && has_room(total_lines, &out) {
+            let mut opened = false;
             for entry in archival {
-                if total_lines >= max_lines {
+                if !has_room(total_lines, &out) {
                     break;
                 }
-                let line = if let Some(completed_at) = entry.completed_at.as_deref() {
+                open_section(&mut out, &mut opened, ARCHIVAL_HEADER);
+                let created = format_created_at(&entry.created_at);
+                if let Some(completed_at) = entry.completed_at.as_deref() {
                     if let Some(summary) = entry.completion_summary.as_deref() {
-                        format!(
-                            "- [{}] id={} [DONE {}]: {}",
-                            format_created_at(&entry.created_at),
+                        let summary = summary.trim();
+                        let _ = write!(
+                            out,
+                            "\n- [{}] id={} [DONE {}]: {}",
+                            created,
                             entry.id,
                             format_created_at(completed_at),
-                            summary.trim(),
-                        )
+                            summary,
+                        );
+                        total_lines += summary.lines().count().max(1);
                     } else {
                         // Awaiting curator summary — show the full text (no
                         // mid-sentence truncation) plus the DONE marker so the
                         // model knows the thread is resolved.
-                        let text = trim_entry(&entry.text, 50);
-                        format!(
-                            "- [{}] id={} [DONE {}] (awaiting curator summary):\n{}",
-                            format_created_at(&entry.created_at),
+                        let (text, text_lines) = trim_entry(&entry.text, 50);
+                        let _ = write!(
+                            out,
+                            "\n- [{}] id={} [DONE {}] (awaiting curator summary):\n{}",
+                            created,
                             entry.id,
                             format_created_at(completed_at),
                             text,
-                        )
+                        );
+                        total_lines += text_lines + 1;
                     }
                 } else {
-                    let text = trim_entry(&entry.text, 50);
-                    format!(
-                        "- [{}] id={} {}",
-                        format_created_at(&entry.created_at),
-                        entry.id,
-                        text
-                    )
-                };
-                total_lines += line.lines().count();
-                archival_lines.push(line);
+                    let (text, text_lines) = trim_entry(&entry.text, 50);
+                    let _ = write!(out, "\n- [{}] id={} {}", created, entry.id, text);
+                    total_lines += text_lines;
+                }
             }
-            if !archival_lines.is_empty() {
-                sections.push(format!(
-                    "{}\n{}\n(Use archival_get(memory_id) for the full text.)",
-                    ARCHIVAL_HEADER.trim(),
-                    archival_lines.join("\n")
-                ));
+            if opened {
+                out.push_str("\n(Use archival_get(memory_id) for the full text.)");
             }
         }
 
-        if !conversations.is_empty() && total_lines < max_lines {
-            let mut conversation_lines = Vec::new();
+        if !conversations.is_empty() && has_room(total_lines, &out) {
+            let mut opened = false;
             for message in conversations {
-                if total_lines >= max_lines {
+                if !has_room(total_lines, &out) {
                     break;
                 }
-                let content = trim_entry(&message.content, 50);
-                let line = format!(
-                    "- [{}] id={} {}: {}",
+                open_section(&mut out, &mut opened, CONVERSATION_HEADER);
+                let (content, content_lines) = trim_entry(&message.content, 50);
+                let _ = write!(
+                    out,
+                    "\n- [{}] id={} {}: {}",
                     format_created_at(&message.created_at),
                     message.id,
                     message.role,
                     content
                 );
-                total_lines += line.lines().count();
-                conversation_lines.push(line);
+                total_lines += content_lines;
             }
-            if !conversation_lines.is_empty() {
-                sections.push(format!(
-                    "{}\n{}\n(Use conversation_get(message_id) for the full text.)",
-                    CONVERSATION_HEADER.trim(),
-                    conversation_lines.join("\n")
-                ));
+            if opened {
+                out.push_str("\n(Use conversation_get(message_id) for the full text.)");
             }
         }
 
-        if sections.is_empty() {
-            None
-        } else {
-            Some(sections.join("\n\n"))
-        }
+        if out.is_empty() { None } else { Some(out) }
     }
 }
 
+/// Start a recall section on its first entry: a blank line after any earlier
+/// section, then the header.
+fn open_section(out: &mut String, opened: &mut bool, header: &str) {
+    if *opened {
+        return;
+    }
+    *opened = true;
+    if !out.is_empty() {
+        out.push_str("\n\n");
+    }
+    out.push_str(header.trim());
+}
+
+/// Drop hits whose text repeats one already kept — an archival memory that
+/// quotes a conversation, or the same message stored twice. Matching on a
+/// normalised prefix is enough to catch verbatim copies without comparing
+/// whole entries.
+fn drop_duplicate_hits(archival: &mut Vec<ArchivalEntry>, conversations: &mut Vec<StoredMessage>) {
+    let mut seen = HashSet::new();
+    archival.retain(|entry| seen.insert(dedupe_key(&entry.text)));
+    conversations.retain(|message| seen.insert(dedupe_key(&message.content)));
+}
+
+fn dedupe_key(text: &str) -> String {
+    const DEDUPE_PREFIX_CHARS: usize = 300;
+    text.split_whitespace()
+        .flat_map(|word| word.chars().chain(std::iter::once(' ')))
+        .take(DEDUPE_PREFIX_CHARS)
+        .flat_map(char::to_lowercase)
+        .collect()
+}
+
+fn join_search<T>(handle: std::thread::ScopedJoinHandle<'_, T>) -> T {
+    handle
+        .join()
+        .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+}
+
+/// Greetings and acknowledgements carry no topic of their own: a recall for
+/// them only re-searches the prior turns' context, which those turns already
+/// recalled. Skipping them saves the embedding and the three searches.
+const TRIVIAL_MESSAGES: &[&str] = &[
+    "hi",
+    "hello",
+    "hey",
+    "thanks",
+    "thank you",
+    "thx",
+    "ty",
+    "ok",
+    "okay",
+    "k",
+    "yes",
+    "yep",
+    "yeah",
+    "no",
+    "nope",
+    "sure",
+    "cool",
+    "nice",
+    "great",
+    "got it",
+    "good morning",
+    "good night",
+];
+
+fn is_trivial_message(message: &str) -> bool {
+    let normalized = message
+        .trim()
+        .trim_end_matches(|ch: char| ch.is_ascii_punctuation() || ch.is_whitespace())
+        .to_lowercase();
+    TRIVIAL_MESSAGES.contains(&normalized.as_str())
+}
+
 /// Char budget reserved for prior user-message context after the new message.
 /// The new message itself is never truncated — losing intent would defeat the
 /// purpose of building a search query from it. The prior-context budget is
@@ -415,55 +517,67 @@ pub fn build_query(message: &str, recent_messages: &[StoredMessage]) -> String {
 }
 
 fn condense_tool_calls(content: &str, metadata: &Value) -> String {
-    let calls = metadata
-        .get("tool_calls")
-        .and_then(Value::as_array)
-        .map(|calls| {
-            calls
-                .iter()
-                .take(5)
-                .map(|call| {
-                    let function = call.get("function").unwrap_or(&Value::Null);
-                    let name = function.get("name").and_then(Value::as_str).unwrap_or("?");
-                    let mut args = function
-                        .get("arguments")
-                        .and_then(Value::as_str)
-                        .unwrap_or("")
-                        .to_string();
-                    if args.chars().count() > 300 {
-                        args = truncate_with_ellipsis(&args, 300);
-                    }
-                    format!("{name}({args})")
-                })
-                .collect::<Vec<_>>()
-                .join("; ")
-        })
-        .unwrap_or_default();
-    if content.trim().is_empty() {
-        format!("[Called: {calls}]")
-    } else {
-        format!("{}\n[Called: {calls}]", content.trim())
+    // Written into one buffer: no per-call strings or intermediate join.
+    let content = content.trim();
+    let mut out = String::with_capacity(content.len() + 64);
+    if !content.is_empty() {
+        out.push_str(content);
+        out.push('\n');
     }
+    out.push_str("[Called: ");
+    let calls = metadata.get("tool_calls").and_then(Value::as_array);
+    for (index, call) in calls.into_iter().flatten().take(5).enumerate() {
+        if index > 0 {
+            out.push_str("; ");
+        }
+        let function = call.get("function").unwrap_or(&Value::Null);
+        out.push_str(function.get("name").and_then(Value::as_str).unwrap_or("?"));
+        out.push('(');
+        let args = function
+            .get("arguments")
+            .and_then(Value::as_str)
+            .unwrap_or("");
+        if args.chars().nth(300).is_some() {
+            out.push_str(&truncate_with_ellipsis(args, 300));
+        } else {
+            out.push_str(args);
+        }
+        out.push(')');
+    }
+    out.push(']');
+    out
 }
 
-fn trim_entry(text: &str, max_lines: usize) -> String {
+/// Trim an entry to `max_lines`, returning the text with its line count (at
+/// least 1, since the entry is rendered on its own bullet line) so the caller
+/// can budget lines without scanning the string again.
+fn trim_entry(text: &str, max_lines: usize) -> (String, usize) {
     const MAX_ENTRY_CHARS: usize = 10_000;
-    let lines = text.lines().collect::<Vec<_>>();
-    let mut trimmed = if lines.len() > max_lines {
-        lines[..max_lines].join("\n")
+    // Only the first `max_lines` lines are collected; the rest of a long
+    // entry is walked (to count it) only when it ends up as a placeholder.
+    let mut lines = text.lines();
+    let head = lines.by_ref().take(max_lines).collect::<Vec<_>>();
+    let cut = lines.clone().next().is_some();
+    let kept_len = if cut {
+        head.iter().map(|line| line.len()).sum::<usize>() + head.len().saturating_sub(1)
     } else {
-        text.to_string()
+        text.len()
     };
-    if trimmed.len() > MAX_ENTRY_CHARS {
-        let first_line = lines.first().copied().unwrap_or("unknown content");
-        trimmed = format!(
+    if kept_len > MAX_ENTRY_CHARS {
+        let first_line = head.first().copied().unwrap_or("unknown content");
+        let placeholder = format!(
             "[large entry: {} lines, {} chars - {}]",
-            lines.len(),
+            head.len() + lines.count(),
             text.len(),
             truncate_with_ellipsis(first_line, 200)
         );
+        return (placeholder, 1);
+    }
+    if cut {
+        (head.join("\n"), max_lines.max(1))
+    } else {
+        (text.to_string(), head.len().max(1))
     }
-    trimmed
 }
 
 fn parse_created_at(value: &str) -> Option<DateTime<Utc>> {
@@ -482,18 +596,17 @@ fn format_created_at(value: &str) -> String {
         .unwrap_or_else(|| "unknown-time".to_string())
 }
 
-fn cap_recall_payload(value: &str, max_chars: usize) -> String {
-    const CLOSING_TAG: &str = "</associative_memory_recall>";
+fn cap_recall_payload(value: String, max_chars: usize) -> String {
     if value.chars().count() <= max_chars {
-        return value.to_string();
+        return value;
     }
     // Reserve room for the truncation marker + closing tag so the final string
     // stays roughly within `max_chars`.
-    let suffix_chars = CLOSING_TAG.chars().count() + 48;
+    let suffix_chars = RECALL_CLOSE.chars().count() + 48;
     let body_budget = max_chars.saturating_sub(suffix_chars).max(1);
     format!(
-        "{}\n[...recall truncated to {} chars]\n{CLOSING_TAG}",
-        truncate_with_ellipsis(value, body_budget),
+        "{}\n[...recall truncated to {} chars]\n{RECALL_CLOSE}",
+        truncate_with_ellipsis(&value, body_budget),
         max_chars
     )
 }
@@ -529,6 +642,20 @@ mod tests {
         assert!(hippo.recall(&store, "   ", &[]).unwrap().is_none());
     }
 
+    #[test]
+    fn trivial_acknowledgements_skip_recall() {
+        let (_tmp, store) = store();
+        store
+            .archival
+            .add("Thanks for the graph token help.", None, &[])
+            .unwrap();
+        let hippo = Hippocampus::new(HippocampusConfig::default());
+        assert!(hippo.recall(&store, "Thanks!", &[]).unwrap().is_none());
+        assert!(hippo.recall(&store, "  ok.  ", &[]).unwrap().is_none());
+        assert!(is_trivial_message("Good morning!!"));
+        assert!(!is_trivial_message("thanks, where is the graph token?"));
+    }
+
     #[test]
     fn recall_formats_notes_archival_and_conversation_sections() {
         let (_tmp, store) = store();
@@ -574,6 +701,29 @@ mod tests {
         assert!(recall.contains("graph email old message"));
     }
 
+    #[test]
+    fn recall_skips_conversation_hits_that_repeat_an_archival_memory() {
+        let (_tmp, store) = store();
+        let text = "Graph token file is graph_tokens.json.";
+        store.archival.add(text, None, &[]).unwrap();
+        store.messages.add(MessageRole::User, text, None).unwrap();
+        store
+            .messages
+            .add(MessageRole::User, "graph tokens expire hourly", None)
+            .unwrap();
+
+        let hippo = Hippocampus::new(HippocampusConfig {
+            exclude_recent_conversations: 0,
+            ..Default::default()
+        });
+        let recall = hippo
+            .recall(&store, "How do I read email with graph api?", &[])
+            .unwrap()
+            .unwrap();
+        assert_eq!(recall.matches("graph_tokens.json").count(), 1);
+        assert!(recall.contains("graph tokens expire hourly"));
+    }
+
     #[test]
     fn build_query_uses_recent_user_messages() {
         let messages = vec![
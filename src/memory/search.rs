@@ -1,3 +1,4 @@
+use std::cmp::Ordering;
 use std::collections::BTreeSet;
 
 pub fn query_terms(query: &str) -> Vec<String> {
@@ -16,6 +17,21 @@ pub fn query_terms(query: &str) -> Vec<String> {
     terms
 }
 
+/// Keep the `limit` best items in `compare` order. Partitions first so only
+/// the survivors are fully sorted: O(n + k log k) instead of sorting every
+/// merged candidate just to truncate.
+pub fn keep_top<T>(items: &mut Vec<T>, limit: usize, mut compare: impl FnMut(&T, &T) -> Ordering) {
+    if limit == 0 {
+        items.clear();
+        return;
+    }
+    if items.len() > limit {
+        items.select_nth_unstable_by(limit - 1, &mut compare);
+        items.truncate(limit);
+    }
+    items.sort_by(compare);
+}
+
 pub fn clean_tags(tags: &[String]) -> Vec<String> {
     let mut clean = Vec::new();
     let mut seen = BTreeSet::new();
@@ -35,16 +51,24 @@ pub fn tags_match_any(entry_tags: &[String], filter: &[String]) -> bool {
     filter.iter().any(|tag| entry_tags.contains(tag))
 }
 
+/// Cuts `text` after `max_lines` lines. The kept head is a slice of the
+/// original rather than its lines split out and re-joined; only the cut-off
+/// tail is walked, to count it.
 pub fn search_result_text(text: &str, max_lines: usize) -> String {
-    let lines = text.lines().collect::<Vec<_>>();
-    if lines.len() <= max_lines {
+    let mut segments = text.split_inclusive('\n');
+    let head_len = segments
+        .by_ref()
+        .take(max_lines)
+        .map(str::len)
+        .sum::<usize>();
+    let more = segments.count();
+    if more == 0 {
         return text.to_string();
     }
-    format!(
-        "{}\n[... {} more lines]",
-        lines[..max_lines].join("\n"),
-        lines.len() - max_lines
-    )
+    let head = &text[..head_len];
+    let head = head.strip_suffix('\n').unwrap_or(head);
+    let head = head.strip_suffix('\r').unwrap_or(head);
+    format!("{head}\n[... {more} more lines]")
 }
 
 pub fn indent_block(text: &str, prefix: &str) -> String {
@@ -56,3 +80,19 @@ pub fn indent_block(text: &str, prefix: &str) -> String {
         .collect::<Vec<_>>()
         .join("\n")
 }
+
+#[cfg(test)]
+mod tests {
+    use super::search_result_text;
+
+    #[test]
+    fn search_result_text_keeps_short_text_and_cuts_long_text() {
+        assert_eq!(search_result_text("a\nb\n", 2), "a\nb\n");
+        assert_eq!(search_result_text("a\nb\nc", 2), "a\nb\n[... 1 more lines]");
+        assert_eq!(
+            search_result_text("a\r\nb\r\nc\r\nd", 1),
+            "a\n[... 3 more lines]"
+        );
+        assert_eq!(search_result_text("a\nb", 0), "\n[... 2 more lines]");
+    }
+}
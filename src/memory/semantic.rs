@@ -1,8 +1,9 @@
 use std::collections::hash_map::DefaultHasher;
+use std::collections::{HashMap, VecDeque};
 use std::fs;
 use std::hash::{Hash, Hasher};
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, Once, OnceLock, PoisonError};
 
 use anyhow::{Context, Result, anyhow, bail};
 use fastembed::{
@@ -14,6 +15,10 @@ use serde::{Deserialize, Serialize};
 
 pub const LEGACY_EMBEDDING_MODEL: &str = "Snowflake/snowflake-arctic-embed-m-v2.0";
 pub const LEGACY_EMBEDDING_DIMENSIONS: usize = 768;
+/// Recent query vectors kept process-wide (see [`EmbeddingEngine::embed_query`]).
+/// At 768 dims that is under 1 MB, and it covers the repeat queries of a
+/// conversation plus the tools' own searches, not just one recall pass.
+const QUERY_CACHE_CAPACITY: usize = 256;
 
 #[derive(Clone, Debug, Eq, PartialEq, Serialize, Deserialize)]
 pub struct SemanticDocument {
@@ -59,6 +64,9 @@ impl SemanticIndexConfig {
 #[derive(Clone)]
 pub struct EmbeddingEngine {
     embedder: Arc<dyn TextEmbedder>,
+    /// Provider + model, so cached query vectors are never served across
+    /// different embedding spaces.
+    identity: Arc<str>,
 }
 
 impl std::fmt::Debug for EmbeddingEngine {
@@ -76,8 +84,32 @@ impl EmbeddingEngine {
     }
 
     pub fn from_config(config: &SemanticIndexConfig, cache_root: &Path) -> Self {
+        let identity: Arc<str> = Arc::from(format!(
+            "{}:{}",
+            config.provider.trim().to_ascii_lowercase(),
+            config.model.trim()
+        ));
         Self {
-            embedder: Arc::from(embedder_for_config(config, cache_root)),
+            embedder: shared_embedder(config, cache_root, &identity),
+            identity,
+        }
+    }
+
+    /// Load the model on a background thread, so the first recall or
+    /// message write of the process doesn't pay the ONNX load (seconds when
+    /// cold, a download on a fresh machine). The load holds the model lock;
+    /// an embed that arrives meanwhile waits for it rather than loading twice.
+    pub fn warm_in_background(&self) {
+        let embedder = self.embedder.clone();
+        let spawned = std::thread::Builder::new()
+            .name("lethe-embed-warm".to_string())
+            .spawn(move || {
+                if let Err(error) = embedder.warm() {
+                    tracing::warn!("embedding model warm-up failed: {error}");
+                }
+            });
+        if let Err(error) = spawned {
+            tracing::warn!("could not start embedding warm-up: {error}");
         }
     }
 
@@ -85,6 +117,7 @@ impl EmbeddingEngine {
     pub fn with_hash_dimensions(dimensions: usize) -> Self {
         Self {
             embedder: Arc::new(HashTextEmbedder::new(dimensions)),
+            identity: Arc::from(format!("hash:{dimensions}")),
         }
     }
 
@@ -102,17 +135,78 @@ impl EmbeddingEngine {
             .ok_or_else(|| anyhow!("embedding provider returned no document vector"))
     }
 
-    pub fn embed_query(&self, text: &str) -> Result<Vec<f32>> {
+    /// Query vectors are cached by trimmed text (the embedders trim their
+    /// input, so surrounding whitespace never changes the vector). One recall
+    /// pass searches notes, archival and conversation history with the same
+    /// query — through separate engines — and each miss is a full model
+    /// inference. Vectors are shared rather than copied out of the cache: a
+    /// hit is a refcount bump, not a fresh 3 KB allocation per search.
+    pub fn embed_query(&self, text: &str) -> Result<Arc<[f32]>> {
         if text.trim().is_empty() {
-            return Ok(vec![0.0; LEGACY_EMBEDDING_DIMENSIONS]);
+            static WARN_EMPTY: Once = Once::new();
+            WARN_EMPTY.call_once(|| {
+                tracing::warn!("embedding an empty query; callers should skip the vector search");
+            });
+            return Ok(Arc::from(vec![0.0; LEGACY_EMBEDDING_DIMENSIONS]));
+        }
+        let text = text.trim();
+        let key = query_key(&self.identity, text);
+        let mut cache = query_cache().lock().unwrap_or_else(PoisonError::into_inner);
+        if let Some(position) = cache.iter().position(|entry| {
+            entry.key == key && *entry.identity == *self.identity && entry.text == text
+        }) {
+            let entry = cache.remove(position).expect("position is in bounds");
+            let vector = entry.vector.clone();
+            cache.push_front(entry);
+            return Ok(vector);
         }
-        self.embedder.embed_query(text)
+        drop(cache);
+
+        let vector: Arc<[f32]> = Arc::from(self.embedder.embed_query(text)?);
+        let mut cache = query_cache().lock().unwrap_or_else(PoisonError::into_inner);
+        cache.push_front(CachedQuery {
+            key,
+            identity: self.identity.clone(),
+            text: text.to_string(),
+            vector: vector.clone(),
+        });
+        cache.truncate(QUERY_CACHE_CAPACITY);
+        Ok(vector)
     }
 }
 
+struct CachedQuery {
+    /// Hash of identity + text, so a lookup scans integers and only compares
+    /// strings on a likely hit.
+    key: u64,
+    identity: Arc<str>,
+    text: String,
+    vector: Arc<[f32]>,
+}
+
+/// Most-recently-used first.
+type QueryCache = VecDeque<CachedQuery>;
+
+fn query_key(identity: &str, text: &str) -> u64 {
+    let mut hasher = DefaultHasher::new();
+    identity.hash(&mut hasher);
+    text.hash(&mut hasher);
+    hasher.finish()
+}
+
+fn query_cache() -> &'static Mutex<QueryCache> {
+    static CACHE: OnceLock<Mutex<QueryCache>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(VecDeque::with_capacity(QUERY_CACHE_CAPACITY)))
+}
+
 pub trait TextEmbedder: Send + Sync {
     fn embed_documents(&self, texts: &[&str]) -> Result<Vec<Vec<f32>>>;
     fn embed_query(&self, text: &str) -> Result<Vec<f32>>;
+
+    /// Load whatever the first embed would otherwise load.
+    fn warm(&self) -> Result<()> {
+        Ok(())
+    }
 }
 
 struct FastEmbedTextEmbedder {
@@ -179,6 +273,10 @@ impl TextEmbedder for FastEmbedTextEmbedder {
             .pop()
             .ok_or_else(|| anyhow!("embedding provider returned no query vector"))
     }
+
+    fn warm(&self) -> Result<()> {
+        self.model().map(drop)
+    }
 }
 
 #[derive(Debug)]
@@ -222,6 +320,26 @@ impl TextEmbedder for HashTextEmbedder {
     }
 }
 
+/// One embedder per model and cache root for the whole process. Every
+/// `MemoryStore` open (agent, brainstem ticks, CLI commands, tools) builds
+/// its own engine, and a fresh fastembed embedder reloads the ONNX model on
+/// first use; sharing it means the model is loaded once.
+fn shared_embedder(
+    config: &SemanticIndexConfig,
+    root: &Path,
+    identity: &Arc<str>,
+) -> Arc<dyn TextEmbedder> {
+    static EMBEDDERS: OnceLock<Mutex<HashMap<(Arc<str>, PathBuf), Arc<dyn TextEmbedder>>>> =
+        OnceLock::new();
+    EMBEDDERS
+        .get_or_init(|| Mutex::new(HashMap::new()))
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .entry((identity.clone(), root.to_path_buf()))
+        .or_insert_with(|| Arc::from(embedder_for_config(config, root)))
+        .clone()
+}
+
 fn embedder_for_config(config: &SemanticIndexConfig, root: &Path) -> Box<dyn TextEmbedder> {
     match config.provider.trim().to_ascii_lowercase().as_str() {
         "hash" => Box::new(HashTextEmbedder::new(LEGACY_EMBEDDING_DIMENSIONS)),
@@ -303,3 +421,73 @@ fn env_bool(name: &str, default: bool) -> bool {
         })
         .unwrap_or(default)
 }
+
+#[cfg(test)]
+mod tests {
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    use super::*;
+
+    struct CountingEmbedder(AtomicUsize);
+
+    impl TextEmbedder for CountingEmbedder {
+        fn embed_documents(&self, texts: &[&str]) -> Result<Vec<Vec<f32>>> {
+            Ok(texts.iter().map(|_| vec![1.0]).collect())
+        }
+
+        fn embed_query(&self, _text: &str) -> Result<Vec<f32>> {
+            let calls = self.0.fetch_add(1, Ordering::SeqCst) + 1;
+            Ok(vec![calls as f32])
+        }
+    }
+
+    #[test]
+    fn repeated_queries_reuse_the_cached_vector() {
+        let counter = Arc::new(CountingEmbedder(AtomicUsize::new(0)));
+        let engine = EmbeddingEngine {
+            embedder: counter.clone(),
+            identity: Arc::from("counting:query-cache-test"),
+        };
+        let first = engine.embed_query("where did we leave the port").unwrap();
+        let again = engine
+            .clone()
+            .embed_query("where did we leave the port")
+            .unwrap();
+        assert_eq!(first, again);
+        assert_eq!(counter.0.load(Ordering::SeqCst), 1);
+
+        engine
+            .embed_query("  where did we leave the port\n")
+            .unwrap();
+        assert_eq!(counter.0.load(Ordering::SeqCst), 1);
+
+        engine.embed_query("something else").unwrap();
+        assert_eq!(counter.0.load(Ordering::SeqCst), 2);
+
+        let other_model = EmbeddingEngine {
+            embedder: counter.clone(),
+            identity: Arc::from("counting:other-model"),
+        };
+        other_model
+            .embed_query("where did we leave the port")
+            .unwrap();
+        assert_eq!(counter.0.load(Ordering::SeqCst), 3);
+    }
+
+    #[test]
+    fn engines_for_the_same_model_share_one_embedder() {
+        let config = SemanticIndexConfig {
+            enabled: true,
+            provider: "hash".to_string(),
+            model: "shared-embedder-test".to_string(),
+        };
+        let tmp = tempfile::tempdir().unwrap();
+        let root = tmp.path();
+        let first = EmbeddingEngine::from_config(&config, root);
+        let second = EmbeddingEngine::from_config(&config, root);
+        assert!(Arc::ptr_eq(&first.embedder, &second.embedder));
+
+        let elsewhere = EmbeddingEngine::from_config(&config, &root.join("other"));
+        assert!(!Arc::ptr_eq(&first.embedder, &elsewhere.embedder));
+    }
+}
@@ -43,6 +43,16 @@ pub struct MemoryStats {
     pub notes: usize,
 }
 
+/// Everything the system prompt needs from the memory blocks, read in one
+/// pass over the blocks directory.
+#[derive(Clone, Debug, Default, Eq, PartialEq)]
+pub struct PromptMemory {
+    pub identity: String,
+    pub conversation_summary: String,
+    pub stable: String,
+    pub volatile: String,
+}
+
 #[derive(Debug)]
 pub struct MemoryStore {
     pub blocks: BlockManager,
@@ -64,6 +74,17 @@ impl MemoryStore {
         )
     }
 
+    /// Just the todo manager, for one-shot commands that need nothing else.
+    /// Skips the workspace bootstrap, block seeding and the memory/message
+    /// schemas (incl. the sqlite-vec table) that a full open pays for, but
+    /// still runs the legacy todo migration so results match a full open.
+    pub fn open_todos(settings: &Settings) -> MemoryStoreResult<TodoManager> {
+        let memory_data_path = settings.paths.memory_dir.join("lethe-memory.db");
+        let todos = TodoManager::open(&memory_data_path)?;
+        migrate_legacy_todos(&settings.paths.db_path, &memory_data_path)?;
+        Ok(todos)
+    }
+
     pub fn open(
         workspace_dir: impl Into<PathBuf>,
         db_path: impl Into<PathBuf>,
@@ -122,11 +143,13 @@ impl MemoryStore {
         &self.workspace_dir
     }
 
+    /// Counts only: nothing here reads a block or note body, so polling it
+    /// stays cheap however large the memory grows.
     pub fn stats(&self) -> MemoryStoreResult<MemoryStats> {
-        let memory_blocks = self.blocks.list_blocks(true)?.len();
+        let memory_blocks = self.blocks.count()?;
         let archival_memories = self.archival.count()?;
         let message_history = self.messages.count()?;
-        let notes = self.notes.list_notes(None)?.len();
+        let notes = self.notes.count()?;
         Ok(MemoryStats {
             memory_blocks,
             archival_memories,
@@ -168,10 +191,39 @@ impl MemoryStore {
 
     pub fn get_context_split(&self) -> MemoryStoreResult<(String, String)> {
         let blocks = self.blocks.list_blocks(false)?;
+        self.context_split_from(&blocks)
+    }
+
+    /// Identity, rolling summary and the stable/volatile block context for
+    /// one prompt. Each block file is read once per turn, where fetching the
+    /// three separately listed the directory and re-read identity and the
+    /// summary a second time.
+    pub fn prompt_memory(&self) -> MemoryStoreResult<PromptMemory> {
+        let mut blocks = self.blocks.list_blocks(true)?;
+        let value_of = |blocks: &[MemoryBlock], label: &str| {
+            blocks
+                .iter()
+                .find(|block| block.label == label)
+                .map(|block| block.value.clone())
+                .unwrap_or_default()
+        };
+        let identity = value_of(&blocks, "identity");
+        let conversation_summary = value_of(&blocks, super::blocks::CONVERSATION_SUMMARY_LABEL);
+        blocks.retain(|block| !block.hidden);
+        let (stable, volatile) = self.context_split_from(&blocks)?;
+        Ok(PromptMemory {
+            identity,
+            conversation_summary,
+            stable,
+            volatile,
+        })
+    }
+
+    fn context_split_from(&self, blocks: &[MemoryBlock]) -> MemoryStoreResult<(String, String)> {
         let mut stable_blocks = Vec::new();
         let mut volatile_blocks = Vec::new();
 
-        for block in &blocks {
+        for block in blocks {
             if block.hidden || block.label == "identity" {
                 continue;
             }
@@ -198,7 +250,7 @@ impl MemoryStore {
             ));
         }
 
-        volatile_parts.push(self.format_memory_metadata(&blocks)?);
+        volatile_parts.push(self.format_memory_metadata(blocks)?);
 
         Ok((stable_parts.join("\n\n"), volatile_parts.join("\n\n")))
     }
@@ -579,4 +631,23 @@ mod tests {
         let combined = store.get_context_for_prompt().unwrap();
         assert!(combined.contains("<memory_metadata>"));
     }
+
+    #[test]
+    fn prompt_memory_matches_the_separate_lookups() {
+        let (_tmp, store) = store();
+        store
+            .blocks
+            .update("project", Some("Port Lethe to Rust."), None)
+            .unwrap();
+        store
+            .set_conversation_summary("Earlier we planned the port.")
+            .unwrap();
+
+        let parts = store.prompt_memory().unwrap();
+        let identity = store.blocks.get("identity").unwrap().unwrap().value;
+        assert_eq!(parts.identity, identity);
+        assert_eq!(parts.conversation_summary, "Earlier we planned the port.");
+        let (stable, volatile) = store.get_context_split().unwrap();
+        assert_eq!((parts.stable, parts.volatile), (stable, volatile));
+    }
 }
@@ -84,8 +84,7 @@ impl MemoryCurator {
         if !self.state_path.exists() {
             return Ok(CuratorState::default());
         }
-        let raw = fs::read_to_string(&self.state_path)?;
-        Ok(serde_json::from_str(&raw)?)
+        Ok(serde_json::from_slice(&fs::read(&self.state_path)?)?)
     }
 
     pub fn should_run(&self) -> CuratorResult<bool> {
@@ -252,20 +251,14 @@ impl MemoryCurator {
             }
         }
 
-        let mut deleted = 0;
-        for id in delete_ids {
-            if store.archival.delete(&id)? {
-                deleted += 1;
-            }
-        }
-        Ok(deleted)
+        Ok(store.archival.delete_many(&delete_ids)?)
     }
 
     fn save_state(&self, state: &CuratorState) -> CuratorResult<()> {
         if let Some(parent) = self.state_path.parent() {
             fs::create_dir_all(parent)?;
         }
-        fs::write(&self.state_path, serde_json::to_string_pretty(state)?)?;
+        fs::write(&self.state_path, serde_json::to_vec_pretty(state)?)?;
         Ok(())
     }
 }
@@ -1,4 +1,5 @@
 use std::collections::HashMap;
+use std::sync::OnceLock;
 
 use chrono::{DateTime, Local, Utc};
 use regex::Regex;
@@ -7,6 +8,7 @@ use serde_json::Value;
 
 use crate::config::Settings;
 use crate::llm::prompts::PromptStore;
+use crate::llm::response_format::first_json_object;
 
 pub const DEFAULT_HEARTBEAT_INTERVAL_SECONDS: u64 = 60 * 60;
 pub const FULL_CONTEXT_INTERVAL_SECONDS: u64 = 2 * 60 * 60;
@@ -338,35 +340,37 @@ fn parse_json_object(response: &str) -> Option<Value> {
     {
         return Some(value);
     }
-    let start = trimmed.find('{')?;
-    let end = trimmed.rfind('}')?;
-    if end <= start {
-        return None;
-    }
-    serde_json::from_str::<Value>(&trimmed[start..=end])
-        .ok()
-        .filter(Value::is_object)
+    first_json_object(trimmed)
+}
+
+/// Every model-emitted tag to strip, fused into one alternation so the
+/// response is scanned and copied once rather than once per pattern. At any
+/// position the earliest listed alternative wins, which keeps the old
+/// pattern-by-pattern order (think blocks before the catch-all tool-call
+/// tails).
+fn model_tag_regex() -> &'static Regex {
+    static RE: OnceLock<Regex> = OnceLock::new();
+    RE.get_or_init(|| {
+        Regex::new(concat!(
+            r"(?s)<think>.*?</think>",
+            r"|<thinking>.*?</thinking>",
+            r"|<result>\s*",
+            r"|\s*</result>",
+            r"|<\|tool_calls_section_begin\|>.*",
+            r"|<\|tool_call_begin\|>.*",
+            r"|<tool_call:.*?>",
+            r"|<\|?tool_call\|?>.*",
+            r"|<\|?tool_response\|?>.*",
+        ))
+        .expect("valid model-tag regex")
+    })
 }
 
 pub fn strip_model_tags(content: &str) -> String {
-    let mut cleaned = content.to_string();
-    for pattern in [
-        r"(?s)<think>.*?</think>",
-        r"(?s)<thinking>.*?</thinking>",
-        r"<result>\s*",
-        r"\s*</result>",
-        r"(?s)<\|tool_calls_section_begin\|>.*",
-        r"(?s)<\|tool_call_begin\|>.*",
-        r"(?s)<tool_call:.*?>",
-        r"(?s)<\|?tool_call\|?>.*",
-        r"(?s)<\|?tool_response\|?>.*",
-    ] {
-        cleaned = Regex::new(pattern)
-            .expect("valid model-tag regex")
-            .replace_all(&cleaned, "")
-            .to_string();
-    }
-    cleaned.trim().to_string()
+    model_tag_regex()
+        .replace_all(content, "")
+        .trim()
+        .to_string()
 }
 
 fn format_reminder_block(reminders: &str) -> String {
@@ -542,6 +546,19 @@ mod tests {
         assert_eq!(idle.action, HeartbeatAction::Idle);
     }
 
+    #[test]
+    fn strip_model_tags_removes_every_tag_kind_in_one_pass() {
+        assert_eq!(
+            strip_model_tags(
+                "<thinking>plan\nsteps</thinking> <result>\n  Done.\n</result>\
+                 <|tool_call_begin|>functions.x:0 {}"
+            ),
+            "Done."
+        );
+        assert_eq!(strip_model_tags("a <tool_call:search> b"), "a  b");
+        assert_eq!(strip_model_tags("  plain  "), "plain");
+    }
+
     #[test]
     fn finish_response_suppresses_untyped_internal_prose() {
         let mut heartbeat = Heartbeat::new(HeartbeatConfig::default());
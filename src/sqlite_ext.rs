@@ -1,6 +1,8 @@
 use std::ffi::c_char;
 use std::sync::Once;
+use std::time::Duration;
 
+use rusqlite::Connection;
 use rusqlite::ffi::{sqlite3, sqlite3_api_routines, sqlite3_auto_extension};
 use sqlite_vec::sqlite3_vec_init;
 
@@ -19,3 +21,15 @@ pub fn register() {
         )));
     });
 }
+
+/// Settings for every connection to the memory database, which the memory
+/// stores, message history, todos and the actor store all share: WAL so
+/// readers never block the writer, `synchronous=NORMAL` (one fsync per
+/// commit instead of two; still crash-safe in WAL mode), and a busy timeout
+/// so a write that meets another connection's transaction waits for it
+/// instead of failing with SQLITE_BUSY.
+pub fn configure(conn: &Connection) -> rusqlite::Result<()> {
+    conn.pragma_update(None, "journal_mode", "WAL")?;
+    conn.pragma_update(None, "synchronous", "NORMAL")?;
+    conn.busy_timeout(Duration::from_secs(5))
+}
@@ -2,7 +2,8 @@ use std::cmp::Ordering;
 use std::path::{Path, PathBuf};
 
 use chrono::{DateTime, Duration, Utc};
-use rusqlite::{Connection, OptionalExtension, params};
+use rusqlite::types::Value;
+use rusqlite::{Connection, OptionalExtension, params, params_from_iter};
 use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
@@ -230,64 +231,62 @@ impl TodoManager {
         .map_err(TodoError::from)
     }
 
+    /// Writes only the fields that are set, in a single `UPDATE`. There is
+    /// no read-back first, so a concurrent change to another field can't be
+    /// overwritten with the stale copy a read-modify-write would carry.
     pub fn update(&self, todo_id: i64, update: TodoUpdate) -> TodoResult<bool> {
-        let Some(mut todo) = self.get(todo_id)? else {
-            return Ok(false);
-        };
-        let mut changed = false;
+        let mut columns: Vec<(&str, Value)> = Vec::new();
         if let Some(title) = update.title {
             if title.trim().is_empty() {
                 return Err(TodoError::EmptyTitle);
             }
-            todo.title = title;
-            changed = true;
+            columns.push(("title", title.into()));
         }
         if let Some(description) = update.description {
-            todo.description = empty_to_none(Some(&description)).map(str::to_string);
-            changed = true;
+            columns.push((
+                "description",
+                empty_to_none(Some(&description)).map(str::to_string).into(),
+            ));
         }
         if let Some(status) = update.status {
-            todo.status = status;
+            columns.push(("status", status.as_str().to_string().into()));
             if status == TodoStatus::Completed {
-                todo.completed_at = Some(now_iso());
+                columns.push(("completed_at", now_iso().into()));
             }
-            changed = true;
         }
         if let Some(priority) = update.priority {
-            todo.priority = priority;
-            changed = true;
+            columns.push(("priority", priority.as_str().to_string().into()));
         }
         if let Some(due_date) = update.due_date {
-            todo.due_date = empty_to_none(Some(&due_date)).map(str::to_string);
-            changed = true;
+            columns.push((
+                "due_date",
+                empty_to_none(Some(&due_date)).map(str::to_string).into(),
+            ));
         }
         if let Some(parent_id) = update.parent_id {
-            todo.parent_id = (parent_id > 0).then_some(parent_id);
-            changed = true;
+            columns.push(("parent_id", (parent_id > 0).then_some(parent_id).into()));
         }
-        if !changed {
+        if columns.is_empty() {
             return Ok(false);
         }
-        todo.updated_at = now_iso();
-
+        columns.push(("updated_at", now_iso().into()));
+
+        let assignments = columns
+            .iter()
+            .enumerate()
+            .map(|(index, (column, _))| format!("{column} = ?{}", index + 1))
+            .collect::<Vec<_>>()
+            .join(", ");
+        let sql = format!(
+            "UPDATE todos SET {assignments} WHERE id = ?{}",
+            columns.len() + 1
+        );
+        let values = columns
+            .into_iter()
+            .map(|(_, value)| value)
+            .chain([Value::Integer(todo_id)]);
         let conn = self.conn()?;
-        let updated = conn.execute(
-            "UPDATE todos
-             SET title = ?1, description = ?2, status = ?3, priority = ?4, updated_at = ?5,
-                 completed_at = ?6, due_date = ?7, parent_id = ?8
-             WHERE id = ?9",
-            params![
-                todo.title,
-                todo.description,
-                todo.status.as_str(),
-                todo.priority.as_str(),
-                todo.updated_at,
-                todo.completed_at,
-                todo.due_date,
-                todo.parent_id,
-                todo_id,
-            ],
-        )?;
+        let updated = conn.execute(&sql, params_from_iter(values))?;
         Ok(updated > 0)
     }
 
@@ -598,7 +597,9 @@ impl TodoManager {
     }
 
     fn conn(&self) -> TodoResult<Connection> {
-        Ok(Connection::open(&self.db_path)?)
+        let conn = Connection::open(&self.db_path)?;
+        crate::sqlite_ext::configure(&conn)?;
+        Ok(conn)
     }
 }
 
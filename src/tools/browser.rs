@@ -1,8 +1,10 @@
+use std::collections::{HashMap, HashSet};
 use std::env;
 use std::fs;
 use std::io::Read;
 use std::path::{Path, PathBuf};
 use std::process::{Command, Stdio};
+use std::sync::{Arc, Mutex, OnceLock, PoisonError};
 use std::thread;
 use std::time::{Duration, Instant};
 
@@ -107,16 +109,35 @@ impl BrowserTools {
     }
 
     fn run_agent_browser(&self, args: &[String]) -> Result<BrowserCommandOutput, String> {
-        fs::create_dir_all(&self.profile_dir)
-            .map_err(|error| format!("Failed to create browser profile directory: {error}"))?;
-        let program = find_executable(AGENT_BROWSER).ok_or_else(|| {
+        let program = agent_browser_program().ok_or_else(|| {
             "agent-browser not found. Install with: npm install -g agent-browser".to_string()
         })?;
-        run_command(
-            &program,
-            &self.agent_browser_args(args),
-            Duration::from_secs(DEFAULT_TIMEOUT_SECONDS),
-        )
+        let args = self.agent_browser_args(args);
+        let timeout = Duration::from_secs(DEFAULT_TIMEOUT_SECONDS);
+        if profile_is_warm(&self.profile_dir) {
+            return run_command(&program, &args, timeout);
+        }
+        // The first command against a profile launches agent-browser's
+        // background browser, which takes seconds. Concurrent tool calls
+        // (parallel actors) would each race a launch on the same profile;
+        // let one go first and the rest queue behind it, then find the
+        // browser already up.
+        let launch_lock = cold_start_lock(&self.profile_dir);
+        let launch = launch_lock.lock().unwrap_or_else(PoisonError::into_inner);
+        if profile_is_warm(&self.profile_dir) {
+            drop(launch);
+            return run_command(&program, &args, timeout);
+        }
+        fs::create_dir_all(&self.profile_dir)
+            .map_err(|error| format!("Failed to create browser profile directory: {error}"))?;
+        let output = run_command(&program, &args, timeout)?;
+        if output.code == 0 {
+            warm_profiles()
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .insert(self.profile_dir.clone());
+        }
+        Ok(output)
     }
 
     fn agent_browser_args(&self, args: &[String]) -> Vec<String> {
@@ -130,6 +151,45 @@ impl BrowserTools {
     }
 }
 
+/// The agent-browser binary, resolved from `PATH` once it is found. Every
+/// registry builds its own `BrowserTools`, and each command used to re-walk
+/// `PATH`; a miss is not cached, so installing it mid-session still works.
+fn agent_browser_program() -> Option<PathBuf> {
+    static PROGRAM: OnceLock<PathBuf> = OnceLock::new();
+    if let Some(program) = PROGRAM.get() {
+        return Some(program.clone());
+    }
+    let found = find_executable(AGENT_BROWSER)?;
+    Some(PROGRAM.get_or_init(|| found).clone())
+}
+
+/// Profiles whose browser has answered a command in this process.
+fn warm_profiles() -> &'static Mutex<HashSet<PathBuf>> {
+    static WARM: OnceLock<Mutex<HashSet<PathBuf>>> = OnceLock::new();
+    WARM.get_or_init(Mutex::default)
+}
+
+fn profile_is_warm(profile_dir: &Path) -> bool {
+    warm_profiles()
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .contains(profile_dir)
+}
+
+/// Held across a cold-start command so concurrent first calls on a profile
+/// launch one browser, not one each. Keyed by profile, so a slow launch on
+/// one profile doesn't hold up another.
+fn cold_start_lock(profile_dir: &Path) -> Arc<Mutex<()>> {
+    static LOCKS: OnceLock<Mutex<HashMap<PathBuf, Arc<Mutex<()>>>>> = OnceLock::new();
+    LOCKS
+        .get_or_init(Mutex::default)
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .entry(profile_dir.to_path_buf())
+        .or_default()
+        .clone()
+}
+
 fn error_json(stderr: String, stdout: String, fallback: &str) -> serde_json::Value {
     let message = if !stderr.trim().is_empty() {
         stderr.trim()
@@ -255,10 +315,13 @@ pub const TOOL_DEFS: &[ToolDef] = &[
     },
     ToolDef {
         name: "browser_snapshot",
-        description: "Accessibility snapshot of the page with element refs.",
+        description: "Accessibility snapshot of the page with element refs. By default lists only the interactive elements (links, buttons, inputs) straight from the DOM — use that to find what to click or fill.",
         params: &[
-            p_bool("interactive_only", "Only interactive elements."),
-            p_bool("compact", "Omit empty structural elements."),
+            p_bool(
+                "interactive_only",
+                "Only interactive elements (default true; false dumps the whole tree).",
+            ),
+            p_bool("compact", "Omit empty structural elements (default true)."),
         ],
         category: ToolCategory::Requestable,
         execute: ToolExecutor::Sync(exec_browser_snapshot),
@@ -324,6 +387,19 @@ mod tests {
         assert_eq!(install, vec!["install"]);
     }
 
+    #[test]
+    fn cold_start_lock_is_shared_per_profile_only() {
+        let first = cold_start_lock(Path::new("/tmp/lethe-browser-a"));
+        let same = cold_start_lock(Path::new("/tmp/lethe-browser-a"));
+        let other = cold_start_lock(Path::new("/tmp/lethe-browser-b"));
+        assert!(Arc::ptr_eq(&first, &same));
+        assert!(!Arc::ptr_eq(&first, &other));
+
+        // Holding one profile's launch lock leaves another's free.
+        let _launch = first.lock().unwrap();
+        assert!(other.try_lock().is_ok());
+    }
+
     #[test]
     fn error_json_prefers_stderr_then_stdout() {
         assert_eq!(
@@ -32,17 +32,24 @@ impl ImageTools {
             );
         };
 
+        // The encoded size follows from the file size, so an oversized image
+        // is rejected before it is read and encoded rather than after.
+        let encoded_len = std::fs::metadata(&path)
+            .ok()
+            .and_then(|metadata| usize::try_from(metadata.len()).ok())
+            .and_then(|len| base64::encoded_len(len, true))
+            .unwrap_or(usize::MAX);
+        if encoded_len > MAX_IMAGE_BASE64_BYTES {
+            return error_json(&format!(
+                "Image too large: {}MB encoded (max 5MB)",
+                encoded_len / 1_000_000
+            ));
+        }
         let bytes = match std::fs::read(&path) {
             Ok(bytes) => bytes,
             Err(error) => return error_json(&format!("Failed to read image: {error}")),
         };
         let encoded = BASE64_STANDARD.encode(bytes);
-        if encoded.len() > MAX_IMAGE_BASE64_BYTES {
-            return error_json(&format!(
-                "Image too large: {}MB encoded (max 5MB)",
-                encoded.len() / 1_000_000
-            ));
-        }
 
         let name = path
             .file_name()
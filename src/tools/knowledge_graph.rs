@@ -9,7 +9,6 @@ use std::env;
 use std::sync::OnceLock;
 use std::time::Duration;
 
-use reqwest::blocking::Client;
 use serde_json::{Value, json};
 
 use crate::tools::registry::ToolRegistry;
@@ -17,24 +16,31 @@ use crate::tools::registry::args::{bool_arg, string_arg, u64_arg, usize_arg};
 use crate::tools::spec::{
     ToolCategory, ToolDef, ToolExecutor, p_bool, p_enum, p_int, p_int_req, p_str, p_str_req,
 };
-
-fn kg_config() -> Option<(String, String)> {
-    let base = env::var("KG_API_BASE")
-        .ok()
-        .map(|v| v.trim().trim_end_matches('/').to_string())
-        .filter(|v| !v.is_empty())?;
-    let token = env::var("KG_API_TOKEN")
-        .ok()
-        .map(|v| v.trim().to_string())
-        .filter(|v| !v.is_empty())?;
-    Some((base, token))
+use crate::tools::web::shared_client;
+
+/// `(base, token)`, resolved once: the env is fixed for the process lifetime
+/// (containers are recreated to change it), so every kg_* call reuses the
+/// same strings instead of re-reading and re-trimming both variables.
+fn kg_config() -> Option<&'static (String, String)> {
+    static CONFIG: OnceLock<Option<(String, String)>> = OnceLock::new();
+    CONFIG
+        .get_or_init(|| {
+            let base = env::var("KG_API_BASE")
+                .ok()
+                .map(|v| v.trim().trim_end_matches('/').to_string())
+                .filter(|v| !v.is_empty())?;
+            let token = env::var("KG_API_TOKEN")
+                .ok()
+                .map(|v| v.trim().to_string())
+                .filter(|v| !v.is_empty())?;
+            Some((base, token))
+        })
+        .as_ref()
 }
 
-/// Whether the knowledge-graph backend is configured (cached: the env is
-/// fixed for the process lifetime — containers are recreated to change it).
+/// Whether the knowledge-graph backend is configured.
 pub fn is_configured() -> bool {
-    static CONFIGURED: OnceLock<bool> = OnceLock::new();
-    *CONFIGURED.get_or_init(|| kg_config().is_some())
+    kg_config().is_some()
 }
 
 fn error_json(message: &str) -> String {
@@ -64,7 +70,7 @@ fn kg_get(path: &str, query: &[(&str, String)]) -> String {
         return error_json("Knowledge graph not configured (KG_API_BASE/KG_API_TOKEN unset).");
     };
     handle(
-        Client::new()
+        shared_client()
             .get(format!("{base}{path}"))
             .bearer_auth(token)
             .query(query)
@@ -78,7 +84,7 @@ fn kg_post(path: &str, body: Value) -> String {
         return error_json("Knowledge graph not configured (KG_API_BASE/KG_API_TOKEN unset).");
     };
     handle(
-        Client::new()
+        shared_client()
             .post(format!("{base}{path}"))
             .bearer_auth(token)
             .json(&body)
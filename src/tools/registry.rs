@@ -1,4 +1,5 @@
 use std::collections::HashSet;
+use std::sync::OnceLock;
 
 use crate::actor::ActorRuntime;
 use crate::interfaces::telegram::TelegramToolContext;
@@ -107,12 +108,10 @@ impl<'a> ToolRegistry<'a> {
     }
 
     pub fn tools_for_active(&self, active_tools: &HashSet<String>) -> Vec<genai::chat::Tool> {
-        self.tools()
-            .into_iter()
-            .filter(|tool| {
-                self.is_initial_tool(&tool.name) || active_tools.contains(tool.name.as_str())
-            })
-            .collect()
+        self.tools_matching(|def| {
+            self.def_is_visible(def)
+                && (self.def_is_initial(def) || active_tools.contains(def.name))
+        })
     }
 
     pub fn tool_is_available(&self, name: &str) -> bool {
@@ -128,15 +127,22 @@ impl<'a> ToolRegistry<'a> {
         self.runtime.observer.as_ref()
     }
 
-    pub fn requestable_tool_names(&self) -> Vec<String> {
-        let mut names = catalog::all_defs()
-            .filter(|def| self.def_is_visible(def) && !self.def_is_initial(def))
-            .filter(|def| def.name != "request_tool")
-            .map(|def| def.name.to_string())
-            .collect::<Vec<_>>();
-        names.sort();
-        names.dedup();
-        names
+    /// Sorted names the agent could `request_tool` for. Like the directory,
+    /// the list depends only on the context shape, so it is built once per
+    /// shape and borrowed from then on.
+    pub fn requestable_tool_names(&self) -> &'static [&'static str] {
+        static NAMES: [OnceLock<Vec<&'static str>>; 8] = [const { OnceLock::new() }; 8];
+        NAMES[ToolContextShape::of(&self.runtime).slot()].get_or_init(|| {
+            let mut names = catalog::defs()
+                .iter()
+                .filter(|def| self.def_is_visible(def) && !self.def_is_initial(def))
+                .filter(|def| def.name != "request_tool")
+                .map(|def| def.name)
+                .collect::<Vec<_>>();
+            names.sort_unstable();
+            names.dedup();
+            names
+        })
     }
 
     /// One-line per tool directory for the system prompt: `name — description`.
@@ -160,18 +166,41 @@ pub struct ToolContextShape {
     pub has_transport: bool,
 }
 
+impl ToolContextShape {
+    fn of(runtime: &ToolRuntime) -> Self {
+        Self {
+            has_actor: runtime.actor.is_some(),
+            is_subagent: runtime
+                .actor
+                .as_ref()
+                .is_some_and(|context| context.is_subagent),
+            has_transport: runtime.telegram.is_some() || runtime.client.is_some(),
+        }
+    }
+
+    /// Index into the per-shape caches: one slot per combination of bits.
+    fn slot(self) -> usize {
+        usize::from(self.has_actor)
+            | usize::from(self.is_subagent) << 1
+            | usize::from(self.has_transport) << 2
+    }
+}
+
 pub fn requestable_tools_directory_for(runtime: &ToolRuntime) -> String {
-    requestable_tools_directory_for_shape(ToolContextShape {
-        has_actor: runtime.actor.is_some(),
-        is_subagent: runtime
-            .actor
-            .as_ref()
-            .is_some_and(|context| context.is_subagent),
-        has_transport: runtime.telegram.is_some() || runtime.client.is_some(),
-    })
+    requestable_tools_directory_for_shape(ToolContextShape::of(runtime))
 }
 
+/// Rendered once per shape: the defs are `const` and the knowledge-graph flag
+/// is fixed for the process, so only the three shape bits can vary. Every
+/// actor prompt and every principal turn asks for this.
 pub fn requestable_tools_directory_for_shape(shape: ToolContextShape) -> String {
+    static DIRECTORIES: [OnceLock<String>; 8] = [const { OnceLock::new() }; 8];
+    DIRECTORIES[shape.slot()]
+        .get_or_init(|| render_requestable_tools_directory(shape))
+        .clone()
+}
+
+fn render_requestable_tools_directory(shape: ToolContextShape) -> String {
     use crate::tools::spec::ToolCategory;
     let ToolContextShape {
         has_actor,
@@ -196,7 +225,8 @@ pub fn requestable_tools_directory_for_shape(shape: ToolContextShape) -> String
         ToolCategory::KnowledgeGraph => crate::tools::knowledge_graph::is_configured(),
     };
 
-    let mut lines = catalog::all_defs()
+    let mut lines = catalog::defs()
+        .iter()
         .filter(|def| visible(def) && !initial(def))
         .filter(|def| def.name != "request_tool")
         .map(|def| format!("- {} — {}", def.name, def.description))
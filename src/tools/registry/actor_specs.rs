@@ -10,10 +10,10 @@ use crate::actor::{ActorState, ActorToolCommand, Outcome, SpawnReport, SpawnSuba
 use crate::llm::truncate::truncate_with_ellipsis;
 use crate::tools::registry::ToolRegistry;
 use crate::tools::registry::args::{
-    bool_arg, nonempty_string, string_arg, string_arg_default, usize_arg,
+    bool_arg, nonempty_string, string_arg, string_arg_default, string_vec_arg, usize_arg,
 };
 use crate::tools::spec::{
-    ToolCategory, ToolDef, ToolExecutor, p_bool, p_enum, p_int, p_str, p_str_req,
+    ToolCategory, ToolDef, ToolExecutor, p_bool, p_enum, p_int, p_str, p_str_array, p_str_req,
 };
 
 const TASK_STATE_VALUES: &[&str] = &["planned", "running", "blocked", "done"];
@@ -78,7 +78,7 @@ fn exec_spawn_actor<'a>(
             name: string_arg(args, "name"),
             goals: string_arg(args, "goals"),
             group: nonempty_string(args, "group"),
-            tools: string_arg_default(args, "tools", ""),
+            tools: string_vec_arg(args, "tools"),
             model: string_arg_default(args, "model", "aux"),
             max_turns: usize_arg(args, "max_turns", 20),
         }
@@ -191,7 +191,7 @@ async fn spawn_chain(registry: &ToolRegistry<'_>, args: &Value) -> String {
         );
     }
 
-    let tools = string_arg_default(args, "tools", "");
+    let tools = string_vec_arg(args, "tools");
     let model = string_arg_default(args, "model", "aux");
     let max_turns = usize_arg(args, "max_turns", 20).max(1);
     let chain_id = Uuid::new_v4().to_string()[..6].to_string();
@@ -329,7 +329,7 @@ pub const TOOL_DEFS: &[ToolDef] = &[
             p_str_req("name", "Short name."),
             p_str_req("goals", "Task goals and context."),
             p_str("group", "Group (empty = current)."),
-            p_str("tools", "Extra tool names, comma-separated."),
+            p_str_array("tools", "Extra tool names."),
             p_str("model", "main or aux."),
             p_int("max_turns", "Max LLM turns."),
         ],
@@ -344,7 +344,7 @@ pub const TOOL_DEFS: &[ToolDef] = &[
                 "steps",
                 "JSON [{name, goals}]; {previous} expands to last result.",
             ),
-            p_str("tools", "Extra tools for all steps."),
+            p_str_array("tools", "Extra tools for all steps."),
             p_str("model", "main or aux."),
             p_int("max_turns", "Max LLM turns per step."),
         ],
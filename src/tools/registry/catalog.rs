@@ -1,3 +1,6 @@
+use std::collections::HashMap;
+use std::sync::OnceLock;
+
 use genai::chat::Tool;
 
 use crate::tools::spec::{ToolCategory, ToolDef};
@@ -6,7 +9,9 @@ use crate::tools::{browser, filesystem, image, knowledge_graph, research, shell,
 use super::ToolRegistry;
 use super::{actor_specs, builtin_specs, telegram_specs};
 
-/// All tool descriptors known to the runtime, in declaration order.
+/// All tool descriptors known to the runtime, in declaration order. This is
+/// the one list of tool modules; everything else reads the frozen copy
+/// from [`defs`].
 pub fn all_defs() -> impl Iterator<Item = &'static ToolDef> {
     filesystem::TOOL_DEFS
         .iter()
@@ -21,16 +26,63 @@ pub fn all_defs() -> impl Iterator<Item = &'static ToolDef> {
         .chain(knowledge_graph::TOOL_DEFS.iter())
 }
 
+/// The static tool table frozen once per process: defs and their rendered
+/// genai schemas as parallel vectors, plus a name index. The defs are
+/// `const` data, so nothing here ever needs rebuilding — and the tool loop
+/// asks for schemas on every iteration of every turn.
+struct Catalog {
+    defs: Vec<&'static ToolDef>,
+    schemas: Vec<Tool>,
+    index: HashMap<&'static str, usize>,
+}
+
+fn catalog() -> &'static Catalog {
+    static CATALOG: OnceLock<Catalog> = OnceLock::new();
+    CATALOG.get_or_init(|| {
+        let defs = all_defs().collect::<Vec<_>>();
+        let schemas = defs.iter().map(|def| def.to_genai_tool()).collect();
+        let mut index = HashMap::with_capacity(defs.len());
+        for (position, def) in defs.iter().enumerate() {
+            // First declaration wins, matching declaration-order lookup.
+            index.entry(def.name).or_insert(position);
+        }
+        Catalog {
+            defs,
+            schemas,
+            index,
+        }
+    })
+}
+
+/// The declared defs as one contiguous slice, collected once, so lookups
+/// that scan every tool don't re-walk the per-module chain.
+pub(super) fn defs() -> &'static [&'static ToolDef] {
+    &catalog().defs
+}
+
 pub fn find_def(name: &str) -> Option<&'static ToolDef> {
-    let name = name.trim();
-    all_defs().find(|def| def.name == name)
+    let catalog = catalog();
+    catalog
+        .index
+        .get(name.trim())
+        .map(|&position| catalog.defs[position])
 }
 
 impl<'a> ToolRegistry<'a> {
     pub fn tools(&self) -> Vec<Tool> {
-        all_defs()
-            .filter(|def| self.def_is_visible(def))
-            .map(ToolDef::to_genai_tool)
+        self.tools_matching(|def| self.def_is_visible(def))
+    }
+
+    /// Schemas of the defs accepted by `keep`, in declaration order. Clones
+    /// the frozen schema instead of re-rendering it from the def.
+    pub(super) fn tools_matching(&self, keep: impl Fn(&ToolDef) -> bool) -> Vec<Tool> {
+        let catalog = catalog();
+        catalog
+            .defs
+            .iter()
+            .zip(&catalog.schemas)
+            .filter(|(def, _)| keep(def))
+            .map(|(_, schema)| schema.clone())
             .collect()
     }
 
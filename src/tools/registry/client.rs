@@ -103,7 +103,7 @@ impl ClientToolContext {
         if let Some(reply_markup) = &reply_markup {
             payload["reply_markup"] = json!(reply_markup);
         }
-        serde_json::to_string_pretty(&payload).unwrap()
+        payload.to_string()
     }
 
     pub fn send_file(&self, file_path_or_url: &str, caption: &str, as_document: bool) -> String {
@@ -128,14 +128,14 @@ impl ClientToolContext {
         }) {
             return tool_error_payload("Client event receiver is unavailable.");
         }
-        serde_json::to_string_pretty(&json!({
+        json!({
             "success": true,
             "type": plan.send_type.as_str(),
             "filename": plan.filename,
             "chat_id": self.chat_id,
             "message_id": message_id,
-        }))
-        .unwrap()
+        })
+        .to_string()
     }
 
     pub fn react(&self, emoji: &str, message_id: i64) -> String {
@@ -160,12 +160,12 @@ impl ClientToolContext {
         }) {
             return tool_error_payload("Client event receiver is unavailable.");
         }
-        serde_json::to_string_pretty(&json!({
+        json!({
             "success": true,
             "emoji": emoji,
             "message_id": target_message_id,
-        }))
-        .unwrap()
+        })
+        .to_string()
     }
 
     fn next_message_id(&self) -> i64 {
@@ -48,6 +48,65 @@ fn exposes_core_tool_specs() {
     assert!(names.contains(&"todo_reminded".to_string()));
 }
 
+#[test]
+fn frozen_catalog_matches_declared_defs() {
+    for def in catalog::all_defs() {
+        let found = find_def(&format!(" {} ", def.name)).unwrap();
+        assert!(std::ptr::eq(found, def));
+    }
+    assert!(find_def("no_such_tool").is_none());
+
+    let (_tmp, memory, shell) = registry();
+    let registry = ToolRegistry::new(&memory, memory.workspace_dir(), "/tmp/lethe-cache", &shell);
+    let read_file = registry
+        .tools()
+        .into_iter()
+        .find(|tool| tool.name == "read_file")
+        .unwrap();
+    assert_eq!(
+        serde_json::to_value(read_file).unwrap(),
+        serde_json::to_value(find_def("read_file").unwrap().to_genai_tool()).unwrap()
+    );
+}
+
+#[test]
+fn every_frozen_schema_matches_a_fresh_render() {
+    // The catalog renders each schema once per process and hands out clones;
+    // this pins that nothing served from it differs from rendering the def now.
+    let (_tmp, memory, shell) = registry();
+    let registry = ToolRegistry::new(&memory, memory.workspace_dir(), "/tmp/lethe-cache", &shell);
+    let frozen = registry.tools_matching(|_| true);
+    let fresh = catalog::all_defs()
+        .map(|def| def.to_genai_tool())
+        .collect::<Vec<_>>();
+    assert_eq!(frozen.len(), fresh.len());
+    for (frozen, fresh) in frozen.into_iter().zip(fresh) {
+        assert_eq!(
+            serde_json::to_value(frozen).unwrap(),
+            serde_json::to_value(fresh).unwrap()
+        );
+    }
+}
+
+#[test]
+fn requestable_directory_is_memoized_per_shape() {
+    let principal = ToolContextShape {
+        has_actor: true,
+        ..ToolContextShape::default()
+    };
+    let subagent = ToolContextShape {
+        is_subagent: true,
+        ..principal
+    };
+    for shape in [ToolContextShape::default(), principal, subagent] {
+        assert_eq!(
+            requestable_tools_directory_for_shape(shape),
+            render_requestable_tools_directory(shape)
+        );
+    }
+    assert!(requestable_tools_directory_for_shape(ToolContextShape::default()).contains("- "));
+}
+
 #[test]
 fn active_tool_specs_start_small_and_expand_on_request() {
     let (_tmp, memory, shell) = registry();
@@ -6,6 +6,7 @@ use serde_json::Value;
 use uuid::Uuid;
 
 use crate::actor::{ActorState, Outcome, SpawnReport, SpawnSubagent};
+use crate::llm::response_format::first_json_object;
 use crate::tools::registry::ActorToolContext;
 use crate::tools::registry::ToolRegistry;
 use crate::tools::registry::args::{string_arg, string_arg_default, usize_arg};
@@ -96,7 +97,7 @@ async fn execute_research(registry: &ToolRegistry<'_>, args: &Value) -> String {
                 name: name.clone(),
                 goals,
                 group: None,
-                tools: "web_search,fetch_webpage".to_string(),
+                tools: vec!["web_search".to_string(), "fetch_webpage".to_string()],
                 model: "aux".to_string(),
                 max_turns: max_turns_per_hyp,
             })
@@ -168,7 +169,7 @@ async fn execute_research(registry: &ToolRegistry<'_>, args: &Value) -> String {
             name: judge_name,
             goals: judge_goals,
             group: None,
-            tools: String::new(),
+            tools: Vec::new(),
             model: "main".to_string(),
             max_turns: JUDGE_MAX_TURNS,
         })
@@ -206,7 +207,7 @@ async fn generate_hypotheses(
             name,
             goals,
             group: None,
-            tools: String::new(),
+            tools: Vec::new(),
             model: "aux".to_string(),
             max_turns: FRAMER_MAX_TURNS,
         })
@@ -223,14 +224,8 @@ async fn generate_hypotheses(
 
 fn parse_framer_hypotheses(text: &str) -> Result<Vec<String>, String> {
     let trimmed = text.trim();
-    let json_start = trimmed.find('{');
-    let json_end = trimmed.rfind('}');
-    let json_str = match (json_start, json_end) {
-        (Some(start), Some(end)) if end >= start => &trimmed[start..=end],
-        _ => return Err(format!("Framer returned no JSON object. Raw: {trimmed}")),
-    };
-    let value: Value = serde_json::from_str(json_str)
-        .map_err(|error| format!("Framer JSON parse error: {error}. Raw: {json_str}"))?;
+    let value = first_json_object(trimmed)
+        .ok_or_else(|| format!("Framer returned no JSON object. Raw: {trimmed}"))?;
     let array = value
         .get("hypotheses")
         .and_then(Value::as_array)
@@ -1,23 +1,27 @@
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::env;
 use std::fs;
 use std::io::{BufRead, BufReader, Read, Write};
 use std::path::{Path, PathBuf};
 use std::process::{Command, Stdio};
 use std::sync::atomic::{AtomicUsize, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Condvar, Mutex, OnceLock, PoisonError};
 use std::thread;
-use std::time::{Duration, Instant, SystemTime};
+use std::time::{Duration, Instant};
 
 use portable_pty::{ChildKiller, CommandBuilder, PtySize, native_pty_system};
 
 use crate::llm::truncate::{
-    DEFAULT_MAX_BYTES, DEFAULT_MAX_LINES, format_truncation_notice, truncate_tail,
+    DEFAULT_MAX_BYTES, DEFAULT_MAX_LINES, TruncatedBy, format_truncation_notice, truncate_tail,
 };
 
 pub const DEFAULT_TIMEOUT_SECONDS: u64 = 120;
 pub const MAX_TIMEOUT_SECONDS: u64 = 600;
 const TERMINAL_BUFFER_LIMIT: usize = 50_000;
+/// Lines kept per stream of a background process. Far above what
+/// `bash_output` can return after truncation, while a chatty long-lived job
+/// (`tail -f`, a dev server) no longer grows its history without bound.
+const BACKGROUND_OUTPUT_MAX_LINES: usize = 4096;
 
 #[derive(Clone, Copy, Debug, Eq, PartialEq)]
 pub enum ProcessStatus {
@@ -36,13 +40,41 @@ impl ProcessStatus {
     }
 }
 
+/// The most recent lines of one output stream, oldest first.
+#[derive(Debug, Default)]
+pub struct OutputLines {
+    lines: VecDeque<String>,
+    /// Lines that fell off the front of the window.
+    dropped: usize,
+}
+
+impl OutputLines {
+    pub fn push(&mut self, line: String) {
+        if self.lines.len() == BACKGROUND_OUTPUT_MAX_LINES {
+            self.lines.pop_front();
+            self.dropped += 1;
+        }
+        self.lines.push_back(line);
+    }
+
+    pub fn iter(&self) -> impl Iterator<Item = &str> {
+        self.lines.iter().map(String::as_str)
+    }
+
+    pub fn dropped(&self) -> usize {
+        self.dropped
+    }
+}
+
 pub struct BackgroundProcess {
     pub command: String,
-    pub stdout: Vec<String>,
-    pub stderr: Vec<String>,
+    pub stdout: OutputLines,
+    pub stderr: OutputLines,
     pub status: ProcessStatus,
     pub exit_code: Option<i32>,
-    pub start_time: SystemTime,
+    /// Monotonic, so the `/bg` runtime can neither fail nor jump with the
+    /// wall clock.
+    pub started: Instant,
     pub pid: u32,
     pub is_pty: bool,
     pub terminal_buffer: String,
@@ -68,6 +100,10 @@ impl ShellTools {
         }
     }
 
+    /// Resolves the working directory (`USER_CWD`, else the process cwd) once;
+    /// each command then gets it via `current_dir` and inherits the process
+    /// environment with only `TERM` overridden, so no per-call lookup or env
+    /// copy is needed.
     pub fn from_env() -> Self {
         let cwd = env::var_os("USER_CWD")
             .map(PathBuf::from)
@@ -111,21 +147,27 @@ impl ShellTools {
             );
         }
 
-        let mut lines = Vec::new();
-        lines.extend(process.stdout.iter().cloned());
-        lines.extend(process.stderr.iter().cloned());
-
-        if !filter_pattern.is_empty() {
-            lines.retain(|line| line.contains(filter_pattern));
-        }
+        // Borrowed from the buffers: only the lines that survive the filter
+        // and the tail window are ever copied, into the joined output.
+        let mut lines = process
+            .stdout
+            .iter()
+            .chain(process.stderr.iter())
+            .filter(|line| filter_pattern.is_empty() || line.contains(filter_pattern))
+            .collect::<Vec<_>>();
 
-        let omitted = if last_lines > 0 && lines.len() > last_lines {
+        let mut omitted = if last_lines > 0 && lines.len() > last_lines {
             let omitted = lines.len() - last_lines;
-            lines = lines[omitted..].to_vec();
+            lines.drain(..omitted);
             omitted
         } else {
             0
         };
+        // Lines already dropped from the window only count when unfiltered;
+        // whether they would have matched is unknown.
+        if filter_pattern.is_empty() {
+            omitted += process.stdout.dropped() + process.stderr.dropped();
+        }
 
         let mut output = lines.join("\n");
         if omitted > 0 {
@@ -229,13 +271,18 @@ impl ShellTools {
     }
 
     pub fn get_environment_info(&self) -> String {
-        let os = Command::new("uname")
-            .arg("-a")
-            .output()
-            .ok()
-            .filter(|output| output.status.success())
-            .map(|output| String::from_utf8_lossy(&output.stdout).trim().to_string())
-            .unwrap_or_else(|| "unknown".to_string());
+        // The kernel does not change under a running process: spawn `uname`
+        // once, not on every call.
+        static OS: OnceLock<String> = OnceLock::new();
+        let os = OS.get_or_init(|| {
+            Command::new("uname")
+                .arg("-a")
+                .output()
+                .ok()
+                .filter(|output| output.status.success())
+                .map(|output| String::from_utf8_lossy(&output.stdout).trim().to_string())
+                .unwrap_or_else(|| "unknown".to_string())
+        });
 
         [
             "Environment Information:".to_string(),
@@ -285,14 +332,14 @@ impl ShellTools {
             return "(no background processes)".to_string();
         }
 
-        let mut lines = Vec::new();
+        let now = Instant::now();
+        let mut lines = Vec::with_capacity(processes.len());
         for (shell_id, process) in processes.iter() {
             let process = process.lock().expect("background process lock");
-            let runtime = process
-                .start_time
-                .elapsed()
-                .map(|elapsed| format!(", runtime: {}s", elapsed.as_secs()))
-                .unwrap_or_default();
+            let runtime = format!(
+                ", runtime: {}s",
+                now.saturating_duration_since(process.started).as_secs()
+            );
             let mode = if process.is_pty { "PTY" } else { "subprocess" };
             lines.push(format!(
                 "{shell_id}: {} ({}, {mode}{runtime})",
@@ -342,17 +389,19 @@ impl ShellTools {
 
         let stdout = join_reader(stdout);
         let stderr = join_reader(stderr);
-        let mut parts = Vec::new();
-        if !stdout.is_empty() {
-            parts.push(stdout);
-        }
+        let dropped_lines = stdout.dropped_lines + stderr.dropped_lines;
+        let dropped_bytes = stdout.dropped_bytes + stderr.dropped_bytes;
+        // stderr is appended to the stdout buffer in place rather than both
+        // being collected into parts and joined into a third copy.
+        let mut output = stdout.text();
+        let stderr = stderr.text();
         if !stderr.is_empty() {
-            if !parts.is_empty() {
-                parts.push("--- stderr ---".to_string());
+            if !output.is_empty() {
+                output.push_str("\n--- stderr ---\n");
             }
-            parts.push(stderr);
+            output.push_str(&stderr);
         }
-        let output = truncate_output(parts.join("\n").trim());
+        let output = truncate_output_after_dropped(output.trim(), dropped_lines, dropped_bytes);
 
         if timed_out {
             return if output.is_empty() {
@@ -385,11 +434,11 @@ impl ShellTools {
 
         let process = Arc::new(Mutex::new(BackgroundProcess {
             command: command.to_string(),
-            stdout: Vec::new(),
-            stderr: Vec::new(),
+            stdout: OutputLines::default(),
+            stderr: OutputLines::default(),
             status: ProcessStatus::Running,
             exit_code: None,
-            start_time: SystemTime::now(),
+            started: Instant::now(),
             pid,
             is_pty: false,
             terminal_buffer: String::new(),
@@ -409,49 +458,11 @@ impl ShellTools {
             spawn_pipe_collector(stderr, process.clone(), true);
         }
 
-        let monitor_process = process.clone();
-        let monitor_pid = pid;
-        thread::spawn(move || {
-            let started = Instant::now();
-            loop {
-                match child.try_wait() {
-                    Ok(Some(status)) => {
-                        let mut process = monitor_process.lock().expect("background process lock");
-                        process.exit_code = status.code();
-                        process.status = if status.success() {
-                            ProcessStatus::Completed
-                        } else {
-                            ProcessStatus::Failed
-                        };
-                        return;
-                    }
-                    Ok(None) => {
-                        if started.elapsed() > Duration::from_secs(timeout_seconds) {
-                            // Kill the whole group, not just the shell, so any
-                            // children it spawned are reaped too.
-                            kill_process_group(monitor_pid);
-                            let _ = child.kill();
-                            let _ = child.wait();
-                            let mut process =
-                                monitor_process.lock().expect("background process lock");
-                            process.status = ProcessStatus::Failed;
-                            process
-                                .stderr
-                                .push(format!("Command timed out after {timeout_seconds}s"));
-                            return;
-                        }
-                        thread::sleep(Duration::from_millis(25));
-                    }
-                    Err(error) => {
-                        let mut process = monitor_process.lock().expect("background process lock");
-                        process.status = ProcessStatus::Failed;
-                        process
-                            .stderr
-                            .push(format!("Process monitor error: {error}"));
-                        return;
-                    }
-                }
-            }
+        watch_process(Watch {
+            child: WatchedChild::Plain(child),
+            process,
+            deadline: Instant::now() + Duration::from_secs(timeout_seconds),
+            timeout_seconds,
         });
 
         format!(
@@ -495,11 +506,11 @@ impl ShellTools {
 
         let process = Arc::new(Mutex::new(BackgroundProcess {
             command: command.to_string(),
-            stdout: Vec::new(),
-            stderr: Vec::new(),
+            stdout: OutputLines::default(),
+            stderr: OutputLines::default(),
             status: ProcessStatus::Running,
             exit_code: None,
-            start_time: SystemTime::now(),
+            started: Instant::now(),
             pid,
             is_pty: true,
             terminal_buffer: String::new(),
@@ -513,54 +524,11 @@ impl ShellTools {
             .insert(shell_id.clone(), process.clone());
 
         spawn_pty_collector(reader, process.clone());
-
-        thread::spawn(move || {
-            let started = Instant::now();
-            loop {
-                match child.try_wait() {
-                    Ok(Some(status)) => {
-                        let mut process = process.lock().expect("background process lock");
-                        process.exit_code = Some(status.exit_code() as i32);
-                        process.status = if status.success() {
-                            ProcessStatus::Completed
-                        } else {
-                            ProcessStatus::Failed
-                        };
-                        process.pty_writer = None;
-                        process.pty_killer = None;
-                        return;
-                    }
-                    Ok(None) => {
-                        if started.elapsed() > Duration::from_secs(timeout_seconds) {
-                            let _ = child.kill();
-                            let _ = child.wait();
-                            let mut process = process.lock().expect("background process lock");
-                            process.status = ProcessStatus::Failed;
-                            process.exit_code = Some(1);
-                            process.pty_writer = None;
-                            process.pty_killer = None;
-                            push_terminal_output(
-                                &mut process,
-                                &format!("\nCommand timed out after {timeout_seconds}s\n"),
-                            );
-                            return;
-                        }
-                        thread::sleep(Duration::from_millis(25));
-                    }
-                    Err(error) => {
-                        let mut process = process.lock().expect("background process lock");
-                        process.status = ProcessStatus::Failed;
-                        process.exit_code = Some(1);
-                        process.pty_writer = None;
-                        process.pty_killer = None;
-                        push_terminal_output(
-                            &mut process,
-                            &format!("\nProcess monitor error: {error}\n"),
-                        );
-                        return;
-                    }
-                }
-            }
+        watch_process(Watch {
+            child: WatchedChild::Pty(child),
+            process,
+            deadline: Instant::now() + Duration::from_secs(timeout_seconds),
+            timeout_seconds,
         });
 
         format!(
@@ -580,12 +548,162 @@ impl ShellTools {
             .cloned()
     }
 
+    /// Ids come from one counter shared by every clone of this `ShellTools`,
+    /// so concurrent bash calls can never hand out the same id and overwrite
+    /// each other's registry entry. Uniqueness is all the atomic has to
+    /// provide; the registry mutex orders everything else.
     fn next_shell_id(&self) -> String {
-        let next = self.next_id.fetch_add(1, Ordering::SeqCst) + 1;
+        let next = self.next_id.fetch_add(1, Ordering::Relaxed) + 1;
         format!("bash_{next}")
     }
 }
 
+/// How often the reaper checks watched background processes.
+const REAPER_INTERVAL: Duration = Duration::from_millis(25);
+
+enum WatchedChild {
+    Plain(std::process::Child),
+    Pty(Box<dyn portable_pty::Child + Send + Sync>),
+}
+
+/// A background process the reaper retires once it exits or times out.
+struct Watch {
+    child: WatchedChild,
+    process: SharedProcess,
+    deadline: Instant,
+    timeout_seconds: u64,
+}
+
+impl Watch {
+    /// One reaper pass over this process: records its exit status, or hands
+    /// it off to be killed once past its deadline. Returns the watch if it
+    /// is still running. The exit check always runs first, so a process that
+    /// finished just before its deadline is never reported as timed out, and
+    /// a finished process leaves the list: no timer outlives it.
+    fn poll(mut self, now: Instant) -> Option<Self> {
+        let exited = match &mut self.child {
+            WatchedChild::Plain(child) => child
+                .try_wait()
+                .map(|status| status.map(|status| (status.code(), status.success()))),
+            WatchedChild::Pty(child) => child.try_wait().map(|status| {
+                status.map(|status| (Some(status.exit_code() as i32), status.success()))
+            }),
+        };
+        match exited {
+            Ok(Some((exit_code, success))) => {
+                let status = if success {
+                    ProcessStatus::Completed
+                } else {
+                    ProcessStatus::Failed
+                };
+                self.record(exit_code, status, None);
+                None
+            }
+            // Killing can block (a PTY child gets a SIGHUP grace period), so
+            // it runs off the reaper thread rather than stalling every other
+            // watch behind it.
+            Ok(None) if now >= self.deadline => {
+                thread::spawn(move || self.time_out());
+                None
+            }
+            Ok(None) => Some(self),
+            Err(error) => {
+                let exit_code = self.is_pty().then_some(1);
+                self.record(
+                    exit_code,
+                    ProcessStatus::Failed,
+                    Some(&format!("Process monitor error: {error}")),
+                );
+                None
+            }
+        }
+    }
+
+    fn time_out(mut self) {
+        match &mut self.child {
+            WatchedChild::Plain(child) => {
+                // Kill the whole group, not just the shell, so any children
+                // it spawned are reaped too.
+                kill_process_group(child.id());
+                let _ = child.kill();
+                let _ = child.wait();
+            }
+            WatchedChild::Pty(child) => {
+                let _ = child.kill();
+                let _ = child.wait();
+            }
+        }
+        let exit_code = self.is_pty().then_some(1);
+        let notice = format!("Command timed out after {}s", self.timeout_seconds);
+        self.record(exit_code, ProcessStatus::Failed, Some(&notice));
+    }
+
+    fn is_pty(&self) -> bool {
+        matches!(self.child, WatchedChild::Pty(_))
+    }
+
+    fn record(&self, exit_code: Option<i32>, status: ProcessStatus, notice: Option<&str>) {
+        let mut process = self.process.lock().unwrap_or_else(PoisonError::into_inner);
+        if exit_code.is_some() {
+            process.exit_code = exit_code;
+        }
+        process.status = status;
+        if self.is_pty() {
+            process.pty_writer = None;
+            process.pty_killer = None;
+            if let Some(notice) = notice {
+                push_terminal_output(&mut process, &format!("\n{notice}\n"));
+            }
+        } else if let Some(notice) = notice {
+            process.stderr.push(notice.to_string());
+        }
+    }
+}
+
+/// Hand a background process to the shared reaper. One thread polls every
+/// watched child (and sleeps on a condvar while there are none) instead of
+/// one polling thread per process. Watches are polled outside the list lock,
+/// and a poisoned lock is recovered rather than taking the reaper down with
+/// every background job it watches.
+fn watch_process(watch: Watch) {
+    static REAPER: OnceLock<Arc<(Mutex<Vec<Watch>>, Condvar)>> = OnceLock::new();
+    let reaper = REAPER.get_or_init(|| {
+        let reaper = Arc::new((Mutex::new(Vec::new()), Condvar::new()));
+        let shared = reaper.clone();
+        thread::spawn(move || {
+            let (watched, wake) = &*shared;
+            loop {
+                let batch = {
+                    let mut watched = watched.lock().unwrap_or_else(PoisonError::into_inner);
+                    while watched.is_empty() {
+                        watched = wake.wait(watched).unwrap_or_else(PoisonError::into_inner);
+                    }
+                    std::mem::take(&mut *watched)
+                };
+                let now = Instant::now();
+                let running: Vec<Watch> = batch
+                    .into_iter()
+                    .filter_map(|watch| watch.poll(now))
+                    .collect();
+                if !running.is_empty() {
+                    watched
+                        .lock()
+                        .unwrap_or_else(PoisonError::into_inner)
+                        .extend(running);
+                }
+                thread::sleep(REAPER_INTERVAL);
+            }
+        });
+        reaper
+    });
+    let (watched, wake) = &**reaper;
+    watched
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .push(watch);
+    wake.notify_one();
+}
+
 fn shell_command(command: &str, cwd: &Path) -> Command {
     let mut cmd = Command::new("/bin/bash");
     cmd.arg("-lc")
@@ -628,32 +746,109 @@ fn kill_process_group(pid: u32) {
 }
 
 fn truncate_output(output: &str) -> String {
-    let result = truncate_tail(output, DEFAULT_MAX_LINES, DEFAULT_MAX_BYTES);
+    truncate_output_after_dropped(output, 0, 0)
+}
+
+/// [`truncate_output`] for output whose first `dropped_lines` lines
+/// (`dropped_bytes` bytes) were already discarded while it was read; they
+/// still count toward the totals in the truncation notice.
+fn truncate_output_after_dropped(
+    output: &str,
+    dropped_lines: usize,
+    dropped_bytes: usize,
+) -> String {
+    // Nearly every result fits; settle that with a byte count and a newline
+    // scan rather than letting `truncate_tail` split it into a line vector.
+    if dropped_lines == 0
+        && output.len() <= DEFAULT_MAX_BYTES
+        && output.bytes().filter(|&byte| byte == b'\n').count() < DEFAULT_MAX_LINES
+    {
+        return output.to_string();
+    }
+    let mut result = truncate_tail(output, DEFAULT_MAX_LINES, DEFAULT_MAX_BYTES);
     if !result.truncated {
-        return result.content;
+        if dropped_lines == 0 {
+            return result.content;
+        }
+        // Trimming can shrink a dropped-from tail back under the limits; the
+        // notice still has to say that earlier lines are missing.
+        result.truncated = true;
+        result.truncated_by = Some(TruncatedBy::Lines);
     }
+    result.total_lines += dropped_lines;
+    result.total_bytes += dropped_bytes;
     let start_line = result.total_lines.saturating_sub(result.output_lines) + 1;
     let notice = format_truncation_notice(&result, start_line, None);
-    format!("{}\n\n{notice}", result.content)
+    let mut content = result.content;
+    content.push_str("\n\n");
+    content.push_str(&notice);
+    content
 }
 
-fn read_pipe<R>(pipe: R) -> thread::JoinHandle<Vec<String>>
+/// The tail of a foreground command's stream. Output is only ever shown
+/// tail-truncated to `DEFAULT_MAX_LINES`/`DEFAULT_MAX_BYTES`, so lines are
+/// dropped from the front as they arrive once the rest alone exceeds either
+/// limit: `find /` no longer buffers hundreds of megabytes just for the
+/// truncation to throw them away, and neither do a few thousand long lines.
+#[derive(Debug, Default)]
+struct PipeTail {
+    lines: VecDeque<String>,
+    bytes: usize,
+    dropped_lines: usize,
+    dropped_bytes: usize,
+}
+
+impl PipeTail {
+    fn push(&mut self, line: String) {
+        self.bytes += line.len() + 1;
+        self.lines.push_back(line);
+        while let Some(front) = self.lines.front() {
+            let front_bytes = front.len() + 1;
+            // The front line can only be shown while the rest fits both
+            // limits; once the rest exceeds either one, `truncate_tail` stops
+            // before reaching it. (`bytes` counts a newline per line, one
+            // more than the joined text.)
+            if self.lines.len() - 1 <= DEFAULT_MAX_LINES
+                && self.bytes - front_bytes <= DEFAULT_MAX_BYTES + 1
+            {
+                break;
+            }
+            self.lines.pop_front();
+            self.bytes -= front_bytes;
+            self.dropped_lines += 1;
+            self.dropped_bytes += front_bytes;
+        }
+    }
+
+    fn text(&self) -> String {
+        let mut text = String::with_capacity(self.bytes);
+        for (index, line) in self.lines.iter().enumerate() {
+            if index > 0 {
+                text.push('\n');
+            }
+            text.push_str(line);
+        }
+        text
+    }
+}
+
+fn read_pipe<R>(pipe: R) -> thread::JoinHandle<PipeTail>
 where
     R: std::io::Read + Send + 'static,
 {
     thread::spawn(move || {
-        BufReader::new(pipe)
-            .lines()
-            .map_while(Result::ok)
-            .collect::<Vec<_>>()
+        let mut tail = PipeTail::default();
+        for line in BufReader::new(pipe).lines().map_while(Result::ok) {
+            tail.push(line);
+        }
+        tail
     })
 }
 
-fn join_reader(handle: Option<thread::JoinHandle<Vec<String>>>) -> String {
+fn join_reader(handle: Option<thread::JoinHandle<PipeTail>>) -> PipeTail {
     handle
         .and_then(|handle| handle.join().ok())
         .unwrap_or_default()
-        .join("\n")
 }
 
 fn spawn_pipe_collector<R>(pipe: R, process: SharedProcess, stderr: bool)
@@ -913,6 +1108,38 @@ mod tests {
         assert_eq!(shell_id_arg(&json!({})), "");
     }
 
+    #[test]
+    fn shell_ids_stay_unique_across_concurrent_clones() {
+        let shell = ShellTools::new(".");
+        let handles: Vec<_> = (0..8)
+            .map(|_| {
+                let shell = shell.clone();
+                std::thread::spawn(move || {
+                    (0..100).map(|_| shell.next_shell_id()).collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        let mut ids = std::collections::HashSet::new();
+        for handle in handles {
+            for id in handle.join().unwrap() {
+                assert!(ids.insert(id.clone()), "duplicate shell id {id}");
+            }
+        }
+        assert_eq!(ids.len(), 800);
+    }
+
+    #[test]
+    fn foreground_commands_run_in_the_configured_directory() {
+        let tmp = tempdir().unwrap();
+        let shell = ShellTools::new(tmp.path());
+        let cwd = tmp.path().canonicalize().unwrap();
+
+        assert_eq!(
+            shell.bash("pwd -P", 5, false, false),
+            cwd.display().to_string()
+        );
+    }
+
     #[test]
     fn foreground_command_captures_stdout_stderr_and_exit_code() {
         let tmp = tempdir().unwrap();
@@ -933,6 +1160,41 @@ mod tests {
             shell.bash("true", 5, false, false),
             "(command completed with no output)"
         );
+        assert_eq!(
+            shell.bash("echo out; echo err >&2", 5, false, false),
+            "out\n--- stderr ---\nerr"
+        );
+    }
+
+    #[test]
+    fn foreground_output_keeps_only_a_bounded_tail() {
+        let mut tail = PipeTail::default();
+        let total = 20 * DEFAULT_MAX_LINES;
+        for index in 0..total {
+            tail.push(format!("{index:0>40}"));
+        }
+        assert!(tail.dropped_lines > 0);
+        assert!(tail.lines.len() <= DEFAULT_MAX_LINES + 2);
+        assert_eq!(tail.lines.len() + tail.dropped_lines, total);
+
+        let output =
+            truncate_output_after_dropped(&tail.text(), tail.dropped_lines, tail.dropped_bytes);
+        assert!(output.contains(&format!("{:0>40}", total - 1)));
+        assert!(output.contains(&format!("of {total}")), "output: {output}");
+
+        // Long lines are bounded by bytes, not by the line limit.
+        let mut tail = PipeTail::default();
+        let long_line = "x".repeat(100 * 1024);
+        for _ in 0..DEFAULT_MAX_LINES {
+            tail.push(long_line.clone());
+        }
+        assert!(tail.lines.len() <= 2, "kept {} lines", tail.lines.len());
+        assert!(tail.bytes <= DEFAULT_MAX_BYTES + 2 * (long_line.len() + 1));
+
+        // A kept tail that trims back under the limits still gets a notice.
+        let output = truncate_output_after_dropped("last", 5, 50);
+        assert!(output.starts_with("last\n\n["), "output: {output}");
+        assert!(output.contains("of 6"), "output: {output}");
     }
 
     #[test]
@@ -1007,6 +1269,40 @@ mod tests {
         assert!(!filtered.contains("keep 1\n"));
     }
 
+    #[test]
+    fn background_output_keeps_a_bounded_window() {
+        let mut output = OutputLines::default();
+        for index in 0..BACKGROUND_OUTPUT_MAX_LINES + 3 {
+            output.push(index.to_string());
+        }
+        assert_eq!(output.dropped(), 3);
+        assert_eq!(output.iter().count(), BACKGROUND_OUTPUT_MAX_LINES);
+        assert_eq!(output.iter().next(), Some("3"));
+    }
+
+    #[test]
+    fn background_process_that_exits_early_is_not_timed_out() {
+        let tmp = tempdir().unwrap();
+        let shell = ShellTools::new(tmp.path());
+        let start = shell.bash("echo done", 1, true, false);
+        let shell_id = extract_shell_id(&start);
+
+        let mut listing = String::new();
+        for _ in 0..100 {
+            listing = shell.list_background();
+            if listing.contains("completed") {
+                break;
+            }
+            std::thread::sleep(Duration::from_millis(50));
+        }
+        assert!(listing.contains("completed"), "listing was: {listing:?}");
+
+        // Past the deadline the finished process stays completed.
+        std::thread::sleep(Duration::from_millis(1200));
+        assert!(shell.list_background().contains("completed"));
+        assert!(!shell.bash_output(shell_id, "", 0).contains("timed out"));
+    }
+
     #[test]
     fn kill_background_process() {
         let tmp = tempdir().unwrap();
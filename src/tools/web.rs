@@ -1,12 +1,76 @@
+use std::collections::HashMap;
 use std::env;
 use std::fs;
 use std::path::PathBuf;
+use std::sync::{Mutex, OnceLock, PoisonError};
+use std::time::{Duration, Instant};
 
 use chrono::Local;
 use reqwest::blocking::Client;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
 
+/// Process-wide blocking HTTP client for tool calls. Each actor turn builds
+/// its own `ToolRegistry`, and a `Client::new()` per call meant a fresh
+/// connection pool and TLS handshake for every request; one shared client
+/// keeps connections warm across turns and across concurrent actors.
+/// Telegram sends and voice transcription reuse it for the same reason.
+pub(crate) fn shared_client() -> &'static Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT.get_or_init(Client::new)
+}
+
+/// How long a fetched page is reused before it is fetched again.
+const FETCH_CACHE_TTL: Duration = Duration::from_secs(10 * 60);
+const FETCH_CACHE_MAX_ENTRIES: usize = 256;
+
+/// Successful `fetch_webpage` results keyed by (url, max_chars). Agents
+/// re-read the same page across iterations of a task and across actors;
+/// each fetch is a paid Exa round-trip of a second or more. A cached reply
+/// says so (`cached`, `age_seconds`), and `fresh` bypasses the cache for a
+/// page the agent expects to have just changed.
+#[derive(Debug, Default)]
+struct FetchCache {
+    entries: HashMap<(String, usize), (Instant, Value)>,
+}
+
+impl FetchCache {
+    fn get(&self, url: &str, max_chars: usize, now: Instant) -> Option<Value> {
+        let (fetched_at, body) = self.entries.get(&(url.to_string(), max_chars))?;
+        let age = now.duration_since(*fetched_at);
+        if age >= FETCH_CACHE_TTL {
+            return None;
+        }
+        let mut body = body.clone();
+        if let Some(fields) = body.as_object_mut() {
+            fields.insert("cached".to_string(), json!(true));
+            fields.insert("age_seconds".to_string(), json!(age.as_secs()));
+        }
+        Some(body)
+    }
+
+    fn insert(&mut self, url: &str, max_chars: usize, body: Value, now: Instant) {
+        self.entries
+            .retain(|_, (fetched_at, _)| now.duration_since(*fetched_at) < FETCH_CACHE_TTL);
+        if self.entries.len() >= FETCH_CACHE_MAX_ENTRIES
+            && let Some(oldest) = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (fetched_at, _))| *fetched_at)
+                .map(|(key, _)| key.clone())
+        {
+            self.entries.remove(&oldest);
+        }
+        self.entries
+            .insert((url.to_string(), max_chars), (now, body));
+    }
+}
+
+fn fetch_cache() -> &'static Mutex<FetchCache> {
+    static CACHE: OnceLock<Mutex<FetchCache>> = OnceLock::new();
+    CACHE.get_or_init(Mutex::default)
+}
+
 #[derive(Clone, Debug)]
 pub struct WebTools {
     cache_dir: PathBuf,
@@ -51,7 +115,7 @@ impl WebTools {
             payload["category"] = json!(category.to_ascii_lowercase());
         }
 
-        let response = match Client::new()
+        let response = match shared_client()
             .post("https://api.exa.ai/search")
             .header("x-api-key", api_key)
             .header("Content-Type", "application/json")
@@ -73,12 +137,12 @@ impl WebTools {
             Err(error) => return error_json(&format!("Invalid Exa response: {error}")),
         };
         if data.results.is_empty() {
-            return serde_json::to_string_pretty(&json!({
+            return json!({
                 "status": "OK",
                 "query": query,
                 "message": "No results found.",
-            }))
-            .unwrap();
+            })
+            .to_string();
         }
 
         let raw_file = self
@@ -89,15 +153,24 @@ impl WebTools {
         formatted
     }
 
-    pub fn fetch_webpage(&self, url: &str, max_chars: usize) -> String {
+    pub fn fetch_webpage(&self, url: &str, max_chars: usize, fresh: bool) -> String {
         let Some(api_key) = exa_api_key() else {
             return error_json("Exa API not configured. Set EXA_API_KEY environment variable.");
         };
+        let max_chars = max_chars.clamp(1, 50_000);
+        if !fresh
+            && let Some(cached) = fetch_cache()
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .get(url, max_chars, Instant::now())
+        {
+            return cached.to_string();
+        }
         let payload = json!({
             "ids": [url],
-            "text": {"maxCharacters": max_chars.clamp(1, 50_000)},
+            "text": {"maxCharacters": max_chars},
         });
-        let response = match Client::new()
+        let response = match shared_client()
             .post("https://api.exa.ai/contents")
             .header("x-api-key", api_key)
             .header("Content-Type", "application/json")
@@ -119,13 +192,18 @@ impl WebTools {
         let Some(result) = data.results.into_iter().next() else {
             return error_json(&format!("Could not fetch content from {url}"));
         };
-        serde_json::to_string_pretty(&json!({
+        let body = json!({
             "status": "OK",
             "url": result.url.unwrap_or_else(|| url.to_string()),
             "title": result.title.unwrap_or_default(),
             "text": result.text.unwrap_or_default(),
-        }))
-        .unwrap()
+        });
+        let reply = body.to_string();
+        fetch_cache()
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .insert(url, max_chars, body, Instant::now());
+        reply
     }
 
     fn save_raw_results(&self, query: &str, results: &[ExaResult]) -> std::io::Result<String> {
@@ -208,11 +286,11 @@ fn format_raw_results(query: &str, results: &[ExaResult], max_chars: usize) -> S
 }
 
 fn error_json(message: &str) -> String {
-    serde_json::to_string_pretty(&json!({
+    json!({
         "status": "error",
         "message": message,
-    }))
-    .unwrap()
+    })
+    .to_string()
 }
 
 fn trim(value: &str, max_chars: usize) -> String {
@@ -259,9 +337,11 @@ fn exec_web_search(registry: &ToolRegistry<'_>, args: &Value) -> String {
 }
 
 fn exec_fetch_webpage(registry: &ToolRegistry<'_>, args: &Value) -> String {
-    registry
-        .web
-        .fetch_webpage(&string_arg(args, "url"), usize_arg(args, "max_chars", 5000))
+    registry.web.fetch_webpage(
+        &string_arg(args, "url"),
+        usize_arg(args, "max_chars", 5000),
+        bool_arg(args, "fresh", false),
+    )
 }
 
 pub const TOOL_DEFS: &[ToolDef] = &[
@@ -286,6 +366,10 @@ pub const TOOL_DEFS: &[ToolDef] = &[
         params: &[
             p_str_req("url", "URL."),
             p_int("max_chars", "Max characters."),
+            p_bool(
+                "fresh",
+                "Bypass the 10-minute cache, e.g. to see a change you just made (default false).",
+            ),
         ],
         category: ToolCategory::Requestable,
         execute: ToolExecutor::Sync(exec_fetch_webpage),
@@ -303,7 +387,7 @@ mod tests {
         }
         let tools = WebTools::new("/tmp/lethe-web-test");
         let result = tools.web_search("rust", 3, false, "");
-        assert!(result.contains("\"status\": \"error\""));
+        assert!(result.contains("\"status\":\"error\""));
         assert!(result.contains("EXA_API_KEY"));
     }
 
@@ -326,6 +410,33 @@ mod tests {
         assert!(!valid_category("bad"));
     }
 
+    #[test]
+    fn fetch_cache_expires_entries_and_evicts_the_oldest() {
+        let start = Instant::now();
+        let mut cache = FetchCache::default();
+        cache.insert("https://a", 100, json!({"text": "a"}), start);
+        let hit = cache
+            .get("https://a", 100, start + Duration::from_secs(30))
+            .unwrap();
+        assert_eq!(hit["text"], "a");
+        assert_eq!(hit["cached"], true);
+        assert_eq!(hit["age_seconds"], 30);
+        assert_eq!(cache.get("https://a", 200, start), None);
+        assert_eq!(cache.get("https://a", 100, start + FETCH_CACHE_TTL), None);
+
+        for index in 0..FETCH_CACHE_MAX_ENTRIES {
+            cache.insert(
+                &format!("https://{index}"),
+                100,
+                json!({"text": index}),
+                start + Duration::from_millis(index as u64 + 1),
+            );
+        }
+        assert_eq!(cache.entries.len(), FETCH_CACHE_MAX_ENTRIES);
+        assert_eq!(cache.get("https://a", 100, start), None);
+        assert!(cache.get("https://0", 100, start).is_some());
+    }
+
     #[test]
     fn fetch_without_api_key_returns_error() {
         unsafe {
@@ -334,7 +445,7 @@ mod tests {
         let tools = WebTools::new("/tmp/lethe-web-test");
         assert!(
             tools
-                .fetch_webpage("https://example.com", 100)
+                .fetch_webpage("https://example.com", 100, false)
                 .contains("EXA_API_KEY")
         );
     }
@@ -35,6 +35,12 @@ use crate::tui::view;
 const CHAT_ID: i64 = 1;
 const USER_ID: i64 = 1;
 const ACTOR_REFRESH_DEBOUNCE: Duration = Duration::from_millis(200);
+/// Longest the loop sleeps with nothing happening. Nothing on screen changes
+/// with time while idle, so this is only a safety net, not a refresh clock.
+const IDLE_REDRAW_FALLBACK: Duration = Duration::from_secs(30);
+/// Upper bound on queued UI events applied before the next redraw, so a
+/// flood of deltas can't starve keyboard input.
+const MAX_UI_EVENTS_PER_FRAME: usize = 256;
 
 #[derive(Clone, Debug)]
 pub struct TuiOptions {
@@ -141,10 +147,11 @@ async fn drive(
     let mut pending_actor_refresh: Option<tokio::time::Instant> = None;
 
     let mut key_stream = EventStream::new();
+    let mut transcript_cache = view::transcript::TranscriptCache::default();
 
     loop {
         terminal.draw(|frame| {
-            view::draw(frame, &mut app, &editor);
+            view::draw(frame, &mut app, &editor, &mut transcript_cache);
             draw_autocomplete_popup(frame, &editor, &autocomplete);
         })?;
 
@@ -165,17 +172,14 @@ async fn drive(
             // Streamed UI updates from the server.
             event = ui_rx.recv() => {
                 if let Some(event) = event {
-                    if let UiEvent::ActorEvent { .. } = &event {
-                        pending_actor_refresh = Some(
-                            tokio::time::Instant::now() + ACTOR_REFRESH_DEBOUNCE,
-                        );
+                    absorb_ui_event(event, &mut app, &cmd_tx, &mut pending_actor_refresh);
+                    // A streamed reply arrives as many small deltas; fold
+                    // whatever is already queued into this frame rather than
+                    // re-rendering the whole transcript once per delta.
+                    for _ in 0..MAX_UI_EVENTS_PER_FRAME {
+                        let Ok(event) = ui_rx.try_recv() else { break };
+                        absorb_ui_event(event, &mut app, &cmd_tx, &mut pending_actor_refresh);
                     }
-                    if let UiEvent::ToolEnd { name, .. } = &event {
-                        if name.starts_with("todo") {
-                            let _ = cmd_tx.try_send(AppCommand::RefreshTodos);
-                        }
-                    }
-                    app.apply_event(event);
                 }
             }
             // App-internal commands from the keyboard handler.
@@ -206,14 +210,33 @@ async fn drive(
                             app.push_notice("cancelled");
                             app.status = crate::tui::state::Status::Idle;
                         }
-                        AppCommand::RefreshActors => match client.list_actors().await {
-                            Ok(actors) => app.replace_actors(actors),
-                            Err(error) => tracing::warn!(error = %error, "list_actors failed"),
-                        },
-                        AppCommand::RefreshTodos => match client.list_todos(false).await {
-                            Ok(todos) => app.replace_todos(todos),
-                            Err(error) => tracing::warn!(error = %error, "list_todos failed"),
-                        },
+                        // Sidebar fetches run as their own tasks and come back
+                        // through `ui_rx`, so a slow server never stalls input
+                        // or redraws.
+                        AppCommand::RefreshActors => {
+                            let client = client.clone();
+                            let tx = ui_tx.clone();
+                            tokio::spawn(async move {
+                                match client.list_actors().await {
+                                    Ok(actors) => {
+                                        let _ = tx.send(UiEvent::Actors(actors)).await;
+                                    }
+                                    Err(error) => tracing::warn!(error = %error, "list_actors failed"),
+                                }
+                            });
+                        }
+                        AppCommand::RefreshTodos => {
+                            let client = client.clone();
+                            let tx = ui_tx.clone();
+                            tokio::spawn(async move {
+                                match client.list_todos(false).await {
+                                    Ok(todos) => {
+                                        let _ = tx.send(UiEvent::Todos(todos)).await;
+                                    }
+                                    Err(error) => tracing::warn!(error = %error, "list_todos failed"),
+                                }
+                            });
+                        }
                         AppCommand::SwitchModel(name) => {
                             // Reconfigures the live session only; persisting to
                             // `.env` is a separate `lethe model <id>`.
@@ -242,9 +265,9 @@ async fn drive(
                 let _ = cmd_tx.try_send(AppCommand::RefreshActors);
                 let _ = cmd_tx.try_send(AppCommand::RefreshTodos);
             }
-            // Animation tick. 100ms while thinking (smooth spinner),
-            // 1s otherwise (keeps timestamps fresh without waking too
-            // often).
+            // Animation tick. 100ms while thinking (smooth spinner);
+            // otherwise only a slow fallback — every idle redraw is already
+            // driven by a key, UI event or command above.
             _ = tokio::time::sleep(tick_interval(&app)) => {
                 app.tick = app.tick.wrapping_add(1);
             }
@@ -257,6 +280,23 @@ async fn drive(
     Ok(())
 }
 
+fn absorb_ui_event(
+    event: UiEvent,
+    app: &mut AppState,
+    cmd_tx: &mpsc::Sender<AppCommand>,
+    pending_actor_refresh: &mut Option<tokio::time::Instant>,
+) {
+    if let UiEvent::ActorEvent { .. } = &event {
+        *pending_actor_refresh = Some(tokio::time::Instant::now() + ACTOR_REFRESH_DEBOUNCE);
+    }
+    if let UiEvent::ToolEnd { name, .. } = &event
+        && name.starts_with("todo")
+    {
+        let _ = cmd_tx.try_send(AppCommand::RefreshTodos);
+    }
+    app.apply_event(event);
+}
+
 async fn sleep_until(when: Option<tokio::time::Instant>) {
     match when {
         Some(when) => tokio::time::sleep_until(when).await,
@@ -268,7 +308,7 @@ fn tick_interval(app: &AppState) -> Duration {
     if app.status == crate::tui::state::Status::Thinking {
         Duration::from_millis(100)
     } else {
-        Duration::from_secs(1)
+        IDLE_REDRAW_FALLBACK
     }
 }
 
@@ -541,10 +581,7 @@ async fn handle_slash_command(
                 "scroll: PgUp/PgDn (10 lines) · Ctrl-Up/Down (2 lines) · Ctrl-Home/End (top/bottom) · mouse wheel",
             );
         }
-        SlashCommand::Clear => {
-            app.transcript.clear();
-            app.tool_index.clear();
-        }
+        SlashCommand::Clear => app.clear_transcript(),
         SlashCommand::Cancel => {
             let _ = cmd_tx.send(AppCommand::Cancel).await;
         }
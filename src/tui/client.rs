@@ -168,12 +168,7 @@ impl LetheClient {
         let url = format!("{}/actors", self.base_url);
         let response = self.auth(self.http.get(url)).send().await?;
         let response = response.error_for_status()?;
-        let payload: Value = response.json().await?;
-        Ok(payload
-            .get("actors")
-            .and_then(Value::as_array)
-            .cloned()
-            .unwrap_or_default())
+        Ok(take_array(response.json().await?, "actors"))
     }
 
     pub async fn list_todos(&self, include_completed: bool) -> Result<Vec<Value>> {
@@ -184,12 +179,7 @@ impl LetheClient {
             .send()
             .await?;
         let response = response.error_for_status()?;
-        let payload: Value = response.json().await?;
-        Ok(payload
-            .get("todos")
-            .and_then(Value::as_array)
-            .cloned()
-            .unwrap_or_default())
+        Ok(take_array(response.json().await?, "todos"))
     }
 
     pub async fn session_history(&self, limit: usize) -> Result<Vec<Value>> {
@@ -200,12 +190,7 @@ impl LetheClient {
             .send()
             .await?;
         let response = response.error_for_status()?;
-        let payload: Value = response.json().await?;
-        Ok(payload
-            .get("messages")
-            .and_then(Value::as_array)
-            .cloned()
-            .unwrap_or_default())
+        Ok(take_array(response.json().await?, "messages"))
     }
 
     /// POST `/chat` and forward the SSE stream into `tx` as `UiEvent`s. The
@@ -296,6 +281,15 @@ impl LetheClient {
     }
 }
 
+/// Move the array under `key` out of a response body. The sidebar polls
+/// these on every refresh, so the rows are taken, not deep-cloned.
+fn take_array(mut payload: Value, key: &str) -> Vec<Value> {
+    match payload.get_mut(key).map(Value::take) {
+        Some(Value::Array(items)) => items,
+        _ => Vec::new(),
+    }
+}
+
 /// SSE event names match the strings emitted by `interfaces::api`. Anything
 /// unknown surfaces as `UiEvent::Unknown` so we can debug new event types
 /// without crashing.
@@ -41,6 +41,9 @@ pub enum UiEvent {
     Reaction {
         emoji: String,
     },
+    /// Sidebar snapshots fetched off the UI loop (`GET /actors`, `/todos`).
+    Actors(Vec<Value>),
+    Todos(Vec<Value>),
     /// Catch-all so unknown SSE event names are still visible in logs without
     /// crashing the parser.
     Unknown {
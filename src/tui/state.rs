@@ -1,7 +1,7 @@
 //! App state mutated by `UiEvent`s and read by the renderer. Plain data —
 //! no I/O, no rendering — so tests can drive it directly.
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::time::Instant;
 
 use chrono::{DateTime, Utc};
@@ -41,6 +41,9 @@ pub struct ActorRow {
     pub spawned_by: String,
     pub outcome: Option<String>,
     pub goals: String,
+    /// Drawn indented under a parent. Set by `replace_actors`, which also
+    /// puts `AppState::actors` in sidebar order.
+    pub nested: bool,
 }
 
 #[derive(Clone, Debug)]
@@ -98,6 +101,9 @@ pub struct AppState {
     /// (providers that send no deltas) push the text. Reset at each turn
     /// boundary.
     pub streamed_this_turn: bool,
+    /// Bumped whenever the transcript is replaced wholesale (`/clear`), so
+    /// the renderer knows to drop lines it cached for the old items.
+    pub transcript_generation: u64,
 }
 
 impl Default for AppState {
@@ -126,9 +132,30 @@ impl AppState {
             tick: 0,
             streaming_index: None,
             streamed_this_turn: false,
+            transcript_generation: 0,
         }
     }
 
+    pub fn clear_transcript(&mut self) {
+        self.transcript.clear();
+        self.tool_index.clear();
+        self.streaming_index = None;
+        self.transcript_generation += 1;
+    }
+
+    /// Whether `transcript[index]` can still change after being drawn: the
+    /// bubble receiving streamed deltas, or a tool card awaiting its result.
+    pub fn transcript_item_is_live(&self, index: usize) -> bool {
+        self.streaming_index == Some(index)
+            || matches!(
+                self.transcript.get(index),
+                Some(TranscriptItem::Tool(ToolCall {
+                    status: ToolStatus::Running,
+                    ..
+                }))
+            )
+    }
+
     pub fn push_user(&mut self, content: String) {
         self.transcript.push(TranscriptItem::User {
             content,
@@ -238,6 +265,8 @@ impl AppState {
             }
             UiEvent::Usage { prompt_tokens } => self.prompt_tokens = Some(prompt_tokens),
             UiEvent::Reaction { .. } => {}
+            UiEvent::Actors(actors) => self.replace_actors(actors),
+            UiEvent::Todos(todos) => self.replace_todos(todos),
             UiEvent::Unknown { event, .. } => {
                 tracing::debug!(event = %event, "unknown SSE event");
             }
@@ -343,11 +372,48 @@ impl AppState {
     }
 
     pub fn replace_actors(&mut self, actors: Vec<Value>) {
-        self.actors = actors.into_iter().filter_map(actor_from_json).collect();
-        self.actors.sort_by(|left, right| {
+        let mut rows = actors
+            .into_iter()
+            .filter_map(actor_from_json)
+            .collect::<Vec<_>>();
+        rows.sort_by(|left, right| {
             let parent = left.spawned_by.is_empty().cmp(&right.spawned_by.is_empty());
             parent.reverse().then_with(|| left.name.cmp(&right.name))
         });
+        // Lay the rows out in sidebar order once per refresh — each root
+        // followed by its children, then rows whose parent isn't a root — so
+        // the renderer just walks the list every frame.
+        let root_ids = rows
+            .iter()
+            .filter(|row| row.spawned_by.is_empty())
+            .map(|row| row.id.clone())
+            .collect::<HashSet<_>>();
+        let mut roots = Vec::new();
+        let mut children: HashMap<String, Vec<ActorRow>> = HashMap::new();
+        let mut orphans = Vec::new();
+        let total = rows.len();
+        for mut row in rows {
+            if row.spawned_by.is_empty() {
+                roots.push(row);
+                continue;
+            }
+            row.nested = true;
+            if root_ids.contains(&row.spawned_by) {
+                children
+                    .entry(row.spawned_by.clone())
+                    .or_default()
+                    .push(row);
+            } else {
+                orphans.push(row);
+            }
+        }
+        self.actors = Vec::with_capacity(total);
+        for root in roots {
+            let kids = children.remove(&root.id).unwrap_or_default();
+            self.actors.push(root);
+            self.actors.extend(kids);
+        }
+        self.actors.extend(orphans);
     }
 
     pub fn replace_todos(&mut self, todos: Vec<Value>) {
@@ -403,6 +469,7 @@ fn actor_from_json(value: Value) -> Option<ActorRow> {
             .and_then(Value::as_str)
             .unwrap_or_default()
             .to_string(),
+        nested: false,
     })
 }
 
@@ -615,4 +682,62 @@ mod tests {
         ]);
         assert_eq!(assistant_texts(&state), vec!["Hello there"]);
     }
+
+    #[test]
+    fn only_streaming_bubbles_and_running_tools_are_live() {
+        let mut state = run(vec![
+            UiEvent::TurnStart,
+            UiEvent::AssistantDelta("Looking".to_string()),
+            UiEvent::ToolStart {
+                call_id: "c1".to_string(),
+                name: "bash".to_string(),
+                args_preview: "ls".to_string(),
+            },
+            UiEvent::AssistantDelta("Still".to_string()),
+        ]);
+        assert!(!state.transcript_item_is_live(0));
+        assert!(state.transcript_item_is_live(1));
+        assert!(state.transcript_item_is_live(2));
+
+        state.apply_event(UiEvent::ToolEnd {
+            call_id: "c1".to_string(),
+            name: "bash".to_string(),
+            success: true,
+            output_preview: String::new(),
+            duration_ms: 5,
+        });
+        assert!(!state.transcript_item_is_live(1));
+
+        state.clear_transcript();
+        assert!(state.transcript.is_empty());
+        assert_eq!(state.transcript_generation, 1);
+        assert!(!state.transcript_item_is_live(0));
+    }
+
+    #[test]
+    fn actors_are_laid_out_parents_first_with_children_nested() {
+        let actor = |id: &str, name: &str, parent: &str| serde_json::json!({ "id": id, "name": name, "spawned_by": parent });
+        let state = run(vec![UiEvent::Actors(vec![
+            actor("c2", "zeta", "p1"),
+            actor("o1", "stray", "gone"),
+            actor("p2", "beta", ""),
+            actor("c1", "alpha", "p1"),
+            actor("p1", "alpha", ""),
+        ])]);
+        let order = state
+            .actors
+            .iter()
+            .map(|row| (row.id.as_str(), row.nested))
+            .collect::<Vec<_>>();
+        assert_eq!(
+            order,
+            vec![
+                ("p1", false),
+                ("c1", true),
+                ("c2", true),
+                ("p2", false),
+                ("o1", true),
+            ]
+        );
+    }
 }
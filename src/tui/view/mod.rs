@@ -14,7 +14,12 @@ use tui_textarea::TextArea;
 
 use crate::tui::state::{AppState, Pane};
 
-pub fn draw(frame: &mut Frame<'_>, app: &mut AppState, editor: &TextArea<'_>) {
+pub fn draw(
+    frame: &mut Frame<'_>,
+    app: &mut AppState,
+    editor: &TextArea<'_>,
+    transcript_cache: &mut transcript::TranscriptCache,
+) {
     let size = frame.area();
     let outer = Layout::default()
         .direction(Direction::Vertical)
@@ -34,10 +39,10 @@ pub fn draw(frame: &mut Frame<'_>, app: &mut AppState, editor: &TextArea<'_>) {
             .direction(Direction::Horizontal)
             .constraints([Constraint::Min(40), Constraint::Length(38)])
             .split(main_area);
-        transcript::draw(frame, split[0], app);
+        transcript::draw(frame, split[0], app, transcript_cache);
         sidebar::draw(frame, split[1], app);
     } else {
-        transcript::draw(frame, main_area, app);
+        transcript::draw(frame, main_area, app, transcript_cache);
     }
 
     editor::draw(frame, editor_area, app, editor);
@@ -37,32 +37,10 @@ fn draw_actors(frame: &mut Frame<'_>, area: Rect, app: &AppState) {
             Style::default().fg(Color::Gray),
         )));
     } else {
-        // Group parents first, then children under them.
-        let roots: Vec<&ActorRow> = app
-            .actors
-            .iter()
-            .filter(|actor| actor.spawned_by.is_empty())
-            .collect();
-        for root in &roots {
-            lines.push(actor_line(root, false));
-            for child in app
-                .actors
-                .iter()
-                .filter(|actor| actor.spawned_by == root.id)
-            {
-                lines.push(actor_line(child, true));
-            }
-        }
-        let orphans: Vec<&ActorRow> = app
-            .actors
-            .iter()
-            .filter(|actor| {
-                !actor.spawned_by.is_empty()
-                    && !roots.iter().any(|root| root.id == actor.spawned_by)
-            })
-            .collect();
-        for orphan in orphans {
-            lines.push(actor_line(orphan, true));
+        // `replace_actors` already ordered the rows parents-first with
+        // children under them; just walk the list.
+        for actor in &app.actors {
+            lines.push(actor_line(actor, actor.nested));
         }
     }
     let paragraph = Paragraph::new(Text::from(lines)).wrap(Wrap { trim: false });
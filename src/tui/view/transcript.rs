@@ -12,7 +12,41 @@ use crate::tui::markdown;
 use crate::tui::state::{AppState, Pane, Status, ToolCall, ToolStatus, TranscriptItem};
 use crate::tui::view::{focus_border, inner_area};
 
-pub fn draw(frame: &mut Frame<'_>, area: Rect, app: &mut AppState) {
+/// Rendered lines for the settled head of the transcript. Markdown
+/// rendering is the expensive part of a frame, and everything before the
+/// first live item (streaming bubble, running tool) never changes, so it is
+/// rendered once and only the live tail is redone per frame. Frames borrow
+/// the cached lines rather than cloning their text.
+#[derive(Default)]
+pub struct TranscriptCache {
+    width: u16,
+    generation: u64,
+    items: usize,
+    lines: Vec<Line<'static>>,
+}
+
+impl TranscriptCache {
+    /// Bring the cache up to date: render any newly settled items, or start
+    /// over when the width or transcript generation changed.
+    fn refresh(&mut self, app: &AppState, width: u16) {
+        if self.width != width
+            || self.generation != app.transcript_generation
+            || self.items > app.transcript.len()
+        {
+            *self = Self {
+                width,
+                generation: app.transcript_generation,
+                ..Self::default()
+            };
+        }
+        while self.items < app.transcript.len() && !app.transcript_item_is_live(self.items) {
+            render_item(&app.transcript[self.items], width, &mut self.lines);
+            self.items += 1;
+        }
+    }
+}
+
+pub fn draw(frame: &mut Frame<'_>, area: Rect, app: &mut AppState, cache: &mut TranscriptCache) {
     let block = focus_border(app, Pane::Transcript).title(Span::styled(
         " transcript ",
         Style::default()
@@ -22,13 +56,20 @@ pub fn draw(frame: &mut Frame<'_>, area: Rect, app: &mut AppState) {
     let inner = inner_area(area);
     frame.render_widget(block, area);
 
-    let mut lines: Vec<Line<'static>> = Vec::new();
-    for item in &app.transcript {
-        render_item(item, inner.width, &mut lines);
+    cache.refresh(app, inner.width);
+    let mut live = Vec::new();
+    for item in &app.transcript[cache.items..] {
+        render_item(item, inner.width, &mut live);
     }
     if app.status == Status::Thinking {
-        lines.push(thinking_line(app.tick));
+        live.push(thinking_line(app.tick));
     }
+    let lines = cache
+        .lines
+        .iter()
+        .map(borrow_line)
+        .chain(live)
+        .collect::<Vec<_>>();
 
     let paragraph = Paragraph::new(Text::from(lines)).wrap(Wrap { trim: false });
     // Wrapped line count, not raw `lines.len()` — a 200-char paragraph
@@ -46,6 +87,19 @@ pub fn draw(frame: &mut Frame<'_>, area: Rect, app: &mut AppState) {
     frame.render_widget(paragraph.scroll((scroll, 0)), inner);
 }
 
+/// A view of a cached line whose spans borrow its text instead of copying it.
+fn borrow_line(line: &Line<'static>) -> Line<'_> {
+    Line {
+        style: line.style,
+        alignment: line.alignment,
+        spans: line
+            .spans
+            .iter()
+            .map(|span| Span::styled(span.content.as_ref(), span.style))
+            .collect(),
+    }
+}
+
 fn thinking_line(tick: u64) -> Line<'static> {
     const FRAMES: &[char] = &['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'];
     let frame = FRAMES[(tick as usize) % FRAMES.len()];